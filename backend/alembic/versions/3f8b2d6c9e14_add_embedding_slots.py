@@ -0,0 +1,60 @@
+"""Add content hashes and blue/green embedding slots
+
+Revision ID: 3f8b2d6c9e14
+Revises: 7c2e9a41d5f3
+Create Date: 2026-10-16 15:40:12.731904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b2d6c9e14'
+down_revision: Union[str, None] = '7c2e9a41d5f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('pericopes', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('pericopes', sa.Column('embedding_model', sa.String(length=100), nullable=True))
+    op.add_column('pericopes', sa.Column('embedding_hash', sa.String(length=64), nullable=True))
+    op.add_column('pericopes', sa.Column('embedding_alt', Vector(1024), nullable=True))
+    op.add_column('pericopes', sa.Column('embedding_alt_model', sa.String(length=100), nullable=True))
+    op.add_column('pericopes', sa.Column('embedding_alt_hash', sa.String(length=64), nullable=True))
+    # Shadow slot gets its own HNSW index so it can be queried as soon as it is active
+    op.execute('''
+        CREATE INDEX idx_pericopes_embedding_alt ON pericopes
+        USING hnsw (embedding_alt vector_cosine_ops)
+    ''')
+
+    slots = op.create_table('embedding_slots',
+    sa.Column('name', sa.String(length=20), nullable=False),
+    sa.Column('model_name', sa.String(length=100), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('recall', sa.Float(), nullable=True),
+    sa.Column('built_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # Existing vectors stay in the primary slot, which remains active
+    op.bulk_insert(slots, [
+        {'name': 'embedding', 'model_name': None, 'is_active': True},
+        {'name': 'embedding_alt', 'model_name': None, 'is_active': False},
+    ])
+
+
+def downgrade() -> None:
+    op.drop_table('embedding_slots')
+    op.execute('DROP INDEX IF EXISTS idx_pericopes_embedding_alt')
+    op.drop_column('pericopes', 'embedding_alt_hash')
+    op.drop_column('pericopes', 'embedding_alt_model')
+    op.drop_column('pericopes', 'embedding_alt')
+    op.drop_column('pericopes', 'embedding_hash')
+    op.drop_column('pericopes', 'embedding_model')
+    op.drop_column('pericopes', 'content_hash')
@@ -0,0 +1,39 @@
+"""Add trigram index on verse text
+
+Revision ID: 7c2e9a41d5f3
+Revises: 1638a3952bd5
+Create Date: 2026-10-16 10:12:37.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9a41d5f3'
+down_revision: Union[str, None] = '1638a3952bd5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm lets ILIKE '%q%' on verse text use a GIN index instead of a seq scan
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_verses_text_trgm',
+        'verses',
+        ['text'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'idx_verses_text_trgm',
+        table_name='verses',
+        postgresql_using='gin',
+        postgresql_ops={'text': 'gin_trgm_ops'},
+    )
@@ -0,0 +1,39 @@
+"""Add llm_jobs table for resumable LLM batch jobs
+
+Revision ID: a51d7e0c2b98
+Revises: 3f8b2d6c9e14
+Create Date: 2026-10-16 17:05:48.203517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a51d7e0c2b98'
+down_revision: Union[str, None] = '3f8b2d6c9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('llm_jobs',
+    sa.Column('job', sa.String(length=50), nullable=False),
+    sa.Column('item_key', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=10), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('result', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.CheckConstraint("status IN ('pending', 'done', 'failed')", name='check_llm_job_status'),
+    sa.PrimaryKeyConstraint('job', 'item_key')
+    )
+    op.create_index('idx_llm_jobs_job_status', 'llm_jobs', ['job', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_llm_jobs_job_status', table_name='llm_jobs')
+    op.drop_table('llm_jobs')
@@ -0,0 +1,77 @@
+"""Add graph_tombstones table and deletion triggers for incremental graph sync
+
+Revision ID: c84f1e6b3a27
+Revises: a51d7e0c2b98
+Create Date: 2026-10-16 21:40:12.582304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c84f1e6b3a27'
+down_revision: Union[str, None] = 'a51d7e0c2b98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'books',
+    'chapters',
+    'pericopes',
+    'verses',
+    'entities',
+    'topics',
+    'verse_entities',
+    'verse_topics',
+)
+
+
+def upgrade() -> None:
+    op.create_table('graph_tombstones',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('table_name', sa.String(length=30), nullable=False),
+    sa.Column('row_id', sa.Integer(), nullable=False),
+    sa.Column('ref_id', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('clock_timestamp()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_graph_tombstones_table', 'graph_tombstones', ['table_name'], unique=False)
+
+    # Statement-level triggers read the deleted rows from a transition table,
+    # so bulk deletes cost one INSERT ... SELECT per statement
+    op.execute("""
+        CREATE FUNCTION record_graph_tombstones() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'verse_entities' THEN
+                INSERT INTO graph_tombstones (table_name, row_id, ref_id)
+                SELECT TG_TABLE_NAME, verse_id, entity_id FROM deleted_rows;
+            ELSIF TG_TABLE_NAME = 'verse_topics' THEN
+                INSERT INTO graph_tombstones (table_name, row_id, ref_id)
+                SELECT TG_TABLE_NAME, verse_id, topic_id FROM deleted_rows;
+            ELSE
+                INSERT INTO graph_tombstones (table_name, row_id)
+                SELECT TG_TABLE_NAME, id FROM deleted_rows;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_graph_tombstones
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS deleted_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION record_graph_tombstones()
+        """)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_graph_tombstones ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_graph_tombstones()")
+    op.drop_index('idx_graph_tombstones_table', table_name='graph_tombstones')
+    op.drop_table('graph_tombstones')
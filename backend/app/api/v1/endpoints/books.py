@@ -1,7 +1,11 @@
-"""Books endpoint."""
+"""Books endpoint.
+
+Reads are served from the memory-mapped corpus store when it is loaded and
+fall back to PostgreSQL otherwise.
+"""
 
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import distinct, func, select
+from sqlalchemy import distinct, func, select, tuple_
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import DbSession
@@ -17,6 +21,8 @@ from app.models.schemas import (
     PericopeBase,
     VerseBase,
 )
+from app.services.corpus_store import get_corpus_counts, get_corpus_store
+from app.utils.pagination import decode_cursor, split_page
 
 router = APIRouter()
 
@@ -24,6 +30,14 @@ router = APIRouter()
 @router.get("", response_model=BookList)
 async def list_books(db: DbSession):
     """Get all Bible books."""
+    store = await get_corpus_store(db)
+    if store is not None:
+        books = store.books()
+        return BookList(
+            books=[BookBase.model_validate(book) for book in books],
+            total=len(books),
+        )
+
     result = await db.execute(select(Book).order_by(Book.order_index))
     books = result.scalars().all()
     return BookList(
@@ -35,6 +49,23 @@ async def list_books(db: DbSession):
 @router.get("/{book_id}", response_model=BookDetail)
 async def get_book(book_id: int, db: DbSession):
     """Get a specific book by ID with statistics."""
+    store = await get_corpus_store(db)
+    if store is not None:
+        book = store.book(book_id)
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
+        chapter_count, verse_count, pericope_count = store.book_stats(book_id)
+        return BookDetail(
+            id=book.id,
+            name_zh=book.name_zh,
+            abbrev_zh=book.abbrev_zh,
+            testament=book.testament,
+            order_index=book.order_index,
+            chapter_count=chapter_count,
+            verse_count=verse_count,
+            pericope_count=pericope_count,
+        )
+
     result = await db.execute(select(Book).where(Book.id == book_id))
     book = result.scalar_one_or_none()
     if not book:
@@ -73,6 +104,22 @@ async def get_book(book_id: int, db: DbSession):
 @router.get("/{book_id}/chapters", response_model=BookChapters)
 async def get_book_chapters(book_id: int, db: DbSession):
     """Get all chapters in a book with verse counts."""
+    store = await get_corpus_store(db)
+    if store is not None:
+        book = store.book(book_id)
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
+        chapters = [
+            ChapterInfo(chapter=chapter, verse_count=verse_count)
+            for chapter, verse_count in store.book_chapters(book_id)
+        ]
+        return BookChapters(
+            book_id=book.id,
+            book_name=book.name_zh,
+            chapters=chapters,
+            total=len(chapters),
+        )
+
     # Check if book exists
     book_result = await db.execute(select(Book).where(Book.id == book_id))
     book = book_result.scalar_one_or_none()
@@ -104,19 +151,26 @@ async def get_book_chapters(book_id: int, db: DbSession):
 @router.get("/{book_id}/pericopes", response_model=BookPericopes)
 async def get_book_pericopes(book_id: int, db: DbSession):
     """Get all pericopes in a book."""
-    # Check if book exists
-    book_result = await db.execute(select(Book).where(Book.id == book_id))
-    book = book_result.scalar_one_or_none()
-    if not book:
-        raise HTTPException(status_code=404, detail="Book not found")
+    store = await get_corpus_store(db)
+    if store is not None:
+        book = store.book(book_id)
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
+        pericopes = store.book_pericopes(book_id)
+    else:
+        # Check if book exists
+        book_result = await db.execute(select(Book).where(Book.id == book_id))
+        book = book_result.scalar_one_or_none()
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
 
-    # Get pericopes
-    result = await db.execute(
-        select(Pericope)
-        .where(Pericope.book_id == book_id)
-        .order_by(Pericope.chapter_start, Pericope.verse_start)
-    )
-    pericopes = result.scalars().all()
+        # Get pericopes
+        result = await db.execute(
+            select(Pericope)
+            .where(Pericope.book_id == book_id)
+            .order_by(Pericope.chapter_start, Pericope.verse_start)
+        )
+        pericopes = result.scalars().all()
 
     pericope_list = [
         PericopeBase(
@@ -146,22 +200,56 @@ async def get_book_verses(
     book_id: int,
     db: DbSession,
     chapter: int | None = Query(None, ge=1, description="Filter by chapter"),
+    limit: int | None = Query(None, ge=1, le=1000, description="Maximum verses to return"),
+    cursor: str | None = Query(None, description="Cursor from a previous next_cursor"),
 ):
-    """Get all verses in a book, optionally filtered by chapter."""
-    # Check if book exists
-    book_result = await db.execute(select(Book).where(Book.id == book_id))
-    book = book_result.scalar_one_or_none()
-    if not book:
-        raise HTTPException(status_code=404, detail="Book not found")
+    """Get verses in a book, optionally filtered by chapter.
+
+    Returns every matching verse unless limit is set; next_cursor then
+    continues from the last (chapter, verse) returned. total is the full
+    match count either way.
+    """
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, 2)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    fetch = limit + 1 if limit is not None else None
+
+    store = await get_corpus_store(db)
+    if store is not None:
+        book = store.book(book_id)
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
+        try:
+            verses, total = store.verses_page(
+                book_id, chapter, limit=fetch, after=(book_id, *after) if after else None
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    else:
+        # Check if book exists
+        book_result = await db.execute(select(Book).where(Book.id == book_id))
+        book = book_result.scalar_one_or_none()
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
+
+        # Build query
+        query = select(Verse).where(Verse.book_id == book_id)
+        if chapter is not None:
+            query = query.where(Verse.chapter == chapter)
+        if after is not None:
+            query = query.where(tuple_(Verse.chapter, Verse.verse) > after)
+        query = query.order_by(Verse.chapter, Verse.verse).limit(fetch)
 
-    # Build query
-    query = select(Verse).where(Verse.book_id == book_id)
-    if chapter is not None:
-        query = query.where(Verse.chapter == chapter)
-    query = query.order_by(Verse.chapter, Verse.verse)
+        result = await db.execute(query)
+        verses = list(result.scalars().all())
+        total = (await get_corpus_counts(db)).verses(book_id, chapter)
 
-    result = await db.execute(query)
-    verses = result.scalars().all()
+    next_cursor = None
+    if limit is not None:
+        verses, next_cursor = split_page(verses, limit, lambda v: (v.chapter, v.verse))
 
     verse_list = [
         VerseBase(
@@ -181,5 +269,6 @@ async def get_book_verses(
         book_name=book.name_zh,
         chapter=chapter,
         verses=verse_list,
-        total=len(verse_list),
+        total=total,
+        next_cursor=next_cursor,
     )
@@ -1,9 +1,11 @@
-"""Pericopes endpoint."""
+"""Pericopes endpoint.
 
-import math
+Reads are served from the memory-mapped corpus store when it is loaded and
+fall back to PostgreSQL otherwise.
+"""
 
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import func, select
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import DbSession
@@ -14,6 +16,13 @@ from app.models.schemas import (
     PericopeList,
     VerseBase,
 )
+from app.services.corpus_store import (
+    CorpusStore,
+    StoredPericope,
+    get_corpus_counts,
+    get_corpus_store,
+)
+from app.utils.pagination import decode_cursor, split_page, total_pages
 
 router = APIRouter()
 
@@ -22,29 +31,59 @@ router = APIRouter()
 async def list_pericopes(
     db: DbSession,
     book_id: int | None = Query(None, description="Filter by book ID"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is set)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="Cursor from a previous next_cursor"),
 ):
-    """List pericopes with pagination."""
+    """List pericopes with pagination.
+
+    Totals come from precomputed per-book counts rather than COUNT(*).
+    Following next_cursor seeks on (book_id, chapter_start, verse_start, id),
+    so deep pages cost the same as the first.
+    """
     offset = (page - 1) * page_size
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, 4)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    store = await get_corpus_store(db)
+    if store is not None:
+        try:
+            pericopes, total = store.pericopes_page(
+                book_id, offset, page_size + 1, after[3] if after else None
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        pericopes, next_cursor = split_page(pericopes, page_size, _pericope_key)
+        return PericopeList(
+            pericopes=[_stored_pericope_base(store, p) for p in pericopes],
+            page=page,
+            page_size=page_size,
+            total=total,
+            total_pages=total_pages(total, page_size),
+            next_cursor=next_cursor,
+        )
 
     # Build query
     base_query = select(Pericope).options(selectinload(Pericope.book))
     if book_id is not None:
         base_query = base_query.where(Pericope.book_id == book_id)
 
-    # Count total
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    sort_key = (Pericope.book_id, Pericope.chapter_start, Pericope.verse_start, Pericope.id)
+    if after is not None:
+        base_query = base_query.where(tuple_(*sort_key) > after)
+    else:
+        base_query = base_query.offset(offset)
 
-    # Get paginated results
-    result = await db.execute(
-        base_query.order_by(Pericope.book_id, Pericope.chapter_start, Pericope.verse_start)
-        .offset(offset)
-        .limit(page_size)
+    # One page plus one row to detect whether another page exists
+    result = await db.execute(base_query.order_by(*sort_key).limit(page_size + 1))
+    pericopes, next_cursor = split_page(
+        list(result.scalars().all()), page_size, _pericope_key
     )
-    pericopes = result.scalars().all()
+    total = (await get_corpus_counts(db)).pericopes(book_id)
 
     pericope_list = [
         PericopeBase(
@@ -66,13 +105,18 @@ async def list_pericopes(
         page=page,
         page_size=page_size,
         total=total,
-        total_pages=math.ceil(total / page_size) if total > 0 else 0,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{pericope_id}", response_model=PericopeDetail)
 async def get_pericope(pericope_id: int, db: DbSession):
     """Get a pericope with its verses."""
+    store = await get_corpus_store(db)
+    if store is not None:
+        return _stored_pericope_detail(store, pericope_id)
+
     result = await db.execute(
         select(Pericope)
         .where(Pericope.id == pericope_id)
@@ -111,3 +155,52 @@ async def get_pericope(pericope_id: int, db: DbSession):
         summary=pericope.summary,
         verses=verses,
     )
+
+
+def _pericope_key(pericope: Pericope | StoredPericope) -> tuple[int, int, int, int]:
+    """Sort key encoded into list_pericopes cursors."""
+    return (pericope.book_id, pericope.chapter_start, pericope.verse_start, pericope.id)
+
+
+def _stored_pericope_base(store: CorpusStore, pericope: StoredPericope) -> PericopeBase:
+    """Build a PericopeBase from a corpus store row."""
+    book = store.book(pericope.book_id)
+    book_name = book.name_zh if book else ""
+    return PericopeBase(
+        id=pericope.id,
+        book_id=pericope.book_id,
+        book_name=book_name,
+        title=pericope.title,
+        reference=f"{book_name} {pericope.reference}" if book else "",
+        chapter_start=pericope.chapter_start,
+        verse_start=pericope.verse_start,
+        chapter_end=pericope.chapter_end,
+        verse_end=pericope.verse_end,
+    )
+
+
+def _stored_pericope_detail(store: CorpusStore, pericope_id: int) -> PericopeDetail:
+    """Build a PericopeDetail from the corpus store."""
+    pericope = store.pericope(pericope_id)
+    if not pericope:
+        raise HTTPException(status_code=404, detail="Pericope not found")
+
+    base = _stored_pericope_base(store, pericope)
+    verses = [
+        VerseBase(
+            id=v.id,
+            book_id=v.book_id,
+            book_name=base.book_name,
+            chapter=v.chapter,
+            verse=v.verse,
+            text=v.text,
+            reference=f"{base.book_name} {v.chapter}:{v.verse}",
+        )
+        for v in store.pericope_verses(pericope_id)
+    ]
+
+    return PericopeDetail(
+        **base.model_dump(),
+        summary=pericope.summary,
+        verses=verses,
+    )
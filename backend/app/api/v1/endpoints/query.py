@@ -1,20 +1,33 @@
 """Query endpoint for RAG pipeline."""
 
-from fastapi import APIRouter, HTTPException
+import json
+import logging
+from collections.abc import AsyncIterator
 
-from app.api.deps import DbSession
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.database import async_session_maker
 from app.models.schemas import QueryRequest, QueryResponse
 from app.services.embedding_service import get_embedding_service
 from app.services.llm_client import get_llm_client
-from app.services.rag_pipeline import RAGPipeline
+from app.services.rag_pipeline import RAGPipeline, StreamEvent
+from app.services.single_flight import flight_key, get_query_flight
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _format_sse(event: StreamEvent) -> str:
+    """Serialize a pipeline event in server-sent events wire format."""
+    payload = json.dumps(event.data, ensure_ascii=False)
+    return f"event: {event.event}\ndata: {payload}\n\n"
+
+
 @router.post("", response_model=QueryResponse)
 async def execute_query(
     request: QueryRequest,
-    db: DbSession,
 ) -> QueryResponse:
     """Execute RAG query and return answer with sources.
 
@@ -23,27 +36,41 @@ async def execute_query(
     2. Retrieves relevant pericopes using dense and sparse search
     3. Fuses results using RRF (Reciprocal Rank Fusion)
     4. Generates an answer using the LLM
+
+    Concurrent requests with the same normalized query, mode and options
+    share a single pipeline run.
     """
+    mode = request.mode.value
+    options = {
+        "max_results": request.options.max_results,
+        "include_graph": request.options.include_graph,
+        "debug": request.options.debug,
+    }
+
+    async def run_pipeline() -> QueryResponse:
+        # The shared run outlives any single request, so it gets its own
+        # session instead of the caller's request-scoped one.
+        async with async_session_maker() as session:
+            pipeline = RAGPipeline(
+                db=session,
+                embed_service=await get_embedding_service(),
+                llm_client=await get_llm_client(),
+            )
+            return await pipeline.execute(
+                query=request.query,
+                mode=mode,
+                options=options,
+            )
+
     try:
-        # Get services
-        embed_service = await get_embedding_service()
-        llm_client = await get_llm_client()
-
-        # Create and execute pipeline
-        pipeline = RAGPipeline(
-            db=db,
-            embed_service=embed_service,
-            llm_client=llm_client,
+        result, shared = await get_query_flight().do(
+            flight_key(request.query, mode, options),
+            run_pipeline,
         )
 
-        result = await pipeline.execute(
-            query=request.query,
-            mode=request.mode.value,
-            options={
-                "max_results": request.options.max_results,
-                "include_graph": request.options.include_graph,
-            },
-        )
+        if shared:
+            result = result.model_copy(deep=True)
+            result.meta.coalesced = True
 
         return result
 
@@ -52,3 +79,68 @@ async def execute_query(
             status_code=500,
             detail=f"Query execution failed: {str(e)}",
         )
+
+
+@router.post("/stream")
+async def execute_query_stream(
+    request: QueryRequest,
+    http_request: Request,
+) -> StreamingResponse:
+    """Execute RAG query and stream the result as server-sent events.
+
+    Events, in order:
+    1. `segments`: fused pericope segments (and graph context), sent as soon
+       as retrieval and RRF fusion finish
+    2. `token`: one event per generated answer chunk
+    3. `meta`: QueryMeta for the completed request
+    4. `done`: end of stream (or `error` if the pipeline failed)
+
+    Generation is cancelled when the client disconnects.
+    """
+    embed_service = await get_embedding_service()
+    llm_client = await get_llm_client()
+
+    async def event_stream() -> AsyncIterator[str]:
+        # The body runs after the handler returns, when a request-scoped
+        # session may already be closed, so the stream opens its own.
+        async with async_session_maker() as session:
+            pipeline = RAGPipeline(
+                db=session,
+                embed_service=embed_service,
+                llm_client=llm_client,
+            )
+            events = pipeline.execute_stream(
+                query=request.query,
+                mode=request.mode.value,
+                options={
+                    "max_results": request.options.max_results,
+                    "include_graph": request.options.include_graph,
+                    "debug": request.options.debug,
+                },
+            )
+            try:
+                async for event in events:
+                    # Retrieval can take a while; don't start generating for
+                    # a client that already went away.
+                    if event.event == "segments" and await http_request.is_disconnected():
+                        logger.info("Client disconnected before generation, aborting stream")
+                        return
+                    yield _format_sse(event)
+                yield _format_sse(StreamEvent(event="done", data={}))
+            except Exception as e:
+                logger.error(f"Streaming query failed: {e}")
+                yield _format_sse(
+                    StreamEvent(event="error", data={"detail": f"Query execution failed: {str(e)}"})
+                )
+            finally:
+                # Runs on normal completion, error and client disconnect alike
+                await events.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering for SSE
+        },
+    )
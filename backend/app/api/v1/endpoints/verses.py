@@ -1,19 +1,36 @@
-"""Verses endpoint."""
+"""Verses endpoint.
 
-import math
+Browsing and lookups are served from the memory-mapped corpus store when it
+is loaded; search and the fallback path use PostgreSQL.
+"""
 
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import func, select, text
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import DbSession
+from app.core.config import settings
 from app.models.orm import Book, Verse
 from app.models.schemas import (
+    BookFacet,
     VerseBase,
     VerseDetail,
     VerseList,
     VerseSearchResult,
 )
+from app.services.corpus_store import (
+    CorpusStore,
+    StoredVerse,
+    get_corpus_counts,
+    get_corpus_store,
+)
+from app.utils.pagination import (
+    capped_count,
+    decode_cursor,
+    escape_like,
+    split_page,
+    total_pages,
+)
 
 router = APIRouter()
 
@@ -23,51 +40,89 @@ async def search_verses(
     db: DbSession,
     q: str = Query(..., min_length=1, max_length=100, description="Search query"),
     book_id: int | None = Query(None, description="Filter by book ID"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is set)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="Cursor from a previous next_cursor"),
+    exact_total: bool = Query(
+        False, description="Count all matches exactly and return per-book facets"
+    ),
 ):
     """Search for verses containing the query text.
 
     Uses ILIKE for Chinese text search (PostgreSQL FTS 'simple' config
-    doesn't tokenize Chinese characters properly).
+    doesn't tokenize Chinese characters properly); the pg_trgm GIN index on
+    verse text serves the match for queries of three or more characters.
+    Pages are keyed on (book_id, chapter, verse), so following next_cursor
+    costs the same at any depth. The total is capped at SEARCH_COUNT_CAP
+    unless exact_total is set, in which case a single grouped scan returns
+    the exact total and per-book facet counts.
     """
-    offset = (page - 1) * page_size
-
-    # Build base query with ILIKE for Chinese text search
-    # FTS with 'simple' config doesn't work well with Chinese
-    base_query = (
-        select(Verse)
-        .options(selectinload(Verse.book))
-        .where(Verse.text.ilike(f"%{q}%"))
-    )
-
+    match = Verse.text.ilike(f"%{escape_like(q)}%", escape="\\")
+    filters = [match]
     if book_id is not None:
-        base_query = base_query.where(Verse.book_id == book_id)
+        filters.append(Verse.book_id == book_id)
 
-    # Count total matches
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # One page plus one row to detect whether another page exists
+    page_query = (
+        select(
+            Verse.id,
+            Verse.book_id,
+            Verse.chapter,
+            Verse.verse,
+            Verse.text,
+            Book.name_zh.label("book_name"),
+        )
+        .join(Book, Verse.book_id == Book.id)
+        .where(*filters)
+        .order_by(Verse.book_id, Verse.chapter, Verse.verse)
+        .limit(page_size + 1)
+    )
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, 3)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        page_query = page_query.where(tuple_(Verse.book_id, Verse.chapter, Verse.verse) > after)
+    else:
+        page_query = page_query.offset((page - 1) * page_size)
 
-    # Get paginated results
-    result = await db.execute(
-        base_query.order_by(Verse.book_id, Verse.chapter, Verse.verse)
-        .offset(offset)
-        .limit(page_size)
+    result = await db.execute(page_query)
+    rows, next_cursor = split_page(
+        result.all(), page_size, lambda row: (row.book_id, row.chapter, row.verse)
     )
-    verses = result.scalars().all()
+
+    facets = None
+    if exact_total:
+        # Per-book counts over all books; the total respects the book filter
+        facet_result = await db.execute(
+            select(Verse.book_id, Book.name_zh, func.count().label("count"))
+            .join(Book, Verse.book_id == Book.id)
+            .where(match)
+            .group_by(Verse.book_id, Book.name_zh, Book.order_index)
+            .order_by(Book.order_index)
+        )
+        facets = [
+            BookFacet(book_id=row.book_id, book_name=row.name_zh, count=row.count)
+            for row in facet_result.all()
+        ]
+        total = sum(f.count for f in facets if book_id is None or f.book_id == book_id)
+        total_is_exact = True
+    else:
+        total, total_is_exact = await capped_count(
+            db, select(Verse.id).where(*filters), settings.SEARCH_COUNT_CAP
+        )
 
     verse_list = [
         VerseBase(
-            id=v.id,
-            book_id=v.book_id,
-            book_name=v.book.name_zh if v.book else "",
-            chapter=v.chapter,
-            verse=v.verse,
-            text=v.text,
-            reference=f"{v.book.name_zh} {v.chapter}:{v.verse}" if v.book else "",
+            id=row.id,
+            book_id=row.book_id,
+            book_name=row.book_name,
+            chapter=row.chapter,
+            verse=row.verse,
+            text=row.text,
+            reference=f"{row.book_name} {row.chapter}:{row.verse}",
         )
-        for v in verses
+        for row in rows
     ]
 
     return VerseSearchResult(
@@ -76,7 +131,10 @@ async def search_verses(
         page=page,
         page_size=page_size,
         total=total,
-        total_pages=math.ceil(total / page_size) if total > 0 else 0,
+        total_pages=total_pages(total, page_size),
+        total_is_exact=total_is_exact,
+        next_cursor=next_cursor,
+        facets=facets,
     )
 
 
@@ -85,11 +143,41 @@ async def list_verses(
     db: DbSession,
     book_id: int | None = Query(None, description="Filter by book ID"),
     chapter: int | None = Query(None, ge=1, description="Filter by chapter"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is set)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="Cursor from a previous next_cursor"),
 ):
-    """List verses with pagination."""
+    """List verses with pagination.
+
+    Totals come from precomputed per-chapter counts rather than COUNT(*).
+    Following next_cursor seeks on (book_id, chapter, verse), so deep pages
+    cost the same as the first.
+    """
     offset = (page - 1) * page_size
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor, 3)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    store = await get_corpus_store(db)
+    if store is not None:
+        try:
+            verses, total = store.verses_page(book_id, chapter, offset, page_size + 1, after)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        verses, next_cursor = split_page(
+            verses, page_size, lambda v: (v.book_id, v.chapter, v.verse)
+        )
+        return VerseList(
+            verses=[_stored_verse_base(store, v) for v in verses],
+            page=page,
+            page_size=page_size,
+            total=total,
+            total_pages=total_pages(total, page_size),
+            next_cursor=next_cursor,
+        )
 
     # Build query
     base_query = select(Verse).options(selectinload(Verse.book))
@@ -98,18 +186,19 @@ async def list_verses(
     if chapter is not None:
         base_query = base_query.where(Verse.chapter == chapter)
 
-    # Count total
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    if after is not None:
+        base_query = base_query.where(tuple_(Verse.book_id, Verse.chapter, Verse.verse) > after)
+    else:
+        base_query = base_query.offset(offset)
 
-    # Get paginated results
+    # One page plus one row to detect whether another page exists
     result = await db.execute(
-        base_query.order_by(Verse.book_id, Verse.chapter, Verse.verse)
-        .offset(offset)
-        .limit(page_size)
+        base_query.order_by(Verse.book_id, Verse.chapter, Verse.verse).limit(page_size + 1)
     )
-    verses = result.scalars().all()
+    verses, next_cursor = split_page(
+        list(result.scalars().all()), page_size, lambda v: (v.book_id, v.chapter, v.verse)
+    )
+    total = (await get_corpus_counts(db)).verses(book_id, chapter)
 
     verse_list = [
         VerseBase(
@@ -129,13 +218,26 @@ async def list_verses(
         page=page,
         page_size=page_size,
         total=total,
-        total_pages=math.ceil(total / page_size) if total > 0 else 0,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{verse_id}", response_model=VerseDetail)
 async def get_verse(verse_id: int, db: DbSession):
     """Get a verse by ID."""
+    store = await get_corpus_store(db)
+    if store is not None:
+        verse = store.verse(verse_id)
+        if not verse:
+            raise HTTPException(status_code=404, detail="Verse not found")
+        pericope = store.pericope(verse.pericope_id) if verse.pericope_id else None
+        return VerseDetail(
+            **_stored_verse_base(store, verse).model_dump(),
+            pericope_id=pericope.id if pericope else None,
+            pericope_title=pericope.title if pericope else None,
+        )
+
     result = await db.execute(
         select(Verse)
         .where(Verse.id == verse_id)
@@ -157,3 +259,17 @@ async def get_verse(verse_id: int, db: DbSession):
         pericope_id=verse.pericope.id if verse.pericope else None,
         pericope_title=verse.pericope.title if verse.pericope else None,
     )
+
+
+def _stored_verse_base(store: CorpusStore, verse: StoredVerse) -> VerseBase:
+    """Build a VerseBase from a corpus store row."""
+    book = store.book(verse.book_id)
+    return VerseBase(
+        id=verse.id,
+        book_id=verse.book_id,
+        book_name=book.name_zh if book else "",
+        chapter=verse.chapter,
+        verse=verse.verse,
+        text=verse.text,
+        reference=f"{book.name_zh} {verse.chapter}:{verse.verse}" if book else "",
+    )
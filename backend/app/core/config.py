@@ -47,18 +47,83 @@ class Settings(BaseSettings):
     LLM_MODEL_NAME: str = "gemma3:4b"
     LLM_TEMPERATURE: float = 0.7
     LLM_MAX_TOKENS: int = 2048
+    # Offline enrichment scripts: concurrent requests (match OLLAMA_NUM_PARALLEL)
+    LLM_BATCH_CONCURRENCY: int = 4
+    LLM_BATCH_MAX_RETRIES: int = 3
+    # Prophecy link prefilter: score = (1 - w) * cosine + w * normalised votes;
+    # pairs >= ACCEPT or < REJECT skip the LLM
+    PROPHECY_PREFILTER_ACCEPT: float = 0.8
+    PROPHECY_PREFILTER_REJECT: float = 0.45
+    PROPHECY_VOTE_WEIGHT: float = 0.2
+    PROPHECY_VOTE_SATURATION: int = 50
 
     # Embeddings (bge-m3)
     EMBED_MODEL_NAME: str = "BAAI/bge-m3"
     EMBED_BATCH_SIZE: int = 32
     EMBED_USE_FP16: bool = True
     EMBED_DEVICE: str = "cuda"  # cuda or cpu
+    # Micro-batching of concurrent query encodes
+    EMBED_QUERY_MAX_BATCH_SIZE: int = 16
+    EMBED_QUERY_MAX_WAIT_MS: float = 5.0
 
     # RAG Parameters
     RRF_K: int = 60
     MAX_RETRIEVE_RESULTS: int = 20
     MAX_CONTEXT_TOKENS: int = 4000
     TOP_K_PERICOPES: int = 5
+    # Hydrated pericopes (book name + verse text) kept in memory
+    PERICOPE_CACHE_SIZE: int = 2000
+    # Memory-mapped corpus snapshot shared by all workers (books/pericopes/verses)
+    CORPUS_STORE_ENABLED: bool = True
+    CORPUS_SNAPSHOT_DIR: str = "data/corpus_snapshot"
+    # Seconds between corpus/vector version checks by the in-process dense/sparse indexes
+    CORPUS_VERSION_CHECK_SECONDS: float = 30.0
+
+    # Dense index backend: pgvector (HNSW in PostgreSQL) or numpy (in process)
+    DENSE_INDEX_BACKEND: str = "pgvector"
+    # numpy backend: none (exact float32), int8 or binary (with float re-rank)
+    DENSE_INDEX_QUANTIZATION: str = "none"
+    DENSE_INDEX_RERANK_FACTOR: int = 4
+    # Directory for the mmap'd embedding matrix (empty keeps it in memory only)
+    DENSE_INDEX_PATH: str = "data/dense_index"
+    # Seconds between checks of the active blue/green embedding slot
+    DENSE_SLOT_REFRESH_SECONDS: float = 30.0
+    # Minimum HNSW recall@k against exact search before a new slot goes live
+    DENSE_SLOT_MIN_RECALL: float = 0.95
+
+    # Sparse retrieval: fts (PostgreSQL tsvector) or bm25 (in-memory bigram BM25)
+    SPARSE_BACKEND: str = "fts"
+    BM25_K1: float = 1.2
+    BM25_B: float = 0.75
+
+    # Retriever deadlines (seconds); a retriever that misses its deadline is
+    # dropped from fusion and reported as timed out in QueryMeta
+    DENSE_RETRIEVER_TIMEOUT: float = 5.0
+    SPARSE_RETRIEVER_TIMEOUT: float = 3.0
+    GRAPH_RETRIEVER_TIMEOUT: float = 8.0
+
+    # Explicit references ("約3:16") are answered directly from the verses table
+    VERSE_LOOKUP_FAST_PATH: bool = True
+    VERSE_LOOKUP_MAX_VERSES: int = 200
+
+    # /verses/search stops counting matches here unless exact_total is requested
+    SEARCH_COUNT_CAP: int = 1000
+
+    # Embedding-centroid query classifier (built by scripts/build_query_classifier.py);
+    # falls back to the LLM when confidence is below the threshold
+    QUERY_CLASSIFIER_PATH: str = "data/query_classifier.npz"
+    QUERY_CLASSIFIER_THRESHOLD: float = 0.6
+    QUERY_CLASSIFIER_TEMPERATURE: float = 0.05
+
+    # Semantic answer cache (near-duplicate queries reuse earlier responses)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_TTL_SECONDS: float = 86400.0
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 2000
+    SEMANTIC_CACHE_MAX_MB: int = 64
+    SEMANTIC_CACHE_CORPUS_CHECK_SECONDS: float = 60.0
+    # Path prefix for persistence across restarts (empty to disable)
+    SEMANTIC_CACHE_PATH: str = ""
 
     # Security
     ADMIN_API_KEY: str = "change-me-in-production"
@@ -66,6 +131,8 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = "INFO"
+    # Append per-query stage traces as JSONL for offline analysis (empty to disable)
+    TRACE_EXPORT_PATH: str = ""
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,11 +1,14 @@
 """Database connection and session management."""
 
+import time
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_OVERFLOW, DB_POOL_SIZE, DB_POOL_WAIT
 
 
 class Base(DeclarativeBase):
@@ -14,15 +17,32 @@ class Base(DeclarativeBase):
     pass
 
 
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - start)
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
+    poolclass=InstrumentedAsyncPool,
     pool_pre_ping=True,
     pool_size=5,
     max_overflow=10,
 )
 
+# Pool occupancy is read at scrape time
+DB_POOL_SIZE.set_function(engine.pool.size)
+DB_POOL_CHECKED_OUT.set_function(engine.pool.checkedout)
+DB_POOL_OVERFLOW.set_function(lambda: max(0, engine.pool.overflow()))
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
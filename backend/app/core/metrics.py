@@ -0,0 +1,368 @@
+"""In-process Prometheus-style metrics.
+
+A minimal Counter/Gauge/Histogram registry rendered in the Prometheus text
+exposition format at ``/metrics``, so saturation can be scraped without an
+external client library. Metrics are per process; with several uvicorn
+workers each worker reports its own series.
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Starlette appends the charset for text/* media types
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Default latency buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelKey, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """Base class for a labelled metric family."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def _key(self, labels: dict[str, Any]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        """Render the family, including HELP and TYPE lines."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """Sample lines of the family, without HELP and TYPE."""
+
+
+class _ValueMetric(_Metric):
+    """Metric with one value per label set, stored or read from a callback."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelKey, float] = {}
+        self._functions: dict[LabelKey, Callable[[], float]] = {}
+
+    def set_function(self, fn: Callable[[], float], **labels: Any) -> None:
+        """Read the value from fn at scrape time."""
+        self._functions[self._key(labels)] = fn
+
+    def _samples(self) -> list[str]:
+        values = dict(self._values)
+        for key, fn in self._functions.items():
+            try:
+                values[key] = float(fn())
+            except Exception:
+                continue
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values.items()
+        ]
+
+
+class Counter(_ValueMetric):
+    """Monotonically increasing counter.
+
+    A callback set with ``set_function`` must itself be monotonic, e.g. a
+    counter kept by the component being measured.
+    """
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the counter."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_ValueMetric):
+    """Value that can go up and down, or be read from a callback at scrape time."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge."""
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the gauge."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrement the gauge."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed upper bounds."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation."""
+        key = self._key(labels)
+        counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+        self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def time(self, **labels: Any) -> "_Timer":
+        """Context manager observing the elapsed seconds of a block."""
+        return _Timer(self, labels)
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them for scraping."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> Any:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# API
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+)
+
+# PostgreSQL connection pool
+DB_POOL_SIZE = registry.gauge("db_pool_size", "Configured SQLAlchemy pool size")
+DB_POOL_CHECKED_OUT = registry.gauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool"
+)
+DB_POOL_OVERFLOW = registry.gauge("db_pool_overflow", "Connections open beyond pool_size")
+DB_POOL_WAIT = registry.histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+CORPUS_STORE_READS = registry.counter(
+    "corpus_store_reads_total",
+    "Reads served from the memory-mapped corpus store instead of PostgreSQL",
+    ("kind",),
+)
+
+# Neo4j
+NEO4J_QUERY_DURATION = registry.histogram(
+    "neo4j_query_duration_seconds", "Neo4j query latency", ("operation",)
+)
+NEO4J_QUERY_ERRORS = registry.counter(
+    "neo4j_query_errors_total", "Neo4j queries that raised", ("operation",)
+)
+
+# Embedding
+EMBEDDING_BATCH_DURATION = registry.histogram(
+    "embedding_batch_duration_seconds", "bge-m3 forward pass latency per batch"
+)
+EMBEDDING_BATCH_SIZE = registry.histogram(
+    "embedding_batch_size",
+    "Texts per bge-m3 forward pass",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+EMBEDDING_QUEUE_DEPTH = registry.gauge(
+    "embedding_queue_depth", "Query encodes waiting for the micro-batcher"
+)
+
+# /query coalescing (read from the single-flight group at scrape time)
+QUERY_COALESCING_REQUESTS = registry.counter(
+    "query_coalescing_requests_total", "/query requests passed through single-flight coalescing"
+)
+QUERY_COALESCING_EXECUTIONS = registry.counter(
+    "query_coalescing_executions_total", "/query pipeline runs started by single-flight coalescing"
+)
+QUERY_COALESCED = registry.counter(
+    "query_coalesced_total", "/query requests that joined an identical in-flight call"
+)
+QUERY_COALESCING_IN_FLIGHT = registry.gauge(
+    "query_coalescing_in_flight", "Distinct /query calls currently in flight"
+)
+
+# Semantic answer cache (read from the cache at scrape time)
+SEMANTIC_CACHE_LOOKUPS = registry.counter(
+    "semantic_cache_lookups_total", "Semantic cache lookups by result", ("result",)
+)
+SEMANTIC_CACHE_SAVED = registry.counter(
+    "semantic_cache_saved_seconds_total", "Pipeline latency saved by semantic cache hits"
+)
+SEMANTIC_CACHE_EVICTIONS = registry.counter(
+    "semantic_cache_evictions_total", "Semantic cache entries evicted by the LRU caps"
+)
+SEMANTIC_CACHE_INVALIDATIONS = registry.counter(
+    "semantic_cache_invalidations_total", "Semantic cache flushes after a corpus or model change"
+)
+SEMANTIC_CACHE_ENTRIES = registry.gauge("semantic_cache_entries", "Live semantic cache entries")
+SEMANTIC_CACHE_BYTES = registry.gauge(
+    "semantic_cache_memory_bytes", "Estimated memory held by semantic cache entries"
+)
+
+# LLM
+LLM_REQUEST_DURATION = registry.histogram(
+    "llm_request_duration_seconds", "Ollama chat request latency", ("stream",)
+)
+LLM_REQUEST_ERRORS = registry.counter(
+    "llm_request_errors_total", "Ollama chat requests that raised", ("stream",)
+)
+LLM_REQUESTS_IN_FLIGHT = registry.gauge(
+    "llm_requests_in_flight", "Ollama chat requests currently running"
+)
+LLM_PROMPT_TOKENS = registry.counter(
+    "llm_prompt_tokens_total", "Prompt tokens evaluated by Ollama (prompt_eval_count)"
+)
+LLM_GENERATED_TOKENS = registry.counter(
+    "llm_generated_tokens_total", "Tokens generated by Ollama (eval_count)"
+)
+
+
+class PrometheusMiddleware:
+    """ASGI middleware recording request count and latency per route template.
+
+    Latency is measured until the response body has been fully sent, so
+    streaming responses are timed end to end.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # Use the route template to keep label cardinality bounded
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method=method, route=route_path, status=status)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start, method=method, route=route_path
+            )
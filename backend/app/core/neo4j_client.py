@@ -1,6 +1,7 @@
 """Neo4j async client with connection pooling."""
 
 import logging
+import time
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
@@ -8,6 +9,7 @@ from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
 from neo4j.exceptions import ServiceUnavailable, AuthError
 
 from app.core.config import settings
+from app.core.metrics import NEO4J_QUERY_DURATION, NEO4J_QUERY_ERRORS
 
 logger = logging.getLogger(__name__)
 
@@ -96,13 +98,17 @@ class Neo4jClient:
             logger.warning("Neo4j not available, returning empty results")
             return []
 
+        start = time.perf_counter()
         try:
             async with cls.session() as session:
                 result = await session.run(query, parameters or {})
                 return [dict(record) for record in await result.data()]
         except Exception as e:
+            NEO4J_QUERY_ERRORS.inc(operation="read")
             logger.error(f"Neo4j read query failed: {e}")
             return []
+        finally:
+            NEO4J_QUERY_DURATION.observe(time.perf_counter() - start, operation="read")
 
     @classmethod
     async def execute_write(
@@ -122,8 +128,13 @@ class Neo4jClient:
         if not cls.is_available():
             raise RuntimeError("Neo4j is not available")
 
-        async with cls.session() as session:
-            await session.run(query, parameters or {})
+        with NEO4J_QUERY_DURATION.time(operation="write"):
+            try:
+                async with cls.session() as session:
+                    await session.run(query, parameters or {})
+            except Exception:
+                NEO4J_QUERY_ERRORS.inc(operation="write")
+                raise
 
     @classmethod
     async def execute_write_batch(
@@ -138,11 +149,16 @@ class Neo4jClient:
         if not cls.is_available():
             raise RuntimeError("Neo4j is not available")
 
-        async with cls.session() as session:
-            async with session.begin_transaction() as tx:
-                for query, params in queries:
-                    await tx.run(query, params or {})
-                await tx.commit()
+        with NEO4J_QUERY_DURATION.time(operation="write_batch"):
+            try:
+                async with cls.session() as session:
+                    async with session.begin_transaction() as tx:
+                        for query, params in queries:
+                            await tx.run(query, params or {})
+                        await tx.commit()
+            except Exception:
+                NEO4J_QUERY_ERRORS.inc(operation="write_batch")
+                raise
 
     @classmethod
     async def health_check(cls) -> dict[str, Any]:
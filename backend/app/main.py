@@ -5,11 +5,23 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import PlainTextResponse
 
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.database import close_db, init_db
+from app.core.metrics import CONTENT_TYPE, PrometheusMiddleware, registry
 from app.core.neo4j_client import Neo4jClient
+from app.services.corpus_store import (
+    close_corpus_store,
+    get_corpus_store_stats,
+    init_corpus_store,
+)
+from app.services.dense_index import init_dense_index
+from app.services.embedding_service import close_embedding_service, get_embedding_stats
+from app.services.semantic_cache import close_semantic_cache, get_semantic_cache_stats
+from app.services.single_flight import get_query_flight_stats
+from app.services.sparse_index import init_sparse_index
 
 
 # API Tags metadata for documentation
@@ -42,9 +54,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
     await init_db()
+    await init_corpus_store()
+    await init_dense_index()
+    await init_sparse_index()
     await Neo4jClient.initialize()
     yield
     # Shutdown
+    close_semantic_cache()
+    close_corpus_store()
+    await close_embedding_service()
     await Neo4jClient.close()
     await close_db()
 
@@ -133,6 +151,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Per-route request metrics
+    app.add_middleware(PrometheusMiddleware)
+
     # Include API router
     app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
@@ -141,6 +162,43 @@ def create_app() -> FastAPI:
         """Health check endpoint."""
         return {"status": "healthy", "version": settings.VERSION}
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus text-format metrics for this worker process."""
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
+
+    @app.get("/health/embedding")
+    async def embedding_health():
+        """Embedding inference queue depth and batcher settings."""
+        stats = get_embedding_stats()
+        if stats is None:
+            return {"status": "not_loaded"}
+        return {"status": "ready" if stats["initialized"] else "loading", **stats}
+
+    @app.get("/health/corpus")
+    async def corpus_health():
+        """Memory-mapped corpus snapshot version and size."""
+        stats = get_corpus_store_stats()
+        if stats is None:
+            return {"status": "not_loaded"}
+        return {"status": "ready", **stats}
+
+    @app.get("/health/cache")
+    async def cache_health():
+        """Semantic answer cache hit rate and saved latency."""
+        stats = get_semantic_cache_stats()
+        if stats is None:
+            return {"status": "not_loaded"}
+        return {"status": "ready", **stats}
+
+    @app.get("/health/coalescing")
+    async def coalescing_health():
+        """Single-flight coalescing counters for /query."""
+        stats = get_query_flight_stats()
+        if stats is None:
+            return {"status": "idle"}
+        return {"status": "ready", **stats}
+
     return app
 
 
@@ -3,7 +3,10 @@
 from app.models.orm.base import Base, TimestampMixin
 from app.models.orm.book import Book
 from app.models.orm.chapter import Chapter
+from app.models.orm.embedding_slot import EmbeddingSlot
 from app.models.orm.entity import Entity, VerseEntity
+from app.models.orm.graph_tombstone import GraphTombstone
+from app.models.orm.llm_job import LLMJob
 from app.models.orm.pericope import Pericope
 from app.models.orm.topic import Topic, VerseTopic
 from app.models.orm.verse import Verse
@@ -14,9 +17,12 @@ __all__ = [
     "Book",
     "Chapter",
     "Pericope",
+    "EmbeddingSlot",
     "Verse",
     "Topic",
     "VerseTopic",
     "Entity",
     "VerseEntity",
+    "LLMJob",
+    "GraphTombstone",
 ]
@@ -0,0 +1,34 @@
+"""Embedding slot ORM model."""
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.orm.base import TimestampMixin
+
+
+class EmbeddingSlot(Base, TimestampMixin):
+    """Pericope embedding column (blue/green slot) and the model that filled it.
+
+    Exactly one slot is active; dense retrieval reads its column and encodes
+    queries with its model.
+    """
+
+    __tablename__ = "embedding_slots"
+
+    # Pericope column name: "embedding" or "embedding_alt"
+    name: Mapped[str] = mapped_column(String(20), primary_key=True)
+    # None means EMBED_MODEL_NAME
+    model_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Recall@k of the slot's HNSW index against exact search at the last build
+    recall: Mapped[float | None] = mapped_column(Float, nullable=True)
+    built_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmbeddingSlot(name='{self.name}', model_name='{self.model_name}', "
+            f"is_active={self.is_active})>"
+        )
@@ -0,0 +1,40 @@
+"""Graph tombstone ORM model."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class GraphTombstone(Base):
+    """A deleted row that the Neo4j graph may still contain.
+
+    Rows are written by AFTER DELETE triggers on the graph's source tables
+    (see the add_graph_tombstones migration) and consumed by
+    ``build_graph --incremental``, so deletions are synced without comparing
+    the whole graph against PostgreSQL.
+    """
+
+    __tablename__ = "graph_tombstones"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    table_name: Mapped[str] = mapped_column(String(30), nullable=False)
+    # Row id, or verse_id for verse_entities/verse_topics
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # entity_id/topic_id for verse_entities/verse_topics
+    ref_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.clock_timestamp(),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("idx_graph_tombstones_table", "table_name"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<GraphTombstone(table_name='{self.table_name}', row_id={self.row_id}, "
+            f"ref_id={self.ref_id})>"
+        )
@@ -0,0 +1,35 @@
+"""LLM batch job state ORM model."""
+
+from sqlalchemy import CheckConstraint, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.orm.base import TimestampMixin
+
+
+class LLMJob(Base, TimestampMixin):
+    """State of one item of an offline LLM batch job (see scripts.llm_batch_runner).
+
+    An item is written as ``done`` in the same transaction as its results,
+    so a restarted run skips exactly the items whose results were stored.
+    """
+
+    __tablename__ = "llm_jobs"
+
+    # Job name, e.g. "entity_extraction"
+    job: Mapped[str] = mapped_column(String(50), primary_key=True)
+    # Item key within the job, e.g. a pericope id
+    item_key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Raw LLM output of the successful attempt
+    result: Mapped[str | None] = mapped_column(Text, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        CheckConstraint("status IN ('pending', 'done', 'failed')", name="check_llm_job_status"),
+        Index("idx_llm_jobs_job_status", "job", "status"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<LLMJob(job='{self.job}', item_key='{self.item_key}', status='{self.status}')>"
@@ -24,8 +24,19 @@ class Pericope(Base, TimestampMixin):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # SHA-256 of the embedding input (title + verse texts)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
     # Vector embedding (bge-m3: 1024 dimensions)
     embedding = mapped_column(Vector(1024), nullable=True)
+    # Model and content hash the embedding was computed from
+    embedding_model: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    embedding_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # Shadow slot for building a new model's vectors (see EmbeddingSlot)
+    embedding_alt = mapped_column(Vector(1024), nullable=True)
+    embedding_alt_model: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    embedding_alt_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     # Relationships
     book = relationship("Book", back_populates="pericopes")
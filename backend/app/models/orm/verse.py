@@ -40,6 +40,12 @@ class Verse(Base, TimestampMixin):
     __table_args__ = (
         UniqueConstraint("book_id", "chapter", "verse", name="uq_verse_reference"),
         Index("idx_verses_tsv", "tsv", postgresql_using="gin"),
+        Index(
+            "idx_verses_text_trgm",
+            "text",
+            postgresql_using="gin",
+            postgresql_ops={"text": "gin_trgm_ops"},
+        ),
         Index("idx_verses_book_chapter", "book_id", "chapter"),
     )
 
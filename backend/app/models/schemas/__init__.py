@@ -19,6 +19,7 @@ from app.models.schemas.pericope import (
 )
 from app.models.schemas.query import (
     GraphContext,
+    LLMUsage,
     PericopeSegment,
     QueryMeta,
     QueryMode,
@@ -26,8 +27,10 @@ from app.models.schemas.query import (
     QueryRequest,
     QueryResponse,
     QueryType,
+    RetrieverStat,
 )
 from app.models.schemas.verse import (
+    BookFacet,
     BookVerses,
     VerseBase,
     VerseDetail,
@@ -78,6 +81,7 @@ __all__ = [
     "VerseDetail",
     "VerseList",
     "VerseSearchResult",
+    "BookFacet",
     "BookVerses",
     # Pericope
     "PericopeBase",
@@ -91,6 +95,8 @@ __all__ = [
     "QueryRequest",
     "PericopeSegment",
     "QueryMeta",
+    "RetrieverStat",
+    "LLMUsage",
     "GraphContext",
     "QueryResponse",
     # Graph
@@ -22,3 +22,9 @@ class PaginatedResponse(BaseModel):
     page_size: int = Field(ge=1, le=100)
     total: int = Field(ge=0)
     total_pages: int = Field(ge=0)
+    total_is_exact: bool = Field(
+        default=True, description="False when total is capped rather than counted"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page (null on the last page)"
+    )
@@ -1,6 +1,8 @@
 """Query request and response schemas."""
 
 from enum import Enum
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -29,6 +31,7 @@ class QueryOptions(BaseModel):
 
     max_results: int = Field(default=5, ge=1, le=20)
     include_graph: bool = Field(default=False)
+    debug: bool = Field(default=False, description="Return the full stage trace in meta.trace")
 
 
 class QueryRequest(BaseModel):
@@ -66,6 +69,25 @@ class PericopeSegment(BaseModel):
     relevance_score: float = Field(ge=0.0, le=1.0)
 
 
+class RetrieverStat(BaseModel):
+    """Per-retriever execution statistics."""
+
+    name: str
+    time_ms: float = Field(ge=0.0, description="Wall-clock time spent in the retriever")
+    result_count: int = Field(default=0, ge=0)
+    timed_out: bool = False
+    error: str | None = None
+
+
+class LLMUsage(BaseModel):
+    """Ollama token usage summed over the LLM calls of a query."""
+
+    calls: int = Field(ge=0)
+    prompt_tokens: int = Field(ge=0, description="Sum of prompt_eval_count")
+    completion_tokens: int = Field(ge=0, description="Sum of eval_count")
+    tokens_per_second: float | None = None
+
+
 class QueryMeta(BaseModel):
     """Query response metadata."""
 
@@ -73,6 +95,28 @@ class QueryMeta(BaseModel):
     used_retrievers: list[str]
     total_processing_time_ms: int = Field(ge=0)
     llm_model: str
+    retrievers: list[RetrieverStat] = Field(default_factory=list)
+    classification_ms: float | None = Field(
+        default=None, ge=0.0, description="Time spent classifying the query"
+    )
+    classification_source: str | None = Field(
+        default=None,
+        description="How query_type was decided: embedding, llm, llm_fallback, mode or reference",
+    )
+    cache_hit: bool = Field(default=False, description="Served from the semantic answer cache")
+    cache_similarity: float | None = Field(
+        default=None, description="Cosine similarity to the cached query"
+    )
+    coalesced: bool = Field(
+        default=False, description="Shared the result of an identical in-flight query"
+    )
+    stages: dict[str, float] = Field(
+        default_factory=dict, description="Milliseconds spent per pipeline stage"
+    )
+    llm_usage: LLMUsage | None = None
+    trace: dict[str, Any] | None = Field(
+        default=None, description="Full span trace (only with options.debug)"
+    )
 
 
 class GraphContext(BaseModel):
@@ -32,11 +32,22 @@ class VerseList(PaginatedResponse):
     verses: list[VerseBase]
 
 
+class BookFacet(BaseModel):
+    """Number of search matches in one book."""
+
+    book_id: int
+    book_name: str
+    count: int = Field(ge=0)
+
+
 class VerseSearchResult(PaginatedResponse):
     """Search result for verses."""
 
     query: str = Field(..., description="Search query")
     verses: list[VerseBase]
+    facets: list[BookFacet] | None = Field(
+        None, description="Matches per book (only with exact_total)"
+    )
 
 
 class BookVerses(BaseModel):
@@ -47,3 +58,6 @@ class BookVerses(BaseModel):
     chapter: int | None = Field(None, description="Chapter filter if applied")
     verses: list[VerseBase]
     total: int = Field(ge=0)
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page when limit is set"
+    )
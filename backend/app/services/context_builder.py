@@ -2,6 +2,7 @@
 
 from app.core.config import settings
 from app.services.fusion import FusedResult
+from app.services.tracing import span
 
 
 class ContextBuilder:
@@ -89,28 +90,31 @@ class ContextBuilder:
         if not results:
             return "沒有找到相關經文。", []
 
-        max_chars = int(self.max_tokens * self.chars_per_token)
-        context_parts = []
-        metadata = []
-        total_chars = 0
-
-        for result in results:
-            pericope_text = self._format_pericope(result)
-            part_length = len(pericope_text)
-
-            if total_chars + part_length > max_chars and context_parts:
-                break
-
-            context_parts.append(pericope_text)
-            metadata.append({
-                "id": result.id,
-                "book": result.book_name,
-                "reference": self._format_reference(result),
-                "title": result.title,
-                "score": result.score,
-                "sources": result.sources,
-            })
-            total_chars += part_length
+        with span("context_build", candidates=len(results)) as s:
+            max_chars = int(self.max_tokens * self.chars_per_token)
+            context_parts = []
+            metadata = []
+            total_chars = 0
+
+            for result in results:
+                pericope_text = self._format_pericope(result)
+                part_length = len(pericope_text)
+
+                if total_chars + part_length > max_chars and context_parts:
+                    break
+
+                context_parts.append(pericope_text)
+                metadata.append({
+                    "id": result.id,
+                    "book": result.book_name,
+                    "reference": self._format_reference(result),
+                    "title": result.title,
+                    "score": result.score,
+                    "sources": result.sources,
+                })
+                total_chars += part_length
+
+            context = "\n\n---\n\n".join(context_parts)
+            s.attributes.update(included=len(context_parts), chars=total_chars)
 
-        context = "\n\n---\n\n".join(context_parts)
         return context, metadata
@@ -0,0 +1,836 @@
+"""Memory-resident corpus store for books, pericopes and verses.
+
+The corpus (66 books, ~1.2k pericopes, ~31k verses) is small and rarely
+changes. It is exported into a versioned snapshot directory of flat ``.npy``
+columns plus UTF-8 text blobs, which every worker memory-maps read-only. The
+mappings are backed by the OS page cache, so uvicorn workers share one copy
+of the data instead of each holding their own. The snapshot version is
+re-checked every CORPUS_VERSION_CHECK_SECONDS; after a re-import or summary
+run the next lookup builds and maps the new snapshot.
+
+Lookups by verse id, pericope id and (book, chapter, verse) are array index
+operations; no ORM objects are created on the read path.
+"""
+
+import asyncio
+import bisect
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.metrics import CORPUS_STORE_READS
+from app.models.orm import Book, Pericope, Verse
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT = 1
+
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = ".lock"
+
+
+@dataclass(frozen=True)
+class StoredBook:
+    """Book row from the corpus store."""
+
+    id: int
+    name_zh: str
+    abbrev_zh: str
+    testament: str
+    order_index: int
+
+
+@dataclass(frozen=True)
+class StoredVerse:
+    """Verse row from the corpus store."""
+
+    id: int
+    book_id: int
+    chapter: int
+    verse: int
+    text: str
+    pericope_id: int | None
+
+
+@dataclass(frozen=True)
+class StoredPericope:
+    """Pericope row from the corpus store."""
+
+    id: int
+    book_id: int
+    chapter_start: int
+    verse_start: int
+    chapter_end: int
+    verse_end: int
+    title: str
+    summary: str | None
+
+    @property
+    def reference(self) -> str:
+        """Get human-readable reference string."""
+        if self.chapter_start == self.chapter_end:
+            return f"{self.chapter_start}:{self.verse_start}-{self.verse_end}"
+        return f"{self.chapter_start}:{self.verse_start}-{self.chapter_end}:{self.verse_end}"
+
+
+def _pack_strings(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack strings into a UTF-8 byte blob and an (n + 1) offsets column."""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded], dtype=np.int64)
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def _row_index(ids: np.ndarray) -> np.ndarray:
+    """Dense id -> row lookup table (-1 for unused ids)."""
+    index = np.full(int(ids.max()) + 1 if len(ids) else 1, -1, dtype=np.int32)
+    index[ids] = np.arange(len(ids), dtype=np.int32)
+    return index
+
+
+def _write_snapshot(
+    path: Path,
+    version: str,
+    books: list[Any],
+    pericopes: list[Any],
+    verses: list[Any],
+) -> None:
+    """Write a snapshot directory from rows ordered by book/chapter/verse."""
+    path.mkdir(parents=True)
+    columns: dict[str, np.ndarray] = {}
+
+    # Verses, ordered by (book_id, chapter, verse)
+    verse_id = np.array([v.id for v in verses], dtype=np.int32)
+    verse_book = np.array([v.book_id for v in verses], dtype=np.int32)
+    verse_chapter = np.array([v.chapter for v in verses], dtype=np.int32)
+    columns["verse_id"] = verse_id
+    columns["verse_book"] = verse_book
+    columns["verse_chapter"] = verse_chapter
+    columns["verse_number"] = np.array([v.verse for v in verses], dtype=np.int32)
+    columns["verse_pericope"] = np.array(
+        [v.pericope_id if v.pericope_id is not None else -1 for v in verses],
+        dtype=np.int32,
+    )
+    columns["verse_text"], columns["verse_text_offsets"] = _pack_strings(
+        [v.text for v in verses]
+    )
+    columns["verse_row_by_id"] = _row_index(verse_id)
+
+    # (book, chapter) -> first row and verse count
+    max_book = max([b.id for b in books] + [0])
+    chapter_stride = int(verse_chapter.max()) + 1 if len(verses) else 1
+    chapter_keys = verse_book * chapter_stride + verse_chapter
+    chapter_start = np.zeros((max_book + 1) * chapter_stride, dtype=np.int32)
+    chapter_count = np.zeros((max_book + 1) * chapter_stride, dtype=np.int32)
+    keys, first_rows, counts = np.unique(chapter_keys, return_index=True, return_counts=True)
+    chapter_start[keys] = first_rows
+    chapter_count[keys] = counts
+    columns["chapter_start"] = chapter_start
+    columns["chapter_count"] = chapter_count
+
+    # Pericopes, ordered by (book_id, chapter_start, verse_start)
+    pericope_id = np.array([p.id for p in pericopes], dtype=np.int32)
+    columns["pericope_id"] = pericope_id
+    columns["pericope_book"] = np.array([p.book_id for p in pericopes], dtype=np.int32)
+    columns["pericope_bounds"] = np.array(
+        [(p.chapter_start, p.verse_start, p.chapter_end, p.verse_end) for p in pericopes],
+        dtype=np.int32,
+    ).reshape(-1, 4)
+    columns["pericope_title"], columns["pericope_title_offsets"] = _pack_strings(
+        [p.title for p in pericopes]
+    )
+    columns["pericope_summary"], columns["pericope_summary_offsets"] = _pack_strings(
+        [p.summary or "" for p in pericopes]
+    )
+    columns["pericope_has_summary"] = np.array(
+        [p.summary is not None for p in pericopes], dtype=np.bool_
+    )
+    pericope_row_by_id = _row_index(pericope_id)
+    columns["pericope_row_by_id"] = pericope_row_by_id
+
+    # Pericope -> verse rows (CSR, verse order preserved)
+    verse_pericope = columns["verse_pericope"]
+    linked = np.flatnonzero(
+        (verse_pericope >= 0) & (verse_pericope < len(pericope_row_by_id))
+    )
+    linked = linked[pericope_row_by_id[verse_pericope[linked]] >= 0]
+    owner = pericope_row_by_id[verse_pericope[linked]]
+    order = np.argsort(owner, kind="stable")
+    offsets = np.zeros(len(pericopes) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(owner, minlength=len(pericopes)))
+    columns["pericope_verse_rows"] = linked[order].astype(np.int32)
+    columns["pericope_verse_offsets"] = offsets
+
+    for name, array in columns.items():
+        np.save(path / f"{name}.npy", array)
+
+    # Manifest last: its presence marks the snapshot as complete
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "created_at": time.time(),
+        "chapter_stride": chapter_stride,
+        "columns": sorted(columns),
+        "books": [
+            {
+                "id": b.id,
+                "name_zh": b.name_zh,
+                "abbrev_zh": b.abbrev_zh,
+                "testament": b.testament,
+                "order_index": b.order_index,
+            }
+            for b in books
+        ],
+        "counts": {"books": len(books), "pericopes": len(pericopes), "verses": len(verses)},
+    }
+    (path / MANIFEST_FILE).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+
+
+class CorpusStore:
+    """Immutable, memory-mapped view of a corpus snapshot."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        manifest = json.loads((path / MANIFEST_FILE).read_text(encoding="utf-8"))
+        if manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported corpus snapshot format: {manifest.get('format')}")
+
+        self.version: str = manifest["version"]
+        self.counts: dict[str, int] = manifest["counts"]
+        self._chapter_stride: int = manifest["chapter_stride"]
+        self._books = {b["id"]: StoredBook(**b) for b in manifest["books"]}
+        self._book_order = sorted(self._books.values(), key=lambda b: b.order_index)
+
+        columns = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r")
+            for name in manifest["columns"]
+        }
+        self._verse_id = columns["verse_id"]
+        self._verse_book = columns["verse_book"]
+        self._verse_chapter = columns["verse_chapter"]
+        self._verse_number = columns["verse_number"]
+        self._verse_pericope = columns["verse_pericope"]
+        self._verse_text = columns["verse_text"]
+        self._verse_text_offsets = columns["verse_text_offsets"]
+        self._verse_row_by_id = columns["verse_row_by_id"]
+        self._chapter_start = columns["chapter_start"]
+        self._chapter_count = columns["chapter_count"]
+        self._pericope_id = columns["pericope_id"]
+        self._pericope_book = columns["pericope_book"]
+        self._pericope_bounds = columns["pericope_bounds"]
+        self._pericope_title = columns["pericope_title"]
+        self._pericope_title_offsets = columns["pericope_title_offsets"]
+        self._pericope_summary = columns["pericope_summary"]
+        self._pericope_summary_offsets = columns["pericope_summary_offsets"]
+        self._pericope_has_summary = columns["pericope_has_summary"]
+        self._pericope_row_by_id = columns["pericope_row_by_id"]
+        self._pericope_verse_rows = columns["pericope_verse_rows"]
+        self._pericope_verse_offsets = columns["pericope_verse_offsets"]
+
+        self.loaded_at = time.time()
+
+    # ----- row decoding -----
+
+    @staticmethod
+    def _string(blob: np.ndarray, offsets: np.ndarray, row: int) -> str:
+        return blob[offsets[row] : offsets[row + 1]].tobytes().decode("utf-8")
+
+    def _verse_at_row(self, row: int) -> StoredVerse:
+        pericope_id = int(self._verse_pericope[row])
+        return StoredVerse(
+            id=int(self._verse_id[row]),
+            book_id=int(self._verse_book[row]),
+            chapter=int(self._verse_chapter[row]),
+            verse=int(self._verse_number[row]),
+            text=self._string(self._verse_text, self._verse_text_offsets, row),
+            pericope_id=pericope_id if pericope_id >= 0 else None,
+        )
+
+    def _pericope_at_row(self, row: int) -> StoredPericope:
+        chapter_start, verse_start, chapter_end, verse_end = (
+            int(x) for x in self._pericope_bounds[row]
+        )
+        summary = None
+        if self._pericope_has_summary[row]:
+            summary = self._string(self._pericope_summary, self._pericope_summary_offsets, row)
+        return StoredPericope(
+            id=int(self._pericope_id[row]),
+            book_id=int(self._pericope_book[row]),
+            chapter_start=chapter_start,
+            verse_start=verse_start,
+            chapter_end=chapter_end,
+            verse_end=verse_end,
+            title=self._string(self._pericope_title, self._pericope_title_offsets, row),
+            summary=summary,
+        )
+
+    @staticmethod
+    def _lookup(index: np.ndarray, key: int) -> int:
+        if 0 <= key < len(index):
+            return int(index[key])
+        return -1
+
+    def _chapter_range(self, book_id: int, chapter: int) -> tuple[int, int]:
+        if not (book_id in self._books and 0 <= chapter < self._chapter_stride):
+            return 0, 0
+        key = book_id * self._chapter_stride + chapter
+        start = int(self._chapter_start[key])
+        return start, start + int(self._chapter_count[key])
+
+    def _book_verse_range(self, book_id: int) -> tuple[int, int]:
+        return (
+            int(np.searchsorted(self._verse_book, book_id, side="left")),
+            int(np.searchsorted(self._verse_book, book_id, side="right")),
+        )
+
+    def _book_pericope_range(self, book_id: int) -> tuple[int, int]:
+        return (
+            int(np.searchsorted(self._pericope_book, book_id, side="left")),
+            int(np.searchsorted(self._pericope_book, book_id, side="right")),
+        )
+
+    # ----- books -----
+
+    def books(self) -> list[StoredBook]:
+        """All books in canonical order."""
+        CORPUS_STORE_READS.inc(kind="book")
+        return list(self._book_order)
+
+    def book(self, book_id: int) -> StoredBook | None:
+        """Get a book by id."""
+        CORPUS_STORE_READS.inc(kind="book")
+        return self._books.get(book_id)
+
+    def book_chapters(self, book_id: int) -> list[tuple[int, int]]:
+        """(chapter, verse count) pairs for a book, in chapter order."""
+        CORPUS_STORE_READS.inc(kind="book")
+        start, end = self._book_verse_range(book_id)
+        chapters, counts = np.unique(self._verse_chapter[start:end], return_counts=True)
+        return [(int(c), int(n)) for c, n in zip(chapters, counts)]
+
+    def book_stats(self, book_id: int) -> tuple[int, int, int]:
+        """(chapter count, verse count, pericope count) for a book."""
+        CORPUS_STORE_READS.inc(kind="book")
+        start, end = self._book_verse_range(book_id)
+        chapter_count = len(np.unique(self._verse_chapter[start:end]))
+        pericope_start, pericope_end = self._book_pericope_range(book_id)
+        return chapter_count, end - start, pericope_end - pericope_start
+
+    # ----- verses -----
+
+    def verse(self, verse_id: int) -> StoredVerse | None:
+        """Get a verse by id."""
+        CORPUS_STORE_READS.inc(kind="verse")
+        row = self._lookup(self._verse_row_by_id, verse_id)
+        return self._verse_at_row(row) if row >= 0 else None
+
+    def _find_verse_row(self, book_id: int, chapter: int, verse: int) -> int:
+        start, end = self._chapter_range(book_id, chapter)
+        # Verses are numbered from 1 without gaps in almost every chapter
+        row = start + verse - 1
+        if not (start <= row < end and self._verse_number[row] == verse):
+            row = start + int(np.searchsorted(self._verse_number[start:end], verse))
+            if not (row < end and self._verse_number[row] == verse):
+                return -1
+        return row
+
+    def _verse_rows(self, book_id: int | None, chapter: int | None) -> Sequence[int]:
+        """Sorted verse rows matching optional book and chapter filters."""
+        if book_id is not None and chapter is not None:
+            return range(*self._chapter_range(book_id, chapter))
+        if book_id is not None:
+            return range(*self._book_verse_range(book_id))
+        if chapter is not None:
+            return np.flatnonzero(np.asarray(self._verse_chapter) == chapter)
+        return range(len(self._verse_id))
+
+    def verse_at(self, book_id: int, chapter: int, verse: int) -> StoredVerse | None:
+        """Get a verse by (book, chapter, verse)."""
+        CORPUS_STORE_READS.inc(kind="verse")
+        row = self._find_verse_row(book_id, chapter, verse)
+        return self._verse_at_row(row) if row >= 0 else None
+
+    def verses_between(
+        self,
+        book_id: int,
+        start: tuple[int, int],
+        end: tuple[int, int],
+        limit: int | None = None,
+    ) -> list[StoredVerse]:
+        """Verses of one book from (chapter, verse) start to end, inclusive."""
+        CORPUS_STORE_READS.inc(kind="verse")
+        verses: list[StoredVerse] = []
+        for chapter in range(start[0], end[0] + 1):
+            chapter_start, chapter_end = self._chapter_range(book_id, chapter)
+            for row in range(chapter_start, chapter_end):
+                if start <= (chapter, int(self._verse_number[row])) <= end:
+                    verses.append(self._verse_at_row(row))
+                    if limit is not None and len(verses) >= limit:
+                        return verses
+        return verses
+
+    def verses_page(
+        self,
+        book_id: int | None = None,
+        chapter: int | None = None,
+        offset: int = 0,
+        limit: int | None = 20,
+        after: tuple[int, int, int] | None = None,
+    ) -> tuple[list[StoredVerse], int]:
+        """A page of verses in (book, chapter, verse) order, plus the total.
+
+        Args:
+            book_id: Optional book filter
+            chapter: Optional chapter filter
+            offset: Rows to skip (ignored when after is set)
+            limit: Maximum verses to return (None for all)
+            after: (book_id, chapter, verse) of the last verse already seen
+
+        Raises:
+            ValueError: If after does not name a verse
+        """
+        CORPUS_STORE_READS.inc(kind="page")
+        rows = self._verse_rows(book_id, chapter)
+        if after is not None:
+            row = self._find_verse_row(*after)
+            if row < 0:
+                raise ValueError(f"Unknown verse: {after}")
+            offset = bisect.bisect_right(rows, row)
+        end = len(rows) if limit is None else offset + limit
+        return [self._verse_at_row(int(r)) for r in rows[offset:end]], len(rows)
+
+    # ----- pericopes -----
+
+    def pericope(self, pericope_id: int) -> StoredPericope | None:
+        """Get a pericope by id."""
+        CORPUS_STORE_READS.inc(kind="pericope")
+        row = self._lookup(self._pericope_row_by_id, pericope_id)
+        return self._pericope_at_row(row) if row >= 0 else None
+
+    def pericope_verses(self, pericope_id: int) -> list[StoredVerse]:
+        """Verses linked to a pericope, in (chapter, verse) order."""
+        CORPUS_STORE_READS.inc(kind="pericope")
+        row = self._lookup(self._pericope_row_by_id, pericope_id)
+        if row < 0:
+            return []
+        start, end = self._pericope_verse_offsets[row], self._pericope_verse_offsets[row + 1]
+        return [self._verse_at_row(int(r)) for r in self._pericope_verse_rows[start:end]]
+
+    def pericope_text(self, pericope_id: int) -> str:
+        """Full pericope text, one verse per line."""
+        return "\n".join(v.text for v in self.pericope_verses(pericope_id))
+
+    def book_pericopes(self, book_id: int) -> list[StoredPericope]:
+        """Pericopes of a book in (chapter_start, verse_start) order."""
+        CORPUS_STORE_READS.inc(kind="pericope")
+        return [self._pericope_at_row(r) for r in range(*self._book_pericope_range(book_id))]
+
+    def pericopes_page(
+        self,
+        book_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> tuple[list[StoredPericope], int]:
+        """A page of pericopes in (book, chapter_start, verse_start) order, plus the total.
+
+        Args:
+            book_id: Optional book filter
+            offset: Rows to skip (ignored when after_id is set)
+            limit: Maximum pericopes to return
+            after_id: Id of the last pericope already seen
+
+        Raises:
+            ValueError: If after_id does not name a pericope
+        """
+        CORPUS_STORE_READS.inc(kind="page")
+        if book_id is not None:
+            rows = range(*self._book_pericope_range(book_id))
+        else:
+            rows = range(len(self._pericope_id))
+        if after_id is not None:
+            row = self._lookup(self._pericope_row_by_id, after_id)
+            if row < 0:
+                raise ValueError(f"Unknown pericope: {after_id}")
+            offset = bisect.bisect_right(rows, row)
+        return [self._pericope_at_row(r) for r in rows[offset : offset + limit]], len(rows)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get snapshot version, row counts and mapped size."""
+        size = sum(f.stat().st_size for f in self.path.iterdir() if f.is_file())
+        return {
+            "version": self.version,
+            "path": str(self.path),
+            **self.counts,
+            "mapped_mb": round(size / 1024 / 1024, 2),
+            "loaded_at": self.loaded_at,
+        }
+
+
+def content_digest(*columns):
+    """md5 over the given columns of every row, in order of the first column."""
+    return func.md5(
+        func.string_agg(
+            func.concat_ws("|", *columns),
+            aggregate_order_by(literal("\n"), columns[0]),
+        )
+    )
+
+
+async def _corpus_state(db: AsyncSession) -> tuple[Any, ...]:
+    result = await db.execute(
+        select(
+            select(
+                content_digest(
+                    Book.id, Book.name_zh, Book.abbrev_zh, Book.testament, Book.order_index
+                )
+            ).scalar_subquery(),
+            select(func.count(Pericope.id)).scalar_subquery(),
+            select(
+                content_digest(
+                    Pericope.id,
+                    Pericope.book_id,
+                    Pericope.chapter_start,
+                    Pericope.verse_start,
+                    Pericope.chapter_end,
+                    Pericope.verse_end,
+                    Pericope.title,
+                )
+            ).scalar_subquery(),
+            select(func.count(Verse.id)).scalar_subquery(),
+            select(
+                content_digest(
+                    Verse.id, Verse.book_id, Verse.chapter, Verse.verse, Verse.pericope_id, Verse.text
+                )
+            ).scalar_subquery(),
+            select(content_digest(Pericope.id, Pericope.summary)).scalar_subquery(),
+        )
+    )
+    return tuple(result.one())
+
+
+def _format_version(state: tuple[Any, ...]) -> str:
+    books, pericopes, pericopes_digest, verses, verses_digest, _ = state
+    return f"{books}:{pericopes}:{pericopes_digest}:{verses}:{verses_digest}"
+
+
+def _format_snapshot_version(state: tuple[Any, ...]) -> str:
+    return f"{_format_version(state)}:{state[5]}"
+
+
+async def corpus_version(db: AsyncSession) -> str:
+    """Corpus version derived from the stored text.
+
+    Covers books, pericope boundaries and titles, and verses. Writes that
+    only touch ``updated_at`` (such as embedding a shadow slot) or generated
+    summaries leave it, and every index keyed on it, alone.
+    """
+    return _format_version(await _corpus_state(db))
+
+
+async def snapshot_version(db: AsyncSession) -> str:
+    """Version of the corpus snapshot: the corpus version plus pericope summaries."""
+    return _format_snapshot_version(await _corpus_state(db))
+
+
+def _snapshot_name(version: str) -> str:
+    digest = hashlib.sha256(version.encode("utf-8")).hexdigest()[:16]
+    return f"v{SNAPSHOT_FORMAT}-{digest}"
+
+
+def acquire_lock(path: Path) -> int:
+    """Block until an exclusive flock on path is held; returns its descriptor."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    return fd
+
+
+def release_lock(fd: int) -> None:
+    """Release a lock taken with acquire_lock."""
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+async def build_snapshot(db: AsyncSession, root: Path, version: str) -> Path:
+    """Export the corpus into a new snapshot directory under root.
+
+    The snapshot is written to a temporary directory and renamed into place,
+    so readers never observe a partial snapshot.
+
+    Args:
+        db: Database session
+        root: Snapshot root directory
+        version: Corpus version the snapshot is named after
+
+    Returns:
+        Path of the snapshot directory
+    """
+    start = time.perf_counter()
+    books = (
+        await db.execute(
+            select(Book.id, Book.name_zh, Book.abbrev_zh, Book.testament, Book.order_index)
+            .order_by(Book.order_index)
+        )
+    ).all()
+    pericopes = (
+        await db.execute(
+            select(
+                Pericope.id,
+                Pericope.book_id,
+                Pericope.chapter_start,
+                Pericope.verse_start,
+                Pericope.chapter_end,
+                Pericope.verse_end,
+                Pericope.title,
+                Pericope.summary,
+            ).order_by(
+                Pericope.book_id, Pericope.chapter_start, Pericope.verse_start, Pericope.id
+            )
+        )
+    ).all()
+    verses = (
+        await db.execute(
+            select(
+                Verse.id,
+                Verse.book_id,
+                Verse.chapter,
+                Verse.verse,
+                Verse.text,
+                Verse.pericope_id,
+            ).order_by(Verse.book_id, Verse.chapter, Verse.verse)
+        )
+    ).all()
+
+    path = root / _snapshot_name(version)
+    tmp_path = root / f".tmp-{path.name}-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    await asyncio.to_thread(_write_snapshot, tmp_path, version, books, pericopes, verses)
+    os.replace(tmp_path, path)
+
+    logger.info(
+        f"Built corpus snapshot {path.name}: {len(books)} books, {len(pericopes)} pericopes, "
+        f"{len(verses)} verses in {time.perf_counter() - start:.2f}s"
+    )
+    return path
+
+
+def _prune_snapshots(root: Path, keep: str) -> None:
+    """Remove other snapshot versions.
+
+    Workers still mapping an old snapshot keep reading it; the files are
+    only released once their last mapping is closed.
+    """
+    for child in root.iterdir():
+        if child.is_dir() and child.name != keep and child.name.startswith("v"):
+            shutil.rmtree(child, ignore_errors=True)
+
+
+async def load_corpus_store(db: AsyncSession, root: Path | None = None) -> CorpusStore | None:
+    """Map the snapshot for the current corpus version, building it if needed.
+
+    Concurrent workers serialize on a lock file so the snapshot is built once.
+
+    Args:
+        db: Database session
+        root: Snapshot root directory (defaults to CORPUS_SNAPSHOT_DIR)
+
+    Returns:
+        CorpusStore, or None if the database has no verses yet
+    """
+    state = await _corpus_state(db)
+    if not state[3]:
+        return None
+
+    root = root or Path(settings.CORPUS_SNAPSHOT_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    version = _format_snapshot_version(state)
+    path = root / _snapshot_name(version)
+
+    if not (path / MANIFEST_FILE).exists():
+        fd = await asyncio.to_thread(acquire_lock, root / LOCK_FILE)
+        try:
+            # Another worker may have built it while we waited
+            if not (path / MANIFEST_FILE).exists():
+                await build_snapshot(db, root, version)
+                _prune_snapshots(root, keep=path.name)
+        finally:
+            release_lock(fd)
+
+    return CorpusStore(path)
+
+
+@dataclass(frozen=True)
+class CorpusCounts:
+    """Precomputed verse and pericope totals for paginated endpoints."""
+
+    verses_by_chapter: dict[tuple[int, int], int]
+    pericopes_by_book: dict[int, int]
+
+    def verses(self, book_id: int | None = None, chapter: int | None = None) -> int:
+        """Number of verses matching optional book and chapter filters."""
+        if book_id is not None and chapter is not None:
+            return self.verses_by_chapter.get((book_id, chapter), 0)
+        return sum(
+            count
+            for (b, c), count in self.verses_by_chapter.items()
+            if (book_id is None or b == book_id) and (chapter is None or c == chapter)
+        )
+
+    def pericopes(self, book_id: int | None = None) -> int:
+        """Number of pericopes, optionally in one book."""
+        if book_id is not None:
+            return self.pericopes_by_book.get(book_id, 0)
+        return sum(self.pericopes_by_book.values())
+
+
+async def load_corpus_counts(db: AsyncSession) -> CorpusCounts:
+    """Count verses per (book, chapter) and pericopes per book in two grouped scans."""
+    verse_result = await db.execute(
+        select(Verse.book_id, Verse.chapter, func.count()).group_by(Verse.book_id, Verse.chapter)
+    )
+    pericope_result = await db.execute(
+        select(Pericope.book_id, func.count()).group_by(Pericope.book_id)
+    )
+    return CorpusCounts(
+        verses_by_chapter={(b, c): n for b, c, n in verse_result.all()},
+        pericopes_by_book={b: n for b, n in pericope_result.all()},
+    )
+
+
+# Singleton instances
+_corpus_store: CorpusStore | None = None
+_corpus_store_version: str | None = None
+_corpus_store_lock = asyncio.Lock()
+_corpus_counts: CorpusCounts | None = None
+_corpus_counts_version: str | None = None
+_corpus_version: str | None = None
+_corpus_version_checked_at = 0.0
+_snapshot_version: str | None = None
+_snapshot_version_checked_at = 0.0
+
+
+async def get_corpus_version(db: AsyncSession) -> str:
+    """Get the corpus version, re-read every CORPUS_VERSION_CHECK_SECONDS.
+
+    In-process indexes compare it on every lookup to rebuild after the
+    corpus text changes.
+    """
+    global _corpus_version, _corpus_version_checked_at
+    now = time.monotonic()
+    if (
+        _corpus_version is None
+        or now - _corpus_version_checked_at >= settings.CORPUS_VERSION_CHECK_SECONDS
+    ):
+        _corpus_version, _corpus_version_checked_at = await corpus_version(db), now
+    return _corpus_version
+
+
+async def get_snapshot_version(db: AsyncSession) -> str:
+    """Get the snapshot version, re-read every CORPUS_VERSION_CHECK_SECONDS."""
+    global _snapshot_version, _snapshot_version_checked_at
+    now = time.monotonic()
+    if (
+        _snapshot_version is None
+        or now - _snapshot_version_checked_at >= settings.CORPUS_VERSION_CHECK_SECONDS
+    ):
+        _snapshot_version, _snapshot_version_checked_at = await snapshot_version(db), now
+    return _snapshot_version
+
+
+async def _reload_corpus_store(db: AsyncSession, version: str) -> None:
+    """Map the snapshot for version; fall back to PostgreSQL on failure.
+
+    The version is recorded even when loading fails, so a broken snapshot
+    is retried after the next corpus change rather than on every lookup.
+    """
+    global _corpus_store, _corpus_store_version
+    _corpus_store_version = version
+    try:
+        _corpus_store = await load_corpus_store(db)
+    except Exception as e:
+        logger.warning(f"Corpus store unavailable, serving reads from PostgreSQL: {e}")
+        _corpus_store = None
+        return
+
+    if _corpus_store is None:
+        logger.info("Corpus store skipped: no verses imported yet")
+    else:
+        logger.info(f"Corpus store loaded: {_corpus_store.get_stats()}")
+
+
+async def init_corpus_store() -> None:
+    """Load the corpus store at startup; fall back to PostgreSQL on failure."""
+    if not settings.CORPUS_STORE_ENABLED:
+        return
+
+    try:
+        async with async_session_maker() as db:
+            await _reload_corpus_store(db, await get_snapshot_version(db))
+    except Exception as e:
+        logger.warning(f"Corpus store unavailable, serving reads from PostgreSQL: {e}")
+
+
+async def get_corpus_store(db: AsyncSession) -> CorpusStore | None:
+    """Get the corpus store for the current snapshot version, or None to read from PostgreSQL.
+
+    Every lookup compares the loaded snapshot against the snapshot version,
+    so a re-import or summary run is served without a restart.
+    """
+    if not settings.CORPUS_STORE_ENABLED:
+        return None
+
+    version = await get_snapshot_version(db)
+    if _corpus_store_version == version:
+        return _corpus_store
+
+    async with _corpus_store_lock:
+        if _corpus_store_version != version:
+            await _reload_corpus_store(db, version)
+    return _corpus_store
+
+
+async def get_corpus_counts(db: AsyncSession) -> CorpusCounts:
+    """Get totals for paginated endpoints when the corpus store is not loaded.
+
+    Recomputed when the corpus version changes.
+    """
+    global _corpus_counts, _corpus_counts_version
+    version = await get_corpus_version(db)
+    if _corpus_counts is None or _corpus_counts_version != version:
+        _corpus_counts, _corpus_counts_version = await load_corpus_counts(db), version
+    return _corpus_counts
+
+
+def get_corpus_store_stats() -> dict[str, Any] | None:
+    """Get corpus store stats.
+
+    Returns:
+        Stats dict, or None if the store is not loaded
+    """
+    if _corpus_store is None:
+        return None
+    return _corpus_store.get_stats()
+
+
+def close_corpus_store() -> None:
+    """Drop the corpus store (its mappings are released with it)."""
+    global _corpus_store, _corpus_store_version
+    _corpus_store = None
+    _corpus_store_version = None
@@ -0,0 +1,422 @@
+"""Dense index backends for pericope vector search.
+
+``pgvector`` runs the cosine-distance query against the HNSW index in
+PostgreSQL. ``numpy`` loads every ``Pericope.embedding`` into one contiguous
+float32 matrix (persisted as an mmap'd ``.npy`` per corpus version) and scores
+queries in process: with ~1.2k x 1024 vectors an exact matrix-vector product
+costs well under a millisecond and saves the network round trip.
+
+The numpy backend can also scan quantized codes first (int8 or binary) and
+re-rank the best candidates with the exact float vectors.
+
+Vectors live in one of two pericope columns (blue/green slots, see
+EmbeddingSlot). Both backends read the slot marked active, which is
+re-checked every DENSE_SLOT_REFRESH_SECONDS, so flipping the slot in the
+database switches every worker without a restart. The numpy index is also
+reloaded when the active slot's vectors change, e.g. after re-embedding into
+it; writes to the inactive slot leave it alone.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.orm import EmbeddingSlot, Pericope
+from app.services.corpus_store import LOCK_FILE, acquire_lock, content_digest, release_lock
+
+logger = logging.getLogger(__name__)
+
+QUANTIZATIONS = ("none", "int8", "binary")
+
+# Pericope vector columns usable as blue/green slots
+EMBEDDING_SLOTS = ("embedding", "embedding_alt")
+
+# Set bits per byte value, for Hamming distance on packed binary codes
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+@dataclass(frozen=True)
+class ActiveSlot:
+    """Embedding slot that dense retrieval reads."""
+
+    name: str
+    model_name: str
+
+
+def slot_column(slot: str):
+    """Pericope vector column for a slot name."""
+    if slot not in EMBEDDING_SLOTS:
+        raise ValueError(f"Unknown embedding slot: {slot}")
+    return getattr(Pericope, slot)
+
+
+async def load_active_slot(db: AsyncSession) -> ActiveSlot:
+    """Read the active slot (the primary column if none is recorded)."""
+    result = await db.execute(
+        select(EmbeddingSlot.name, EmbeddingSlot.model_name).where(EmbeddingSlot.is_active)
+    )
+    row = result.first()
+    if row is None:
+        return ActiveSlot(EMBEDDING_SLOTS[0], settings.EMBED_MODEL_NAME)
+    return ActiveSlot(row.name, row.model_name or settings.EMBED_MODEL_NAME)
+
+
+class PgVectorIndex:
+    """Exact/HNSW cosine search in PostgreSQL via pgvector."""
+
+    name = "pgvector"
+
+    def __init__(self, slot: str = EMBEDDING_SLOTS[0]):
+        self.slot = slot
+        self.column = slot_column(slot)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query_embedding: np.ndarray,
+        top_k: int,
+    ) -> list[tuple[int, float]]:
+        """Find the nearest pericopes.
+
+        Args:
+            db: Database session
+            query_embedding: Normalized query vector
+            top_k: Number of hits
+
+        Returns:
+            (pericope id, cosine similarity) pairs, best first
+        """
+        # Note: cosine_distance = 1 - cosine_similarity, so lower is better
+        stmt = (
+            select(
+                Pericope.id,
+                self.column.cosine_distance(query_embedding.tolist()).label("distance"),
+            )
+            .where(self.column.isnot(None))
+            .order_by("distance")
+            .limit(top_k)
+        )
+        result = await db.execute(stmt)
+        return [(row.id, 1.0 - row.distance) for row in result.all()]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend description."""
+        return {"backend": self.name, "slot": self.slot}
+
+
+class NumpyDenseIndex:
+    """In-process exact or quantized cosine search over a float32 matrix."""
+
+    name = "numpy"
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        quantization: str = "none",
+        rerank_factor: int | None = None,
+    ):
+        """Build the index.
+
+        Args:
+            ids: Pericope ids, one per row
+            vectors: L2-normalized float32 matrix (n, dim)
+            quantization: "none", "int8" or "binary"
+            rerank_factor: Candidates per hit re-scored with float vectors
+        """
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown dense index quantization: {quantization}")
+
+        self.ids = ids
+        self.vectors = vectors
+        self.quantization = quantization
+        self.rerank_factor = rerank_factor or settings.DENSE_INDEX_RERANK_FACTOR
+
+        if quantization == "int8":
+            # Per-vector symmetric scale
+            scales = np.abs(vectors).max(axis=1, keepdims=True)
+            scales[scales == 0] = 1.0
+            self._codes = np.round(vectors / scales * 127).astype(np.int8)
+            self._scales = (scales[:, 0] / 127).astype(np.float32)
+        elif quantization == "binary":
+            self._codes = np.packbits(vectors > 0, axis=1)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        query_embedding: np.ndarray,
+        top_k: int,
+    ) -> list[tuple[int, float]]:
+        """Find the nearest pericopes (db is unused; kept for a shared interface)."""
+        return self.search_vector(query_embedding, top_k)
+
+    def search_vector(self, query_embedding: np.ndarray, top_k: int) -> list[tuple[int, float]]:
+        """Synchronous top-k search.
+
+        Args:
+            query_embedding: Normalized query vector
+            top_k: Number of hits
+
+        Returns:
+            (pericope id, cosine similarity) pairs, best first
+        """
+        if not len(self.ids) or top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+
+        if self.quantization == "none":
+            scores = self.vectors @ query
+            rows = _top_k(scores, top_k)
+            return [(int(self.ids[r]), float(scores[r])) for r in rows]
+
+        if self.quantization == "int8":
+            scale = float(np.abs(query).max()) or 1.0
+            codes = np.round(query / scale * 127).astype(np.int8)
+            approx = np.matmul(self._codes, codes, dtype=np.int32) * self._scales
+        else:
+            codes = np.packbits(query > 0)
+            # Fewer differing bits means more similar
+            approx = -_POPCOUNT[self._codes ^ codes].sum(axis=1, dtype=np.int32)
+
+        # Re-rank the best candidates with exact float scores
+        rows = np.sort(_top_k(approx, top_k * self.rerank_factor))
+        exact = self.vectors[rows] @ query
+        return [(int(self.ids[rows[i]]), float(exact[i])) for i in _top_k(exact, top_k)]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend, size and quantization."""
+        return {
+            "backend": self.name,
+            "vectors": len(self.ids),
+            "dim": int(self.vectors.shape[1]) if self.vectors.ndim == 2 else 0,
+            "quantization": self.quantization,
+            "rerank_factor": self.rerank_factor,
+        }
+
+
+async def load_vectors(
+    db: AsyncSession,
+    slot: str = EMBEDDING_SLOTS[0],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fetch pericope ids and L2-normalized embeddings of a slot from PostgreSQL."""
+    column = slot_column(slot)
+    result = await db.execute(
+        select(Pericope.id, column.label("embedding"))
+        .where(column.isnot(None))
+        .order_by(Pericope.id)
+    )
+    rows = result.all()
+
+    ids = np.array([row.id for row in rows], dtype=np.int32)
+    if not rows:
+        return ids, np.zeros((0, column.type.dim), dtype=np.float32)
+
+    vectors = np.ascontiguousarray(
+        np.stack([np.asarray(row.embedding, dtype=np.float32) for row in rows])
+    )
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+    return ids, vectors
+
+
+async def slot_version(db: AsyncSession, slot: str) -> str:
+    """Version of a slot's vectors, from the ids, models and content hashes they were embedded from."""
+    slot_column(slot)
+    result = await db.execute(
+        select(
+            func.count(Pericope.id),
+            content_digest(
+                Pericope.id,
+                getattr(Pericope, f"{slot}_model"),
+                getattr(Pericope, f"{slot}_hash"),
+            ),
+        ).where(slot_column(slot).isnot(None))
+    )
+    count, digest = result.one()
+    return f"{count}:{digest}"
+
+
+def _save_atomic(path: Path, array: np.ndarray) -> None:
+    tmp_path = path.with_name(f".tmp-{os.getpid()}-{path.name}")
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+def _write_snapshot(
+    ids_path: Path, vectors_path: Path, ids: np.ndarray, vectors: np.ndarray
+) -> None:
+    """Write the ids and vectors of a snapshot, each renamed into place.
+
+    Vectors are written last; their presence marks the snapshot complete.
+    """
+    _save_atomic(ids_path, ids)
+    _save_atomic(vectors_path, vectors)
+
+
+def _prune_snapshots(root: Path, keep: str) -> None:
+    """Remove superseded snapshots and temporary files left by crashed writers.
+
+    Called with the lock held. Workers still mapping an old vectors file keep
+    reading it until they reload.
+    """
+    for child in root.iterdir():
+        if child.name.startswith(".tmp-") or (
+            child.name.startswith("dense_") and not child.name.startswith(f"dense_{keep}_")
+        ):
+            child.unlink(missing_ok=True)
+
+
+async def load_numpy_index(
+    db: AsyncSession,
+    quantization: str | None = None,
+    path: str | None = None,
+    slot: ActiveSlot | None = None,
+    version: str | None = None,
+) -> NumpyDenseIndex:
+    """Build the numpy index, reusing the .npy snapshot for this slot version.
+
+    Args:
+        db: Database session
+        quantization: Override DENSE_INDEX_QUANTIZATION
+        path: Override DENSE_INDEX_PATH (empty keeps the matrix in memory only)
+        slot: Slot to load (default: the active slot)
+        version: Slot version (see slot_version), if already known
+
+    Returns:
+        NumpyDenseIndex
+    """
+    quantization = quantization or settings.DENSE_INDEX_QUANTIZATION
+    path = settings.DENSE_INDEX_PATH if path is None else path
+    slot = slot or await load_active_slot(db)
+    start = time.perf_counter()
+
+    if not path:
+        ids, vectors = await load_vectors(db, slot.name)
+    else:
+        root = Path(path)
+        version = version or await slot_version(db, slot.name)
+        version = f"{slot.name}|{slot.model_name}|{version}"
+        digest = hashlib.sha256(version.encode("utf-8")).hexdigest()[:16]
+        ids_path = root / f"dense_{digest}_ids.npy"
+        vectors_path = root / f"dense_{digest}_vectors.npy"
+
+        if not vectors_path.exists():
+            root.mkdir(parents=True, exist_ok=True)
+            # Concurrent workers serialize on a lock file so the snapshot is written once
+            fd = await asyncio.to_thread(acquire_lock, root / LOCK_FILE)
+            try:
+                # Another worker may have written it while we waited
+                if not vectors_path.exists():
+                    ids, vectors = await load_vectors(db, slot.name)
+                    await asyncio.to_thread(_write_snapshot, ids_path, vectors_path, ids, vectors)
+                    _prune_snapshots(root, keep=digest)
+            finally:
+                release_lock(fd)
+
+        ids = np.load(ids_path)
+        vectors = np.load(vectors_path, mmap_mode="r")
+
+    index = NumpyDenseIndex(ids, vectors, quantization)
+    logger.info(
+        f"Loaded numpy dense index: {len(index)} vectors from {slot.name}, "
+        f"quantization={quantization} "
+        f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+    )
+    return index
+
+
+# Singleton instances
+_dense_index: PgVectorIndex | NumpyDenseIndex | None = None
+_dense_index_key: tuple[ActiveSlot, str | None] | None = None
+_dense_index_lock = asyncio.Lock()
+_active_slot: ActiveSlot | None = None
+_active_slot_checked_at = 0.0
+_slot_version: tuple[str, str] | None = None
+_slot_version_checked_at = 0.0
+
+
+async def get_active_slot(db: AsyncSession) -> ActiveSlot:
+    """Get the active embedding slot, re-read every DENSE_SLOT_REFRESH_SECONDS."""
+    global _active_slot, _active_slot_checked_at
+    now = time.monotonic()
+    if _active_slot is None or now - _active_slot_checked_at >= settings.DENSE_SLOT_REFRESH_SECONDS:
+        slot = await load_active_slot(db)
+        if _active_slot is not None and slot != _active_slot:
+            logger.info(f"Active embedding slot changed: {_active_slot.name} -> {slot.name}")
+        _active_slot, _active_slot_checked_at = slot, now
+    return _active_slot
+
+
+async def get_slot_version(db: AsyncSession, slot: str) -> str:
+    """Get the version of a slot's vectors, re-read every CORPUS_VERSION_CHECK_SECONDS."""
+    global _slot_version, _slot_version_checked_at
+    now = time.monotonic()
+    if (
+        _slot_version is None
+        or _slot_version[0] != slot
+        or now - _slot_version_checked_at >= settings.CORPUS_VERSION_CHECK_SECONDS
+    ):
+        _slot_version, _slot_version_checked_at = (slot, await slot_version(db, slot)), now
+    return _slot_version[1]
+
+
+async def get_dense_index(db: AsyncSession) -> PgVectorIndex | NumpyDenseIndex:
+    """Get or create the configured dense index backend (DENSE_INDEX_BACKEND).
+
+    Every lookup compares the index against the active slot and, for the
+    numpy backend, the version of the active slot's vectors, so the index is
+    rebuilt after a slot flip or after vectors are rewritten in place.
+    """
+    global _dense_index, _dense_index_key
+    slot = await get_active_slot(db)
+    version = (
+        await get_slot_version(db, slot.name) if settings.DENSE_INDEX_BACKEND == "numpy" else None
+    )
+    key = (slot, version)
+    if _dense_index is not None and _dense_index_key == key:
+        return _dense_index
+
+    async with _dense_index_lock:
+        if _dense_index is None or _dense_index_key != key:
+            if settings.DENSE_INDEX_BACKEND == "numpy":
+                try:
+                    _dense_index = await load_numpy_index(db, slot=slot, version=version)
+                except Exception as e:
+                    logger.warning(f"Failed to load numpy dense index, using pgvector: {e}")
+                    _dense_index = PgVectorIndex(slot.name)
+            else:
+                _dense_index = PgVectorIndex(slot.name)
+            _dense_index_key = key
+    return _dense_index
+
+
+async def init_dense_index() -> None:
+    """Warm the dense index at startup so the first query does not load it."""
+    if settings.DENSE_INDEX_BACKEND != "numpy":
+        return
+    async with async_session_maker() as db:
+        await get_dense_index(db)
@@ -1,37 +1,187 @@
 """Embedding service using bge-m3."""
 
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
 
 from app.core.config import settings
+from app.core.metrics import EMBEDDING_BATCH_DURATION, EMBEDDING_BATCH_SIZE, EMBEDDING_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+class QueryMicroBatcher:
+    """Coalesces concurrent single-text encode requests into batches.
+
+    Callers enqueue a text and await a future. A background task drains the
+    queue, waiting at most ``max_wait_ms`` after the first item for more to
+    arrive (up to ``max_batch_size``), runs one forward pass on the inference
+    executor and resolves each caller's future with its own vector.
+    """
+
+    def __init__(
+        self,
+        service: "EmbeddingService",
+        max_batch_size: int,
+        max_wait_ms: float,
+    ):
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def depth(self) -> int:
+        """Number of requests waiting to be batched."""
+        return self.queue.qsize()
+
+    def start(self) -> None:
+        """Start the background batching task on the running loop."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="embedding-batcher")
+
+    async def stop(self) -> None:
+        """Stop the background task and fail any pending requests."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Embedding service is shutting down"))
+
+    async def submit(self, text: str) -> np.ndarray:
+        """Enqueue a text and wait for its dense embedding."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            # Drop requests whose callers have gone away
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            try:
+                output = await self.service.run_inference(texts)
+                vectors = output["dense_vecs"]
+            except Exception as e:
+                logger.error(f"Embedding batch of {len(texts)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
 
 
 class EmbeddingService:
-    """Service for generating embeddings using bge-m3."""
+    """Service for generating embeddings using bge-m3.
+
+    Inference runs on a dedicated single-thread executor so the forward pass
+    never blocks the event loop; concurrent query encodes are micro-batched.
+    """
 
     def __init__(self, model_name: str | None = None):
         self.model_name = model_name or settings.EMBED_MODEL_NAME
         self.model = None
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self.batcher = QueryMicroBatcher(
+            self,
+            max_batch_size=settings.EMBED_QUERY_MAX_BATCH_SIZE,
+            max_wait_ms=settings.EMBED_QUERY_MAX_WAIT_MS,
+        )
 
     async def initialize(self) -> None:
         """Initialize the embedding model."""
         if self._initialized:
             return
 
-        try:
-            from FlagEmbedding import BGEM3FlagModel
+        async with self._init_lock:
+            if self._initialized:
+                return
 
-            self.model = BGEM3FlagModel(
-                self.model_name,
-                use_fp16=settings.EMBED_USE_FP16,
+            try:
+                from FlagEmbedding import BGEM3FlagModel
+            except ImportError:
+                raise RuntimeError(
+                    "FlagEmbedding not installed. Run: pip install FlagEmbedding"
+                )
+
+            loop = asyncio.get_running_loop()
+            self.model = await loop.run_in_executor(
+                self._executor,
+                lambda: BGEM3FlagModel(self.model_name, use_fp16=settings.EMBED_USE_FP16),
             )
             self._initialized = True
-        except ImportError:
-            raise RuntimeError(
-                "FlagEmbedding not installed. Run: pip install FlagEmbedding"
-            )
+
+    async def close(self) -> None:
+        """Stop the batcher and release the inference executor."""
+        await self.batcher.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run_inference(
+        self,
+        texts: list[str],
+        return_sparse: bool = False,
+    ) -> dict[str, Any]:
+        """Run one forward pass on the inference executor.
+
+        Args:
+            texts: Texts to encode as a single batch
+            return_sparse: Whether to also compute sparse lexical weights
+
+        Returns:
+            Raw BGEM3FlagModel output dict
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        output = await loop.run_in_executor(
+            self._executor,
+            lambda: self.model.encode(
+                texts,
+                return_dense=True,
+                return_sparse=return_sparse,
+                return_colbert_vecs=False,
+            ),
+        )
+        EMBEDDING_BATCH_DURATION.observe(time.perf_counter() - start)
+        EMBEDDING_BATCH_SIZE.observe(len(texts))
+        return output
 
     async def encode(
         self,
@@ -50,15 +200,14 @@ class EmbeddingService:
         if not self._initialized:
             await self.initialize()
 
+        # Single dense-only requests share forward passes with concurrent callers
+        if isinstance(text, str) and not return_sparse:
+            return await self.batcher.submit(text)
+
         if isinstance(text, str):
             text = [text]
 
-        output = self.model.encode(
-            text,
-            return_dense=True,
-            return_sparse=return_sparse,
-            return_colbert_vecs=False,
-        )
+        output = await self.run_inference(text, return_sparse=return_sparse)
 
         if return_sparse:
             return {
@@ -93,15 +242,57 @@ class EmbeddingService:
         # Cosine similarity
         return np.dot(doc_norms, query_norm)
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth and batcher settings.
+
+        Batch size and latency histograms are exported on /metrics.
+        """
+        return {
+            "initialized": self._initialized,
+            "model": self.model_name,
+            "queue_depth": self.batcher.depth,
+            "max_batch_size": self.batcher.max_batch_size,
+            "max_wait_ms": self.batcher.max_wait * 1000,
+        }
+
+
+# Singleton instances, one per model
+_embedding_services: dict[str, EmbeddingService] = {}
+
+# One callback over every live batcher (several models may be loaded)
+EMBEDDING_QUEUE_DEPTH.set_function(
+    lambda: sum(service.batcher.depth for service in _embedding_services.values())
+)
+
+
+async def get_embedding_service(model_name: str | None = None) -> EmbeddingService:
+    """Get or create the embedding service for a model (default: EMBED_MODEL_NAME).
+
+    A second model is only loaded when the active embedding slot was built
+    with it (see dense_index.get_active_slot).
+    """
+    model_name = model_name or settings.EMBED_MODEL_NAME
+    service = _embedding_services.get(model_name)
+    if service is None:
+        service = _embedding_services[model_name] = EmbeddingService(model_name)
+    await service.initialize()
+    return service
+
+
+def get_embedding_stats() -> dict[str, Any] | None:
+    """Get embedding stats of the default model without creating the service.
 
-# Singleton instance
-_embedding_service: EmbeddingService | None = None
+    Returns:
+        Stats dict, or None if the service has not been created yet
+    """
+    service = _embedding_services.get(settings.EMBED_MODEL_NAME)
+    if service is None:
+        return None
+    return service.get_stats()
 
 
-async def get_embedding_service() -> EmbeddingService:
-    """Get or create embedding service singleton."""
-    global _embedding_service
-    if _embedding_service is None:
-        _embedding_service = EmbeddingService()
-        await _embedding_service.initialize()
-    return _embedding_service
+async def close_embedding_service() -> None:
+    """Shut down every embedding service that was created."""
+    for service in _embedding_services.values():
+        await service.close()
+    _embedding_services.clear()
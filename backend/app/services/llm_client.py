@@ -1,8 +1,20 @@
 """Ollama LLM client service."""
 
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
 from ollama import AsyncClient
 
 from app.core.config import settings
+from app.core.metrics import (
+    LLM_GENERATED_TOKENS,
+    LLM_PROMPT_TOKENS,
+    LLM_REQUEST_DURATION,
+    LLM_REQUEST_ERRORS,
+    LLM_REQUESTS_IN_FLIGHT,
+)
+from app.services.tracing import Span, span
 
 
 class OllamaLLMClient:
@@ -35,23 +47,112 @@ class OllamaLLMClient:
         Returns:
             Generated text
         """
+        LLM_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            with span("llm.chat", model=self.model) as s:
+                response = await self.client.chat(
+                    model=self.model,
+                    messages=self._build_messages(prompt, system_prompt),
+                    options=self._build_options(temperature, max_tokens),
+                )
+                self._record_usage(s, response)
+        except Exception:
+            LLM_REQUEST_ERRORS.inc(stream="false")
+            raise
+        finally:
+            LLM_REQUESTS_IN_FLIGHT.dec()
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - start, stream="false")
+
+        return response["message"]["content"]
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Generate text response from prompt, yielding chunks as they arrive.
+
+        Closing the returned iterator closes the underlying HTTP stream,
+        which makes Ollama abort the generation.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Sampling temperature (default from settings)
+            max_tokens: Max tokens to generate (default from settings)
+
+        Yields:
+            Generated text chunks
+        """
+        LLM_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            with span("llm.chat", model=self.model, stream=True) as s:
+                stream = await self.client.chat(
+                    model=self.model,
+                    messages=self._build_messages(prompt, system_prompt),
+                    options=self._build_options(temperature, max_tokens),
+                    stream=True,
+                )
+
+                try:
+                    async for chunk in stream:
+                        content = chunk["message"]["content"]
+                        if content:
+                            yield content
+                        if chunk.get("done"):
+                            # Token counts arrive on the final chunk
+                            self._record_usage(s, chunk)
+                finally:
+                    await stream.aclose()
+        except Exception:
+            LLM_REQUEST_ERRORS.inc(stream="true")
+            raise
+        finally:
+            LLM_REQUESTS_IN_FLIGHT.dec()
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - start, stream="true")
+
+    @staticmethod
+    def _record_usage(s: Span, response: Any) -> None:
+        """Record Ollama token counts and throughput on a span and in metrics."""
+        prompt_eval_count = response.get("prompt_eval_count") or 0
+        eval_count = response.get("eval_count") or 0
+        eval_duration = response.get("eval_duration") or 0  # nanoseconds
+
+        s.attributes.update(
+            prompt_eval_count=prompt_eval_count,
+            eval_count=eval_count,
+            eval_duration_ms=round(eval_duration / 1e6, 2),
+            tokens_per_second=(
+                round(eval_count / (eval_duration / 1e9), 2) if eval_duration else None
+            ),
+        )
+        LLM_PROMPT_TOKENS.inc(prompt_eval_count)
+        LLM_GENERATED_TOKENS.inc(eval_count)
+
+    def _build_messages(self, prompt: str, system_prompt: str | None) -> list[dict]:
+        """Build chat messages from user and optional system prompt."""
         messages = []
 
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
 
         messages.append({"role": "user", "content": prompt})
+        return messages
 
-        response = await self.client.chat(
-            model=self.model,
-            messages=messages,
-            options={
-                "temperature": temperature or settings.LLM_TEMPERATURE,
-                "num_predict": max_tokens or settings.LLM_MAX_TOKENS,
-            },
-        )
-
-        return response["message"]["content"]
+    def _build_options(
+        self,
+        temperature: float | None,
+        max_tokens: int | None,
+    ) -> dict:
+        """Build Ollama sampling options."""
+        return {
+            "temperature": temperature or settings.LLM_TEMPERATURE,
+            "num_predict": max_tokens or settings.LLM_MAX_TOKENS,
+        }
 
     async def classify_query(self, query: str) -> str:
         """Classify a query into predefined types.
@@ -112,6 +213,52 @@ class OllamaLLMClient:
         Returns:
             Generated answer in markdown
         """
+        system_prompt, prompt = self._build_answer_prompts(query, context, query_type)
+
+        return await self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=settings.LLM_TEMPERATURE,
+            max_tokens=settings.LLM_MAX_TOKENS,
+        )
+
+    async def generate_answer_stream(
+        self,
+        query: str,
+        context: str,
+        query_type: str,
+    ) -> AsyncIterator[str]:
+        """Stream an answer based on query and context.
+
+        Args:
+            query: User query
+            context: Retrieved context (formatted pericopes)
+            query_type: Classified query type
+
+        Yields:
+            Answer chunks in markdown
+        """
+        system_prompt, prompt = self._build_answer_prompts(query, context, query_type)
+
+        stream = self.generate_stream(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=settings.LLM_TEMPERATURE,
+            max_tokens=settings.LLM_MAX_TOKENS,
+        )
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    def _build_answer_prompts(
+        self,
+        query: str,
+        context: str,
+        query_type: str,
+    ) -> tuple[str, str]:
+        """Build (system_prompt, user_prompt) for answer generation."""
         system_prompt = """你是一個專業的聖經知識助手。請根據提供的聖經經文內容回答用戶的問題。
 
 回答指南：
@@ -141,12 +288,7 @@ class OllamaLLMClient:
 
 請根據以上經文回答用戶的問題。"""
 
-        return await self.generate(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=settings.LLM_TEMPERATURE,
-            max_tokens=settings.LLM_MAX_TOKENS,
-        )
+        return system_prompt, prompt
 
 
 # Singleton instance
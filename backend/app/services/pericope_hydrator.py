@@ -0,0 +1,171 @@
+"""Batched pericope hydration shared by the retrievers.
+
+Retrievers first find pericope ids (pgvector, FTS, Cypher) and then need the
+book name and full verse text of each hit. This service fetches both for a
+whole id list in a single query and keeps the results in a bounded LRU cache,
+which is cleared when the corpus version changes. When the memory-mapped
+corpus store is loaded, hits are served from it without touching the database.
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.orm import Book, Pericope, Verse
+from app.services.corpus_store import CorpusStore, get_corpus_store, get_corpus_version
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HydratedPericope:
+    """Pericope with book name and ordered verse text."""
+
+    id: int
+    book_id: int
+    book_name: str
+    chapter_start: int
+    verse_start: int
+    chapter_end: int
+    verse_end: int
+    title: str
+    text: str
+
+
+class PericopeHydrator:
+    """Fetches pericope details for many ids at once, with an LRU cache."""
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = max_entries or settings.PERICOPE_CACHE_SIZE
+        self._cache: OrderedDict[int, HydratedPericope] = OrderedDict()
+        self._version: str | None = None
+        self.hits = 0
+        self.misses = 0
+
+    async def hydrate(
+        self,
+        db: AsyncSession,
+        pericope_ids: list[int],
+    ) -> dict[int, HydratedPericope]:
+        """Get details for a list of pericope ids.
+
+        Args:
+            db: Database session used for cache misses
+            pericope_ids: Pericope ids (duplicates allowed)
+
+        Returns:
+            Mapping of id to HydratedPericope (unknown ids are omitted)
+        """
+        store = await get_corpus_store(db)
+        if store is not None:
+            return self._from_store(store, pericope_ids)
+
+        version = await get_corpus_version(db)
+        if version != self._version:
+            self._cache.clear()
+            self._version = version
+
+        found: dict[int, HydratedPericope] = {}
+        missing: list[int] = []
+
+        for pericope_id in dict.fromkeys(pericope_ids):
+            cached = self._cache.get(pericope_id)
+            if cached is not None:
+                self._cache.move_to_end(pericope_id)
+                found[pericope_id] = cached
+            else:
+                missing.append(pericope_id)
+
+        self.hits += len(found)
+        self.misses += len(missing)
+
+        if missing:
+            for pericope in await self._fetch(db, missing):
+                found[pericope.id] = pericope
+                self._store(pericope)
+
+        return found
+
+    def _from_store(
+        self,
+        store: CorpusStore,
+        pericope_ids: list[int],
+    ) -> dict[int, HydratedPericope]:
+        """Build hits from the corpus store (no cache needed)."""
+        found: dict[int, HydratedPericope] = {}
+        for pericope_id in dict.fromkeys(pericope_ids):
+            pericope = store.pericope(pericope_id)
+            book = store.book(pericope.book_id) if pericope else None
+            if pericope is None or book is None:
+                continue
+            found[pericope_id] = HydratedPericope(
+                id=pericope.id,
+                book_id=pericope.book_id,
+                book_name=book.name_zh,
+                chapter_start=pericope.chapter_start,
+                verse_start=pericope.verse_start,
+                chapter_end=pericope.chapter_end,
+                verse_end=pericope.verse_end,
+                title=pericope.title,
+                text=store.pericope_text(pericope_id),
+            )
+        self.hits += len(found)
+        return found
+
+    async def _fetch(self, db: AsyncSession, pericope_ids: list[int]) -> list[HydratedPericope]:
+        """Fetch pericopes with book names and verse text in one query."""
+        verse_text = func.string_agg(
+            Verse.text,
+            aggregate_order_by(literal("\n"), Verse.chapter, Verse.verse),
+        )
+
+        stmt = (
+            select(
+                Pericope.id,
+                Pericope.book_id,
+                Book.name_zh.label("book_name"),
+                Pericope.chapter_start,
+                Pericope.verse_start,
+                Pericope.chapter_end,
+                Pericope.verse_end,
+                Pericope.title,
+                func.coalesce(verse_text, "").label("text"),
+            )
+            .join(Book, Pericope.book_id == Book.id)
+            .outerjoin(Verse, Verse.pericope_id == Pericope.id)
+            .where(Pericope.id.in_(pericope_ids))
+            .group_by(Pericope.id, Book.name_zh)
+        )
+
+        result = await db.execute(stmt)
+        return [HydratedPericope(**row._asdict()) for row in result.all()]
+
+    def _store(self, pericope: HydratedPericope) -> None:
+        self._cache[pericope.id] = pericope
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache hit/miss counters."""
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Singleton instance
+_pericope_hydrator: PericopeHydrator | None = None
+
+
+def get_pericope_hydrator() -> PericopeHydrator:
+    """Get or create the pericope hydrator singleton."""
+    global _pericope_hydrator
+    if _pericope_hydrator is None:
+        _pericope_hydrator = PericopeHydrator()
+    return _pericope_hydrator
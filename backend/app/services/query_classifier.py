@@ -0,0 +1,127 @@
+"""Embedding-centroid query classifier.
+
+Classifies a query into one of the ``QueryType`` labels by cosine similarity
+between its bge-m3 embedding and per-type centroids built offline by
+``scripts/build_query_classifier.py``.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Classification:
+    """Result of centroid classification."""
+
+    query_type: str
+    confidence: float
+    similarity: float
+
+
+class QueryClassifier:
+    """Nearest-centroid classifier over query embeddings."""
+
+    def __init__(
+        self,
+        labels: list[str],
+        centroids: np.ndarray,
+        temperature: float | None = None,
+    ):
+        """Initialize classifier.
+
+        Args:
+            labels: Query type label per centroid row
+            centroids: (n_labels, dim) L2-normalized centroid matrix
+            temperature: Softmax temperature applied to cosine similarities
+        """
+        self.labels = labels
+        self.centroids = centroids.astype(np.float32)
+        self.temperature = temperature or settings.QUERY_CLASSIFIER_TEMPERATURE
+
+    @classmethod
+    def load(cls, path: Path) -> "QueryClassifier":
+        """Load centroids saved by the build script.
+
+        Args:
+            path: Path to the .npz file
+
+        Returns:
+            QueryClassifier instance
+
+        Raises:
+            ValueError: If the centroids were built with a different embedding model
+        """
+        with np.load(path, allow_pickle=False) as data:
+            model_name = str(data["model_name"])
+            if model_name != settings.EMBED_MODEL_NAME:
+                raise ValueError(
+                    f"Centroids built with {model_name}, "
+                    f"but EMBED_MODEL_NAME is {settings.EMBED_MODEL_NAME}"
+                )
+            labels = [str(label) for label in data["labels"]]
+            centroids = data["centroids"]
+
+        return cls(labels, centroids)
+
+    def classify(self, query_embedding: np.ndarray) -> Classification:
+        """Classify a query embedding.
+
+        Args:
+            query_embedding: Dense bge-m3 query vector
+
+        Returns:
+            Classification with softmax confidence of the best label
+        """
+        vector = np.asarray(query_embedding, dtype=np.float32)
+        vector = vector / (np.linalg.norm(vector) or 1.0)
+
+        similarities = self.centroids @ vector
+        logits = similarities / self.temperature
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+
+        best = int(np.argmax(probs))
+        return Classification(
+            query_type=self.labels[best],
+            confidence=float(probs[best]),
+            similarity=float(similarities[best]),
+        )
+
+
+# Singleton instance (None after a failed load so we only try once)
+_query_classifier: QueryClassifier | None = None
+_load_attempted = False
+
+
+def get_query_classifier() -> QueryClassifier | None:
+    """Get the classifier singleton.
+
+    Returns:
+        QueryClassifier, or None if no centroids are available
+    """
+    global _query_classifier, _load_attempted
+    if _load_attempted:
+        return _query_classifier
+
+    _load_attempted = True
+    path = Path(settings.QUERY_CLASSIFIER_PATH)
+    if not path.exists():
+        logger.info(f"No query classifier at {path}; using LLM classification")
+        return None
+
+    try:
+        _query_classifier = QueryClassifier.load(path)
+        logger.info(
+            f"Loaded query classifier with {len(_query_classifier.labels)} centroids from {path}"
+        )
+    except Exception as e:
+        logger.warning(f"Failed to load query classifier from {path}: {e}")
+
+    return _query_classifier
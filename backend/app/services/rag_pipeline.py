@@ -1,26 +1,110 @@
 """RAG Pipeline for Bible knowledge retrieval and generation."""
 
+import asyncio
+import logging
 import time
+from collections.abc import AsyncIterator, Awaitable
+from dataclasses import dataclass, field
 from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession
+import numpy as np
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import settings
+from app.core.database import async_session_maker
 from app.core.neo4j_client import Neo4jClient
+from app.models.orm import Book, Pericope, Verse
 from app.models.schemas import (
     GraphContext,
+    LLMUsage,
     PericopeSegment,
     QueryMeta,
     QueryResponse,
+    RetrieverStat,
 )
 from app.services.context_builder import ContextBuilder
+from app.services.corpus_store import CorpusStore, get_corpus_store
 from app.services.embedding_service import EmbeddingService
-from app.services.fusion import RRFFusion
+from app.services.fusion import FusedResult, RRFFusion
 from app.services.llm_client import OllamaLLMClient
+from app.services.pericope_hydrator import get_pericope_hydrator
+from app.services.query_classifier import get_query_classifier
+from app.services.reference_parser import VerseReference, get_reference_parser
+from app.services.semantic_cache import cache_scope, get_semantic_cache
+from app.services.tracing import current_trace, export_trace, span, trace_request
 from app.services.retrievers.dense_retriever import DenseRetriever
 from app.services.retrievers.sparse_retriever import SparseRetriever
 from app.services.retrievers.graph_retriever import GraphRetriever
 
+logger = logging.getLogger(__name__)
+
+NO_RESULTS_ANSWER = "抱歉，我找不到與您問題相關的聖經經文。請嘗試用不同的方式描述您的問題。"
+
+
+@dataclass
+class RetrieverOutcome:
+    """Outcome of a single retriever run within the fan-out."""
+
+    name: str
+    results: list = field(default_factory=list)
+    time_ms: float = 0.0
+    timed_out: bool = False
+    error: str | None = None
+
+    def to_stat(self) -> RetrieverStat:
+        """Convert to the response metadata schema."""
+        return RetrieverStat(
+            name=self.name,
+            time_ms=round(self.time_ms, 2),
+            result_count=len(self.results),
+            timed_out=self.timed_out,
+            error=self.error,
+        )
+
+
+@dataclass
+class PreparedQuery:
+    """Retrieval-side state shared by the blocking and streaming paths."""
+
+    query: str
+    query_type: str
+    start_time: float
+    outcomes: list[RetrieverOutcome]
+    fused_results: list[FusedResult]
+    context: str
+    segments: list[PericopeSegment]
+    graph_context: GraphContext | None = None
+    classification_ms: float | None = None
+    classification_source: str | None = None
+    # Set when the answer is produced without the LLM (explicit verse lookup)
+    answer: str | None = None
+
+
+@dataclass
+class ReferenceVerse:
+    """A verse fetched for a reference lookup, with its pericope."""
+
+    book_id: int
+    chapter: int
+    verse: int
+    text: str
+    pericope_id: int | None
+    book_name: str
+    pericope_title: str | None
+    pericope_chapter_start: int | None
+    pericope_verse_start: int | None
+    pericope_chapter_end: int | None
+    pericope_verse_end: int | None
+
+
+@dataclass
+class StreamEvent:
+    """A single server-sent event emitted by the streaming pipeline."""
+
+    event: str
+    data: dict[str, Any]
+
 
 class RAGPipeline:
     """Main RAG pipeline orchestrator."""
@@ -31,15 +115,17 @@ class RAGPipeline:
         embed_service: EmbeddingService,
         llm_client: OllamaLLMClient,
         use_graph: bool = True,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
     ):
         self.db = db
         self.embed_service = embed_service
         self.llm_client = llm_client
         self.use_graph = use_graph
+        # Each retriever opens its own session so they can run concurrently;
+        # a single AsyncSession must not be shared between tasks.
+        self.session_factory = session_factory or async_session_maker
 
         # Initialize components
-        self.dense_retriever = DenseRetriever(db, embed_service)
-        self.sparse_retriever = SparseRetriever(db)
         self.graph_retriever = GraphRetriever(llm_client) if use_graph else None
         self.fusion = RRFFusion()
         self.context_builder = ContextBuilder()
@@ -55,100 +141,219 @@ class RAGPipeline:
         Args:
             query: User query text
             mode: Query mode (auto, verse, topic, person, event)
-            options: Additional options (max_results, include_graph)
+            options: Additional options (max_results, include_graph, debug)
 
         Returns:
             QueryResponse with answer and sources
         """
+        debug = bool((options or {}).get("debug"))
+        with trace_request(query, debug=debug) as trace:
+            response = await self._execute(query, mode, options)
+        export_trace(trace)
+        return response
+
+    async def _execute(
+        self,
+        query: str,
+        mode: str,
+        options: dict[str, Any] | None,
+    ) -> QueryResponse:
+        """Run the pipeline within an active trace."""
+        query_embedding = None
+        prepared = await self._lookup_references(query, mode)
+
+        if prepared is None:
+            cached, query_embedding = await self._lookup_cache(query, mode, options)
+            if cached is not None:
+                self._apply_trace(cached.meta)
+                return cached
+            prepared = await self._prepare(query, mode, options, query_embedding)
+
+        # Step 5: Generate answer
+        if prepared.answer is not None:
+            answer = prepared.answer
+        elif prepared.fused_results:
+            with span("generation"):
+                answer = await self.llm_client.generate_answer(
+                    query=query,
+                    context=prepared.context,
+                    query_type=prepared.query_type,
+                )
+        else:
+            answer = NO_RESULTS_ANSWER
+
+        # Step 6: Build response
+        response = QueryResponse(
+            answer=answer,
+            segments=prepared.segments,
+            meta=self._build_meta(prepared),
+            graph_context=prepared.graph_context,
+        )
+        await self._store_cache(prepared, query_embedding, mode, options, response)
+        return response
+
+    async def execute_stream(
+        self,
+        query: str,
+        mode: str = "auto",
+        options: dict[str, Any] | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Execute the RAG pipeline, yielding events as each stage completes.
+
+        Emits a ``segments`` event as soon as fusion finishes, one ``token``
+        event per generated chunk, and a final ``meta`` event. Closing the
+        iterator (e.g. on client disconnect) cancels LLM generation.
+
+        Args:
+            query: User query text
+            mode: Query mode (auto, verse, topic, person, event)
+            options: Additional options (max_results, include_graph, debug)
+
+        Yields:
+            StreamEvent instances
+        """
+        debug = bool((options or {}).get("debug"))
+        with trace_request(query, debug=debug) as trace:
+            events = self._execute_stream(query, mode, options)
+            try:
+                async for event in events:
+                    yield event
+            finally:
+                await events.aclose()
+        export_trace(trace)
+
+    async def _execute_stream(
+        self,
+        query: str,
+        mode: str,
+        options: dict[str, Any] | None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Run the streaming pipeline within an active trace."""
+        query_embedding = None
+        prepared = await self._lookup_references(query, mode)
+
+        if prepared is None:
+            cached, query_embedding = await self._lookup_cache(query, mode, options)
+            if cached is not None:
+                yield StreamEvent(
+                    event="segments",
+                    data={
+                        "segments": [s.model_dump() for s in cached.segments],
+                        "graph_context": (
+                            cached.graph_context.model_dump() if cached.graph_context else None
+                        ),
+                    },
+                )
+                yield StreamEvent(event="token", data={"text": cached.answer})
+                yield StreamEvent(event="meta", data=self._apply_trace(cached.meta).model_dump())
+                return
+            prepared = await self._prepare(query, mode, options, query_embedding)
+
+        yield StreamEvent(
+            event="segments",
+            data={
+                "segments": [s.model_dump() for s in prepared.segments],
+                "graph_context": (
+                    prepared.graph_context.model_dump() if prepared.graph_context else None
+                ),
+            },
+        )
+
+        if prepared.answer is not None:
+            yield StreamEvent(event="token", data={"text": prepared.answer})
+        elif prepared.fused_results:
+            tokens = self.llm_client.generate_answer_stream(
+                query=query,
+                context=prepared.context,
+                query_type=prepared.query_type,
+            )
+            answer_parts = []
+            with span("generation", stream=True):
+                try:
+                    async for token in tokens:
+                        answer_parts.append(token)
+                        yield StreamEvent(event="token", data={"text": token})
+                finally:
+                    # Closes the upstream HTTP stream so Ollama stops generating
+                    await tokens.aclose()
+        else:
+            yield StreamEvent(event="token", data={"text": NO_RESULTS_ANSWER})
+
+        meta = self._build_meta(prepared)
+        yield StreamEvent(event="meta", data=meta.model_dump())
+
+        # Only reached when generation ran to completion
+        if prepared.answer is None and prepared.fused_results:
+            await self._store_cache(
+                prepared,
+                query_embedding,
+                mode,
+                options,
+                QueryResponse(
+                    answer="".join(answer_parts),
+                    segments=prepared.segments,
+                    meta=meta,
+                    graph_context=prepared.graph_context,
+                ),
+            )
+
+    async def _prepare(
+        self,
+        query: str,
+        mode: str,
+        options: dict[str, Any] | None,
+        query_embedding: np.ndarray | None = None,
+    ) -> PreparedQuery:
+        """Run classification, retrieval, fusion and context building.
+
+        Args:
+            query: User query text
+            mode: Query mode (auto, verse, topic, person, event)
+            options: Additional options (max_results, include_graph)
+            query_embedding: Query embedding if already computed
+
+        Returns:
+            PreparedQuery ready for answer generation
+        """
         start_time = time.time()
         options = options or {}
         max_results = options.get("max_results", settings.TOP_K_PERICOPES)
-        used_retrievers = []
 
         # Step 1: Classify query
-        if mode == "auto":
-            query_type = await self.llm_client.classify_query(query)
-        else:
-            query_type = mode.upper()
-
-        # Step 2: Run retrievers
-        # Dense retrieval (semantic)
-        try:
-            dense_results = await self.dense_retriever.retrieve(
-                query,
-                top_k=settings.MAX_RETRIEVE_RESULTS,
+        with span("classification") as s:
+            query_type, query_embedding, classification_ms, classification_source = (
+                await self._classify(query, mode, query_embedding)
             )
-            if dense_results:
-                used_retrievers.append("dense")
-        except Exception as e:
-            print(f"Dense retrieval error: {e}")
-            dense_results = []
+            s.attributes.update(query_type=query_type, source=classification_source)
 
-        # Sparse retrieval (keyword)
-        try:
-            sparse_results = await self.sparse_retriever.retrieve(
-                query,
-                top_k=settings.MAX_RETRIEVE_RESULTS,
+        # Step 2: Run retrievers concurrently
+        include_graph = options.get("include_graph", True)
+        with span("retrieval"):
+            outcomes = await self._run_retrievers(
+                query, query_type, include_graph, query_embedding
             )
-            if sparse_results:
-                used_retrievers.append("sparse")
-        except Exception as e:
-            print(f"Sparse retrieval error: {e}")
-            sparse_results = []
 
-        # Graph retrieval (knowledge graph)
-        graph_results = []
         graph_context_data: dict[str, list[str]] = {"topics": [], "persons": []}
-        include_graph = options.get("include_graph", True)
+        for outcome in outcomes:
+            if outcome.name == "graph" and outcome.results:
+                graph_context_data = self._build_graph_context(outcome.results)
 
-        if self.graph_retriever and include_graph and Neo4jClient.is_available():
-            try:
-                graph_results = await self.graph_retriever.retrieve(
-                    query,
-                    query_type=query_type,
-                    top_k=settings.MAX_RETRIEVE_RESULTS,
-                )
-                if graph_results:
-                    used_retrievers.append("graph")
-                    # Extract graph context
-                    graph_context_data = self._build_graph_context(graph_results)
-            except Exception as e:
-                print(f"Graph retrieval error: {e}")
-                graph_results = []
-
-        # Step 3: Fuse results
-        result_lists = []
-        if dense_results:
-            result_lists.append(("dense", dense_results))
-        if sparse_results:
-            result_lists.append(("sparse", sparse_results))
-        if graph_results:
-            result_lists.append(("graph", graph_results))
-
-        if result_lists:
-            fused_results = self.fusion.fuse(result_lists)
-        else:
-            fused_results = []
+        # Step 3: Fuse results (partial results are fused when a retriever timed out)
+        result_lists = [(o.name, o.results) for o in outcomes if o.results]
+
+        with span("fusion") as s:
+            if result_lists:
+                fused_results = self.fusion.fuse(result_lists)
+            else:
+                fused_results = []
 
-        # Limit to max_results
-        fused_results = fused_results[:max_results]
+            # Limit to max_results
+            fused_results = fused_results[:max_results]
+            s.attributes["results"] = _fused_ranks(fused_results, outcomes)
 
         # Step 4: Build context
         context, metadata = self.context_builder.build_with_metadata(fused_results)
 
-        # Step 5: Generate answer
-        if fused_results:
-            answer = await self.llm_client.generate_answer(
-                query=query,
-                context=context,
-                query_type=query_type,
-            )
-        else:
-            answer = "抱歉，我找不到與您問題相關的聖經經文。請嘗試用不同的方式描述您的問題。"
-
-        # Step 6: Build response
-        processing_time = int((time.time() - start_time) * 1000)
-
         segments = [
             PericopeSegment(
                 id=result.id,
@@ -173,18 +378,457 @@ class RAGPipeline:
                 related_persons=graph_context_data["persons"],
             )
 
-        return QueryResponse(
-            answer=answer,
+        return PreparedQuery(
+            query=query,
+            query_type=query_type,
+            start_time=start_time,
+            outcomes=outcomes,
+            fused_results=fused_results,
+            context=context,
             segments=segments,
-            meta=QueryMeta(
-                query_type=query_type,
-                used_retrievers=used_retrievers,
-                total_processing_time_ms=processing_time,
-                llm_model=settings.LLM_MODEL_NAME,
-            ),
             graph_context=graph_context,
+            classification_ms=classification_ms,
+            classification_source=classification_source,
         )
 
+    async def _classify(
+        self,
+        query: str,
+        mode: str,
+        query_embedding: np.ndarray | None = None,
+    ) -> tuple[str, np.ndarray | None, float | None, str]:
+        """Decide the query type.
+
+        In auto mode the query is embedded once and matched against the
+        query-type centroids; the LLM is only consulted when no centroids are
+        available or the best match is below QUERY_CLASSIFIER_THRESHOLD. The
+        embedding is returned so the dense retriever can reuse it.
+
+        Args:
+            query: User query text
+            mode: Query mode (auto, verse, topic, person, event)
+            query_embedding: Query embedding if already computed
+
+        Returns:
+            (query_type, query_embedding or None, classification_ms, source)
+        """
+        if mode != "auto":
+            return mode.upper(), query_embedding, None, "mode"
+
+        start = time.perf_counter()
+        source = "llm"
+
+        classifier = get_query_classifier()
+        if classifier is not None:
+            if query_embedding is None:
+                with span("embedding"):
+                    query_embedding = await self.embed_service.encode_query(query)
+            result = classifier.classify(query_embedding)
+            if result.confidence >= settings.QUERY_CLASSIFIER_THRESHOLD:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                return result.query_type, query_embedding, elapsed_ms, "embedding"
+
+            logger.debug(
+                f"Low classifier confidence ({result.query_type} "
+                f"{result.confidence:.2f}); falling back to LLM"
+            )
+            source = "llm_fallback"
+
+        query_type = await self.llm_client.classify_query(query)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return query_type, query_embedding, elapsed_ms, source
+
+    async def _lookup_cache(
+        self,
+        query: str,
+        mode: str,
+        options: dict[str, Any] | None,
+    ) -> tuple[QueryResponse | None, np.ndarray | None]:
+        """Look up a semantically equivalent earlier response.
+
+        Debug requests bypass the cache so they always return a fresh trace.
+
+        Args:
+            query: User query text
+            mode: Query mode (auto, verse, topic, person, event)
+            options: Additional options (max_results, include_graph, debug)
+
+        Returns:
+            (cached response or None, query embedding to reuse on a miss)
+        """
+        if not settings.SEMANTIC_CACHE_ENABLED or (options or {}).get("debug"):
+            return None, None
+
+        start_time = time.time()
+        with span("embedding"):
+            query_embedding = await self.embed_service.encode_query(query)
+
+        try:
+            cache = await get_semantic_cache(self.db)
+            await cache.refresh_fingerprint(self.db)
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable: {e}")
+            return None, query_embedding
+
+        with span("cache_lookup") as s:
+            hit = cache.lookup(cache_scope(mode, options or {}), query_embedding)
+            s.attributes["hit"] = hit is not None
+        if hit is None:
+            return None, query_embedding
+
+        response = QueryResponse.model_validate(hit.response)
+        response.meta.total_processing_time_ms = int((time.time() - start_time) * 1000)
+        response.meta.cache_hit = True
+        response.meta.cache_similarity = round(hit.similarity, 4)
+        logger.info(f"Semantic cache hit (similarity {hit.similarity:.3f}, saved {hit.saved_ms:.0f}ms)")
+        return response, query_embedding
+
+    async def _store_cache(
+        self,
+        prepared: PreparedQuery,
+        query_embedding: np.ndarray | None,
+        mode: str,
+        options: dict[str, Any] | None,
+        response: QueryResponse,
+    ) -> None:
+        """Cache a generated response.
+
+        Direct verse lookups, empty results and responses built from partial
+        retrieval (a retriever timed out or failed) are not cached.
+        """
+        if (
+            not settings.SEMANTIC_CACHE_ENABLED
+            or (options or {}).get("debug")
+            or query_embedding is None
+            or prepared.answer is not None
+            or not prepared.fused_results
+            or any(o.timed_out or o.error for o in prepared.outcomes)
+        ):
+            return
+
+        try:
+            cache = await get_semantic_cache(self.db)
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable: {e}")
+            return
+
+        cache.store(
+            cache_scope(mode, options or {}),
+            query_embedding,
+            response.model_dump(mode="json"),
+            latency_ms=response.meta.total_processing_time_ms,
+        )
+
+    async def _lookup_references(
+        self,
+        query: str,
+        mode: str,
+    ) -> PreparedQuery | None:
+        """Answer explicit verse references directly, skipping LLM and retrieval.
+
+        Only applies when the query is essentially just the reference
+        ("約3:16-18", "請給我詩篇23篇"); questions about a passage still go
+        through the full pipeline.
+
+        Args:
+            query: User query text
+            mode: Query mode (auto, verse, topic, person, event)
+
+        Returns:
+            PreparedQuery with a ready answer, or None to fall back
+        """
+        if not settings.VERSE_LOOKUP_FAST_PATH or mode not in ("auto", "verse"):
+            return None
+
+        start_time = time.time()
+        start = time.perf_counter()
+
+        with span("reference_lookup") as s:
+            parser = await get_reference_parser(self.db)
+            refs = parser.parse(query)
+            s.attributes["references"] = [r.label for r in refs]
+            if not refs or parser.residual(query, refs):
+                return None
+
+            rows = await self._fetch_reference_verses(refs)
+            s.attributes["verses"] = len(rows)
+        if not rows:
+            # Out-of-range reference (e.g. 約3:99); let the full pipeline handle it
+            return None
+
+        sections = []
+        segments: dict[int, PericopeSegment] = {}
+        excerpts: dict[int, list[str]] = {}
+
+        for ref in refs:
+            ref_rows = [row for row in rows if _row_in_reference(row, ref)]
+            if not ref_rows:
+                continue
+
+            multi_chapter = ref.chapter_start != ref.chapter_end
+            lines = [
+                f"**{f'{row.chapter}:' if multi_chapter else ''}{row.verse}** {row.text}"
+                for row in ref_rows
+            ]
+            sections.append(f"### {ref.label}\n\n" + "\n\n".join(lines))
+
+            for row in ref_rows:
+                if row.pericope_id is None:
+                    continue
+                if row.pericope_id not in segments:
+                    segments[row.pericope_id] = PericopeSegment(
+                        id=row.pericope_id,
+                        type="pericope",
+                        book=row.book_name,
+                        chapter_start=row.pericope_chapter_start,
+                        verse_start=row.pericope_verse_start,
+                        chapter_end=row.pericope_chapter_end,
+                        verse_end=row.pericope_verse_end,
+                        title=row.pericope_title,
+                        text_excerpt="",
+                        relevance_score=1.0,
+                    )
+                    excerpts[row.pericope_id] = []
+                excerpts[row.pericope_id].append(row.text)
+
+        for pericope_id, segment in segments.items():
+            text = "".join(excerpts[pericope_id])
+            segment.text_excerpt = text[:200] + "..." if len(text) > 200 else text
+
+        outcome = RetrieverOutcome(
+            name="reference",
+            results=rows,
+            time_ms=(time.perf_counter() - start) * 1000,
+        )
+        logger.info(
+            f"Verse lookup fast path: {', '.join(r.label for r in refs)} "
+            f"({len(rows)} verses, {outcome.time_ms:.1f}ms)"
+        )
+
+        return PreparedQuery(
+            query=query,
+            query_type="VERSE_LOOKUP",
+            start_time=start_time,
+            outcomes=[outcome],
+            fused_results=[],
+            context="",
+            segments=list(segments.values()),
+            answer="\n\n".join(sections),
+            classification_ms=(time.perf_counter() - start) * 1000,
+            classification_source="reference",
+        )
+
+    async def _fetch_reference_verses(self, refs: list[VerseReference]) -> list:
+        """Fetch the verses of all references with their pericopes in one query.
+
+        Each reference becomes a row-value range over the
+        (book_id, chapter, verse) unique index. Served from the corpus
+        store instead when it is loaded.
+        """
+        store = await get_corpus_store(self.db)
+        if store is not None:
+            return _reference_verses_from_store(store, refs)
+
+        ranges = [
+            tuple_(Verse.book_id, Verse.chapter, Verse.verse).between(
+                (ref.book_id, ref.chapter_start, ref.verse_start),
+                (ref.book_id, ref.chapter_end, ref.verse_end),
+            )
+            for ref in refs
+        ]
+
+        stmt = (
+            select(
+                Verse.book_id,
+                Verse.chapter,
+                Verse.verse,
+                Verse.text,
+                Verse.pericope_id,
+                Book.name_zh.label("book_name"),
+                Pericope.title.label("pericope_title"),
+                Pericope.chapter_start.label("pericope_chapter_start"),
+                Pericope.verse_start.label("pericope_verse_start"),
+                Pericope.chapter_end.label("pericope_chapter_end"),
+                Pericope.verse_end.label("pericope_verse_end"),
+            )
+            .join(Book, Verse.book_id == Book.id)
+            .outerjoin(Pericope, Verse.pericope_id == Pericope.id)
+            .where(or_(*ranges))
+            .order_by(Verse.book_id, Verse.chapter, Verse.verse)
+            .limit(settings.VERSE_LOOKUP_MAX_VERSES)
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    def _build_meta(self, prepared: PreparedQuery) -> QueryMeta:
+        """Build response metadata once generation has finished."""
+        processing_time = int((time.time() - prepared.start_time) * 1000)
+
+        meta = QueryMeta(
+            query_type=prepared.query_type,
+            used_retrievers=[o.name for o in prepared.outcomes if o.results],
+            total_processing_time_ms=processing_time,
+            llm_model=settings.LLM_MODEL_NAME,
+            retrievers=[o.to_stat() for o in prepared.outcomes],
+            classification_ms=(
+                round(prepared.classification_ms, 2)
+                if prepared.classification_ms is not None
+                else None
+            ),
+            classification_source=prepared.classification_source,
+        )
+        return self._apply_trace(meta)
+
+    def _apply_trace(self, meta: QueryMeta) -> QueryMeta:
+        """Fill stage timings, LLM usage and (in debug mode) the full trace."""
+        trace = current_trace()
+        if trace is None:
+            return meta
+
+        meta.stages = trace.stages()
+        meta.llm_usage = _llm_usage(trace.find("llm.chat"))
+        meta.trace = trace.to_dict() if trace.debug else None
+        return meta
+
+    async def _run_retrievers(
+        self,
+        query: str,
+        query_type: str,
+        include_graph: bool,
+        query_embedding: np.ndarray | None = None,
+    ) -> list[RetrieverOutcome]:
+        """Fan out to all retrievers concurrently, each under its own deadline.
+
+        Args:
+            query: User query text
+            query_type: Classified query type
+            include_graph: Whether graph retrieval was requested
+            query_embedding: Query embedding computed during classification
+
+        Returns:
+            One outcome per retriever that was started, in a stable order
+        """
+        runs = [
+            self._run_retriever(
+                "dense",
+                self._retrieve_dense(query, query_embedding),
+                settings.DENSE_RETRIEVER_TIMEOUT,
+            ),
+            self._run_retriever(
+                "sparse", self._retrieve_sparse(query), settings.SPARSE_RETRIEVER_TIMEOUT
+            ),
+        ]
+
+        if self.graph_retriever and include_graph and Neo4jClient.is_available():
+            runs.append(
+                self._run_retriever(
+                    "graph",
+                    self._retrieve_graph(query, query_type),
+                    settings.GRAPH_RETRIEVER_TIMEOUT,
+                )
+            )
+
+        return list(await asyncio.gather(*runs))
+
+    async def _run_retriever(
+        self,
+        name: str,
+        coro: Awaitable[list],
+        timeout: float,
+    ) -> RetrieverOutcome:
+        """Run one retriever with a deadline, never raising.
+
+        Args:
+            name: Retriever name used for fusion and metadata
+            coro: Retrieval coroutine
+            timeout: Deadline in seconds
+
+        Returns:
+            RetrieverOutcome with results, timing and failure flags
+        """
+        start = time.perf_counter()
+        with span(name, timeout_s=timeout) as s:
+            try:
+                results = await asyncio.wait_for(coro, timeout=timeout)
+                outcome = RetrieverOutcome(
+                    name=name,
+                    results=list(results or []),
+                    time_ms=(time.perf_counter() - start) * 1000,
+                )
+            except TimeoutError:
+                logger.warning(f"{name} retrieval timed out after {timeout:.1f}s")
+                outcome = RetrieverOutcome(
+                    name=name,
+                    time_ms=(time.perf_counter() - start) * 1000,
+                    timed_out=True,
+                )
+            except Exception as e:
+                logger.error(f"{name} retrieval error: {e}")
+                outcome = RetrieverOutcome(
+                    name=name,
+                    time_ms=(time.perf_counter() - start) * 1000,
+                    error=str(e),
+                )
+
+            s.attributes.update(
+                candidates=len(outcome.results),
+                # Candidate ids in rank order
+                ranked_ids=[r.id for r in outcome.results],
+                timed_out=outcome.timed_out,
+                error=outcome.error,
+            )
+
+        return outcome
+
+    async def _retrieve_dense(
+        self,
+        query: str,
+        query_embedding: np.ndarray | None = None,
+    ) -> list:
+        """Dense retrieval (semantic) on a dedicated session."""
+        async with self.session_factory() as session:
+            retriever = DenseRetriever(session, self.embed_service)
+            return await retriever.retrieve(
+                query,
+                top_k=settings.MAX_RETRIEVE_RESULTS,
+                query_embedding=query_embedding,
+            )
+
+    async def _retrieve_graph(self, query: str, query_type: str) -> list:
+        """Graph retrieval (Neo4j), with full pericope text from PostgreSQL.
+
+        Cypher only returns the verses that mention the matched entities;
+        hydrating gives graph hits the same ordered text as the other
+        retrievers, which is what the context builder sees after fusion.
+        """
+        results = await self.graph_retriever.retrieve(
+            query,
+            query_type=query_type,
+            top_k=settings.MAX_RETRIEVE_RESULTS,
+        )
+        if not results:
+            return results
+
+        with span("graph.hydrate", pericopes=len(results)):
+            async with self.session_factory() as session:
+                pericopes = await get_pericope_hydrator().hydrate(
+                    session, [r.id for r in results]
+                )
+
+        for result in results:
+            pericope = pericopes.get(result.id)
+            if pericope is not None:
+                result.text = pericope.text
+
+        return results
+
+    async def _retrieve_sparse(self, query: str) -> list:
+        """Sparse retrieval (keyword) on a dedicated session."""
+        async with self.session_factory() as session:
+            retriever = SparseRetriever(session)
+            return await retriever.retrieve(query, top_k=settings.MAX_RETRIEVE_RESULTS)
+
     def _build_graph_context(
         self,
         results: list,
@@ -214,3 +858,92 @@ class RAGPipeline:
             "topics": list(topics)[:10],
             "persons": list(persons)[:10],
         }
+
+
+def _row_in_reference(row: Any, ref: VerseReference) -> bool:
+    """Check whether a fetched verse row falls inside a reference range."""
+    return row.book_id == ref.book_id and (
+        (ref.chapter_start, ref.verse_start)
+        <= (row.chapter, row.verse)
+        <= (ref.chapter_end, ref.verse_end)
+    )
+
+
+def _reference_verses_from_store(
+    store: CorpusStore,
+    refs: list[VerseReference],
+) -> list[ReferenceVerse]:
+    """Collect the verses of all references from the corpus store."""
+    limit = settings.VERSE_LOOKUP_MAX_VERSES
+    seen: dict[tuple[int, int, int], ReferenceVerse] = {}
+
+    for ref in refs:
+        book = store.book(ref.book_id)
+        if book is None:
+            continue
+        verses = store.verses_between(
+            ref.book_id,
+            (ref.chapter_start, ref.verse_start),
+            (ref.chapter_end, ref.verse_end),
+            limit=limit,
+        )
+        for v in verses:
+            pericope = store.pericope(v.pericope_id) if v.pericope_id is not None else None
+            seen[(v.book_id, v.chapter, v.verse)] = ReferenceVerse(
+                book_id=v.book_id,
+                chapter=v.chapter,
+                verse=v.verse,
+                text=v.text,
+                pericope_id=v.pericope_id,
+                book_name=book.name_zh,
+                pericope_title=pericope.title if pericope else None,
+                pericope_chapter_start=pericope.chapter_start if pericope else None,
+                pericope_verse_start=pericope.verse_start if pericope else None,
+                pericope_chapter_end=pericope.chapter_end if pericope else None,
+                pericope_verse_end=pericope.verse_end if pericope else None,
+            )
+
+    # Same ordering and cap as the SQL path
+    rows = sorted(seen.values(), key=lambda r: (r.book_id, r.chapter, r.verse))
+    return rows[:limit]
+
+
+def _fused_ranks(
+    fused_results: list[FusedResult],
+    outcomes: list[RetrieverOutcome],
+) -> list[dict[str, Any]]:
+    """Describe each fused result with its rank in every retriever."""
+    ranks = {
+        o.name: {r.id: rank for rank, r in enumerate(o.results, start=1)}
+        for o in outcomes
+    }
+    return [
+        {
+            "id": result.id,
+            "fused_rank": fused_rank,
+            "score": round(result.score, 6),
+            "ranks": {
+                name: by_id[result.id] for name, by_id in ranks.items() if result.id in by_id
+            },
+        }
+        for fused_rank, result in enumerate(fused_results, start=1)
+    ]
+
+
+def _llm_usage(spans: list) -> LLMUsage | None:
+    """Sum Ollama token counts over all LLM calls of a request."""
+    if not spans:
+        return None
+
+    prompt_tokens = sum(s.attributes.get("prompt_eval_count", 0) for s in spans)
+    completion_tokens = sum(s.attributes.get("eval_count", 0) for s in spans)
+    eval_ms = sum(s.attributes.get("eval_duration_ms", 0.0) for s in spans)
+
+    return LLMUsage(
+        calls=len(spans),
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        tokens_per_second=(
+            round(completion_tokens / (eval_ms / 1000), 2) if eval_ms else None
+        ),
+    )
@@ -0,0 +1,273 @@
+"""Parser for explicit Bible references in free-text queries.
+
+Recognizes references such as "約翰福音 3:16", "約3:16-18", "創1:26-2:3",
+"詩篇23篇", "馬太福音第5章3節" and "約翰福音3" (whole chapter, full book
+names only) using a character trie over every book name and abbreviation.
+Book names may drop a trailing 記/書 ("羅馬8:28") and use formal numerals
+("約翰壹書1:9", "約壹1:9").
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.orm import Book
+from app.services.corpus_store import get_corpus_store
+
+# Sentinel for an open-ended verse bound (whole chapter)
+MAX_VERSE = 999
+
+_RANGE_SEP = r"\s*[-–—~至到]\s*"
+
+# 3:16, 3:16-18, 1:26-2:3 (full-width colons/digits are normalized beforehand)
+_COLON_PATTERN = re.compile(
+    r"\s*(?P<c1>\d{1,3})\s*:\s*(?P<v1>\d{1,3})"
+    rf"(?:{_RANGE_SEP}(?:(?P<c2>\d{{1,3}})\s*:\s*)?(?P<v2>\d{{1,3}}))?"
+)
+
+# 第5章, 5章3節, 第5章3-12節, 23篇
+_CHAPTER_PATTERN = re.compile(
+    r"\s*第?\s*(?P<c1>\d{1,3})\s*[章篇]"
+    rf"(?:\s*第?\s*(?P<v1>\d{{1,3}})\s*節?(?:{_RANGE_SEP}第?\s*(?P<v2>\d{{1,3}})\s*節?)?)?"
+)
+
+# Bare chapter after a full book name: "約翰福音3"
+_BARE_CHAPTER_PATTERN = re.compile(r"\s*(?P<c1>\d{1,3})(?![\d:])")
+
+# Words that do not change the intent of a plain lookup ("請給我約3:16的經文")
+_FILLER_PATTERN = re.compile(
+    r"請問|請|幫我|給我|查詢|查看|查|找|顯示|列出|經文|內容|全文|原文|"
+    r"是什麼|寫什麼|說什麼|怎麼說|寫了什麼|說了什麼|一下|的|呢|嗎"
+)
+_PUNCT_PATTERN = re.compile(r"[\s\W_]+")
+
+
+@dataclass(frozen=True)
+class VerseReference:
+    """A parsed, inclusive verse range within one book."""
+
+    book_id: int
+    book_name: str
+    chapter_start: int
+    verse_start: int
+    chapter_end: int
+    verse_end: int
+    start: int  # Span of the reference in the normalized query
+    end: int
+
+    @property
+    def label(self) -> str:
+        """Human-readable reference string."""
+        if self.verse_start == 1 and self.verse_end == MAX_VERSE:
+            if self.chapter_start == self.chapter_end:
+                return f"{self.book_name} {self.chapter_start}"
+            return f"{self.book_name} {self.chapter_start}-{self.chapter_end}"
+        if self.chapter_start == self.chapter_end:
+            if self.verse_start == self.verse_end:
+                return f"{self.book_name} {self.chapter_start}:{self.verse_start}"
+            return f"{self.book_name} {self.chapter_start}:{self.verse_start}-{self.verse_end}"
+        return (
+            f"{self.book_name} {self.chapter_start}:{self.verse_start}"
+            f"-{self.chapter_end}:{self.verse_end}"
+        )
+
+
+# Formal numerals used in book names such as "約翰壹書" (約翰一書)
+_FORMAL_NUMERALS = {"一": "壹", "二": "貳", "三": "參"}
+
+
+def _numeral_variants(name: str) -> list[str]:
+    """Return the name plus its spelling with formal numerals, if different."""
+    formal = "".join(_FORMAL_NUMERALS.get(char, char) for char in name)
+    return [name] if formal == name else [name, formal]
+
+
+@dataclass
+class _BookEntry:
+    """Trie terminal payload."""
+
+    book_id: int
+    book_name: str
+    is_full_name: bool
+
+
+class ReferenceParser:
+    """Detects explicit verse references using a trie of book names."""
+
+    def __init__(self, books: list[tuple[int, str, str]]):
+        """Build the trie.
+
+        Args:
+            books: (book_id, name_zh, abbrev_zh) tuples
+        """
+        self._trie: dict = {}
+        for book_id, name_zh, abbrev_zh in books:
+            for name in _numeral_variants(name_zh):
+                self._insert(name, _BookEntry(book_id, name_zh, is_full_name=True))
+                # "羅馬書" is also commonly written without the trailing 記/書
+                for suffix in ("記", "書"):
+                    if name.endswith(suffix) and len(name) > 2:
+                        self._insert(
+                            name[: -len(suffix)],
+                            _BookEntry(book_id, name_zh, is_full_name=True),
+                        )
+            if abbrev_zh and abbrev_zh != name_zh:
+                for abbrev in _numeral_variants(abbrev_zh):
+                    self._insert(abbrev, _BookEntry(book_id, name_zh, is_full_name=False))
+
+    def _insert(self, key: str, entry: _BookEntry) -> None:
+        node = self._trie
+        for char in key:
+            node = node.setdefault(char, {})
+        # Full names win over abbreviations that happen to collide
+        existing = node.get(None)
+        if existing is None or (entry.is_full_name and not existing.is_full_name):
+            node[None] = entry
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize full-width digits and punctuation."""
+        return unicodedata.normalize("NFKC", query)
+
+    def parse(self, query: str) -> list[VerseReference]:
+        """Find all explicit references in a query.
+
+        Args:
+            query: Raw query text
+
+        Returns:
+            References in order of appearance (empty if none)
+        """
+        text = self.normalize(query)
+        refs: list[VerseReference] = []
+        i = 0
+
+        while i < len(text):
+            ref = self._match_at(text, i)
+            if ref is None:
+                i += 1
+                continue
+            refs.append(ref)
+            i = ref.end
+
+        return refs
+
+    def residual(self, query: str, refs: list[VerseReference]) -> str:
+        """Return the query text left after removing references and filler.
+
+        A short residual means the query is a plain lookup.
+        """
+        text = self.normalize(query)
+        parts = []
+        last = 0
+        for ref in refs:
+            parts.append(text[last:ref.start])
+            last = ref.end
+        parts.append(text[last:])
+
+        remainder = _FILLER_PATTERN.sub("", "".join(parts))
+        return _PUNCT_PATTERN.sub("", remainder)
+
+    def _match_at(self, text: str, pos: int) -> VerseReference | None:
+        """Try every book name starting at pos, longest first."""
+        candidates: list[tuple[int, _BookEntry]] = []
+        node = self._trie
+        j = pos
+        while j < len(text) and text[j] in node:
+            node = node[text[j]]
+            j += 1
+            if None in node:
+                candidates.append((j, node[None]))
+
+        for name_end, entry in reversed(candidates):
+            ref = self._match_locator(text, pos, name_end, entry)
+            if ref is not None:
+                return ref
+        return None
+
+    def _match_locator(
+        self,
+        text: str,
+        start: int,
+        pos: int,
+        entry: _BookEntry,
+    ) -> VerseReference | None:
+        """Parse the chapter/verse part following a book name."""
+        match = _COLON_PATTERN.match(text, pos)
+        if match:
+            c1, v1 = int(match["c1"]), int(match["v1"])
+            c2 = int(match["c2"]) if match["c2"] else c1
+            v2 = int(match["v2"]) if match["v2"] else v1
+            return self._build(entry, c1, v1, c2, v2, start, match.end())
+
+        match = _CHAPTER_PATTERN.match(text, pos)
+        if match:
+            c1 = int(match["c1"])
+            if match["v1"]:
+                v1 = int(match["v1"])
+                v2 = int(match["v2"]) if match["v2"] else v1
+            else:
+                v1, v2 = 1, MAX_VERSE
+            return self._build(entry, c1, v1, c1, v2, start, match.end())
+
+        # A single-character abbreviation followed by a number is too ambiguous
+        # ("來3次"), so bare chapters are only accepted after full book names.
+        if entry.is_full_name:
+            match = _BARE_CHAPTER_PATTERN.match(text, pos)
+            if match:
+                c1 = int(match["c1"])
+                return self._build(entry, c1, 1, c1, MAX_VERSE, start, match.end())
+
+        return None
+
+    @staticmethod
+    def _build(
+        entry: _BookEntry,
+        c1: int,
+        v1: int,
+        c2: int,
+        v2: int,
+        start: int,
+        end: int,
+    ) -> VerseReference | None:
+        """Validate a range and build the reference."""
+        if c1 < 1 or v1 < 1 or (c2, v2) < (c1, v1):
+            return None
+        return VerseReference(
+            book_id=entry.book_id,
+            book_name=entry.book_name,
+            chapter_start=c1,
+            verse_start=v1,
+            chapter_end=c2,
+            verse_end=v2,
+            start=start,
+            end=end,
+        )
+
+
+# Singleton instance (book names are static)
+_reference_parser: ReferenceParser | None = None
+
+
+async def get_reference_parser(db: AsyncSession) -> ReferenceParser:
+    """Get or create the reference parser singleton.
+
+    Args:
+        db: Database session used to load book names on first use
+
+    Returns:
+        ReferenceParser instance
+    """
+    global _reference_parser
+    if _reference_parser is None:
+        store = await get_corpus_store(db)
+        if store is not None:
+            books = [(b.id, b.name_zh, b.abbrev_zh) for b in store.books()]
+        else:
+            result = await db.execute(select(Book.id, Book.name_zh, Book.abbrev_zh))
+            books = [tuple(row) for row in result.all()]
+        _reference_parser = ReferenceParser(books)
+    return _reference_parser
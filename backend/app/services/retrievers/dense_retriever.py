@@ -1,13 +1,14 @@
-"""Dense retriever using pgvector."""
+"""Dense retriever over pericope embeddings (pgvector or in-process numpy)."""
 
 from dataclasses import dataclass
 
-from sqlalchemy import select
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models.orm import Pericope, Verse
-from app.services.embedding_service import EmbeddingService
+from app.services.dense_index import get_active_slot, get_dense_index
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+from app.services.pericope_hydrator import get_pericope_hydrator
+from app.services.tracing import span
 
 
 @dataclass
@@ -27,7 +28,13 @@ class RetrievalResult:
 
 
 class DenseRetriever:
-    """Dense retriever using pgvector for semantic similarity search."""
+    """Dense retriever for semantic similarity search.
+
+    The nearest-neighbour search runs on the backend selected by
+    DENSE_INDEX_BACKEND; results are identical in shape either way. Vectors
+    come from the active embedding slot, and queries are encoded with the
+    model that slot was built with.
+    """
 
     def __init__(self, db: AsyncSession, embed_service: EmbeddingService):
         self.db = db
@@ -37,78 +44,59 @@ class DenseRetriever:
         self,
         query: str,
         top_k: int = 20,
+        query_embedding: np.ndarray | None = None,
     ) -> list[RetrievalResult]:
         """Retrieve pericopes by semantic similarity.
 
         Args:
             query: Query text
             top_k: Number of results to return
+            query_embedding: Precomputed query embedding (skips encoding)
 
         Returns:
             List of retrieval results ordered by similarity
         """
+        embed_service = self.embed_service
+        slot = await get_active_slot(self.db)
+        if slot.model_name != embed_service.model_name:
+            # A precomputed embedding came from the default model and does not apply
+            embed_service = await get_embedding_service(slot.model_name)
+            query_embedding = None
+
         # Generate query embedding
-        query_embedding = await self.embed_service.encode(query)
-
-        # Convert numpy array to list for pgvector
-        embedding_list = query_embedding.tolist()
-
-        # Query using cosine distance
-        # Note: cosine_distance = 1 - cosine_similarity, so lower is better
-        stmt = (
-            select(
-                Pericope.id,
-                Pericope.book_id,
-                Pericope.chapter_start,
-                Pericope.verse_start,
-                Pericope.chapter_end,
-                Pericope.verse_end,
-                Pericope.title,
-                Pericope.embedding.cosine_distance(embedding_list).label("distance"),
-            )
-            .where(Pericope.embedding.isnot(None))
-            .order_by("distance")
-            .limit(top_k)
-        )
+        if query_embedding is None:
+            with span("dense.embedding"):
+                query_embedding = await embed_service.encode_query(query)
 
-        result = await self.db.execute(stmt)
-        rows = result.all()
+        index = await get_dense_index(self.db)
 
-        # Get book names and verse texts
-        results = []
-        for row in rows:
-            # Get book name
-            book_result = await self.db.execute(
-                select(Pericope)
-                .where(Pericope.id == row.id)
-                .options(selectinload(Pericope.book))
-            )
-            pericope = book_result.scalar_one()
-            book_name = pericope.book.name_zh if pericope.book else "Unknown"
-
-            # Get verse texts
-            verse_result = await self.db.execute(
-                select(Verse.text)
-                .where(Verse.pericope_id == row.id)
-                .order_by(Verse.chapter, Verse.verse)
+        with span(f"dense.{index.name}", top_k=top_k) as s:
+            hits = await index.search(self.db, query_embedding, top_k)
+            s.attributes["rows"] = len(hits)
+
+        # Get book names and verse texts for all hits at once
+        with span("dense.hydrate", pericopes=len(hits)):
+            pericopes = await get_pericope_hydrator().hydrate(
+                self.db, [pericope_id for pericope_id, _ in hits]
             )
-            verse_texts = verse_result.scalars().all()
-            full_text = "\n".join(verse_texts)
 
-            # Convert distance to similarity score (1 - distance)
-            similarity = 1.0 - row.distance
+        results = []
+        for pericope_id, similarity in hits:
+            pericope = pericopes.get(pericope_id)
+            if pericope is None:
+                continue
 
             results.append(
                 RetrievalResult(
-                    id=row.id,
-                    book_id=row.book_id,
-                    book_name=book_name,
-                    chapter_start=row.chapter_start,
-                    verse_start=row.verse_start,
-                    chapter_end=row.chapter_end,
-                    verse_end=row.verse_end,
-                    title=row.title,
-                    text=full_text,
+                    id=pericope.id,
+                    book_id=pericope.book_id,
+                    book_name=pericope.book_name,
+                    chapter_start=pericope.chapter_start,
+                    verse_start=pericope.verse_start,
+                    chapter_end=pericope.chapter_end,
+                    verse_end=pericope.verse_end,
+                    title=pericope.title,
+                    text=pericope.text,
                     score=similarity,
                 )
             )
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 
 from app.core.neo4j_client import Neo4jClient
 from app.services.llm_client import OllamaLLMClient
+from app.services.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,9 @@ class GraphRetriever:
             return []
 
         # Extract entity names from query
-        entities = await self._extract_entities_from_query(query, query_type)
+        with span("graph.entity_extraction") as s:
+            entities = await self._extract_entities_from_query(query, query_type)
+            s.attributes["entities"] = len(entities)
 
         if not entities:
             logger.debug(f"No entities extracted from query: {query}")
@@ -74,15 +77,19 @@ class GraphRetriever:
         logger.debug(f"Extracted entities: {entities}")
 
         # Execute appropriate query based on type
-        if query_type == "PERSON_QUESTION":
-            return await self._retrieve_by_person(entities, top_k)
-        elif query_type == "TOPIC_QUESTION":
-            return await self._retrieve_by_topic(entities, top_k)
-        elif query_type == "EVENT_QUESTION":
-            return await self._retrieve_by_event(entities, top_k)
-        else:
-            # General: combine all entity types
-            return await self._retrieve_general(entities, top_k)
+        with span("graph.cypher", query_type=query_type) as s:
+            if query_type == "PERSON_QUESTION":
+                results = await self._retrieve_by_person(entities, top_k)
+            elif query_type == "TOPIC_QUESTION":
+                results = await self._retrieve_by_topic(entities, top_k)
+            elif query_type == "EVENT_QUESTION":
+                results = await self._retrieve_by_event(entities, top_k)
+            else:
+                # General: combine all entity types
+                results = await self._retrieve_general(entities, top_k)
+            s.attributes["rows"] = len(results)
+
+        return results
 
     async def _extract_entities_from_query(
         self,
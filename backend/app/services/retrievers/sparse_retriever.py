@@ -1,12 +1,15 @@
-"""Sparse retriever using PostgreSQL full-text search."""
+"""Sparse retriever using PostgreSQL full-text search or in-memory BM25."""
 
 from dataclasses import dataclass
 
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models.orm import Pericope, Verse
+from app.core.config import settings
+from app.models.orm import Verse
+from app.services.pericope_hydrator import get_pericope_hydrator
+from app.services.sparse_index import get_bm25_index
+from app.services.tracing import span
 
 
 @dataclass
@@ -26,7 +29,11 @@ class SparseRetrievalResult:
 
 
 class SparseRetriever:
-    """Sparse retriever using PostgreSQL full-text search."""
+    """Sparse retriever using PostgreSQL full-text search or BM25.
+
+    SPARSE_BACKEND selects the engine: ``fts`` queries ``Verse.tsv``;
+    ``bm25`` scores character bigrams in process (see sparse_index).
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -45,74 +52,86 @@ class SparseRetriever:
         Returns:
             List of retrieval results ordered by relevance
         """
-        # Use plainto_tsquery for simple query parsing
-        # This handles Chinese text reasonably well with 'simple' configuration
-        tsquery = func.plainto_tsquery("simple", query)
-
-        # First, find matching verses
-        verse_stmt = (
-            select(
-                Verse.pericope_id,
-                func.ts_rank(Verse.tsv, tsquery).label("rank"),
-            )
-            .where(Verse.tsv.op("@@")(tsquery))
-            .where(Verse.pericope_id.isnot(None))
-            .group_by(Verse.pericope_id)
-            .order_by(text("rank DESC"))
-            .limit(top_k * 2)  # Get more to ensure enough pericopes
-        )
-
-        verse_result = await self.db.execute(verse_stmt)
-        pericope_ranks = {row.pericope_id: row.rank for row in verse_result.all()}
-
-        if not pericope_ranks:
+        if settings.SPARSE_BACKEND == "bm25":
+            with span("sparse.bm25", top_k=top_k) as s:
+                pericope_scores = dict(await self.search_bm25(query, top_k))
+                s.attributes["rows"] = len(pericope_scores)
+        else:
+            with span("sparse.fts", top_k=top_k) as s:
+                # Get more to ensure enough pericopes
+                pericope_scores = {
+                    pericope_id: _normalize_rank(rank)
+                    for pericope_id, rank in await self.search_fts(query, top_k * 2)
+                }
+                s.attributes["rows"] = len(pericope_scores)
+
+        if not pericope_scores:
             return []
 
-        # Get pericope details
-        pericope_ids = list(pericope_ranks.keys())[:top_k]
-
-        pericope_stmt = (
-            select(Pericope)
-            .where(Pericope.id.in_(pericope_ids))
-            .options(selectinload(Pericope.book))
-        )
+        # Get pericope details and verse texts for all hits at once
+        pericope_ids = list(pericope_scores.keys())[:top_k]
 
-        pericope_result = await self.db.execute(pericope_stmt)
-        pericopes = pericope_result.scalars().all()
+        with span("sparse.hydrate", pericopes=len(pericope_ids)):
+            pericopes = await get_pericope_hydrator().hydrate(self.db, pericope_ids)
 
         # Build results
         results = []
-        for pericope in pericopes:
-            # Get verse texts
-            verse_text_stmt = (
-                select(Verse.text)
-                .where(Verse.pericope_id == pericope.id)
-                .order_by(Verse.chapter, Verse.verse)
-            )
-            verse_result = await self.db.execute(verse_text_stmt)
-            verse_texts = verse_result.scalars().all()
-            full_text = "\n".join(verse_texts)
-
-            # Normalize rank to 0-1 range (approximate)
-            raw_rank = pericope_ranks.get(pericope.id, 0)
-            # ts_rank typically returns values between 0 and 1, but can be higher
-            normalized_score = min(1.0, raw_rank / 0.5) if raw_rank > 0 else 0.0
-
+        for pericope in pericopes.values():
             results.append(
                 SparseRetrievalResult(
                     id=pericope.id,
                     book_id=pericope.book_id,
-                    book_name=pericope.book.name_zh if pericope.book else "Unknown",
+                    book_name=pericope.book_name,
                     chapter_start=pericope.chapter_start,
                     verse_start=pericope.verse_start,
                     chapter_end=pericope.chapter_end,
                     verse_end=pericope.verse_end,
                     title=pericope.title,
-                    text=full_text,
-                    score=normalized_score,
+                    text=pericope.text,
+                    score=pericope_scores.get(pericope.id, 0.0),
                 )
             )
 
         # Sort by score
         results.sort(key=lambda x: x.score, reverse=True)
         return results[:top_k]
+
+    async def search_fts(self, query: str, limit: int) -> list[tuple[int, float]]:
+        """Rank pericopes with PostgreSQL full-text search on ``Verse.tsv``.
+
+        Returns:
+            (pericope id, ts_rank) pairs, best first
+        """
+        # Use plainto_tsquery for simple query parsing
+        tsquery = func.plainto_tsquery("simple", query)
+
+        verse_stmt = (
+            select(
+                Verse.pericope_id,
+                func.ts_rank(Verse.tsv, tsquery).label("rank"),
+            )
+            .where(Verse.tsv.op("@@")(tsquery))
+            .where(Verse.pericope_id.isnot(None))
+            .group_by(Verse.pericope_id)
+            .order_by(text("rank DESC"))
+            .limit(limit)
+        )
+        result = await self.db.execute(verse_stmt)
+        return [(row.pericope_id, row.rank) for row in result.all()]
+
+    async def search_bm25(self, query: str, limit: int) -> list[tuple[int, float]]:
+        """Rank pericopes with the in-memory bigram BM25 index.
+
+        Returns:
+            (pericope id, normalized BM25 score) pairs, best first
+        """
+        index = await get_bm25_index(self.db)
+        return index.search(query, limit)
+
+
+def _normalize_rank(rank: float) -> float:
+    """Normalize ts_rank to a 0-1 range (approximate).
+
+    ts_rank typically returns values between 0 and 1, but can be higher.
+    """
+    return min(1.0, rank / 0.5) if rank > 0 else 0.0
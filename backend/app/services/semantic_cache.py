@@ -0,0 +1,384 @@
+"""Semantic answer cache keyed on bge-m3 query embeddings.
+
+Near-duplicate questions ("聖經怎麼談饒恕" / "聖經如何講饒恕") map to nearby
+query vectors, so a previous QueryResponse can be reused when the cosine
+similarity is above SEMANTIC_CACHE_THRESHOLD. Entries are scoped by mode and
+options, expire after a TTL, are evicted LRU under an entry and memory cap,
+and are dropped wholesale when the corpus, LLM or embedding model changes.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import (
+    SEMANTIC_CACHE_BYTES,
+    SEMANTIC_CACHE_ENTRIES,
+    SEMANTIC_CACHE_EVICTIONS,
+    SEMANTIC_CACHE_INVALIDATIONS,
+    SEMANTIC_CACHE_LOOKUPS,
+    SEMANTIC_CACHE_SAVED,
+)
+from app.services.corpus_store import corpus_version
+from app.services.dense_index import get_active_slot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """A cached pipeline response."""
+
+    scope: str
+    vector: np.ndarray
+    response: dict[str, Any]
+    created_at: float
+    expires_at: float
+    latency_ms: float
+    size_bytes: int
+
+
+@dataclass
+class CacheHit:
+    """A successful cache lookup."""
+
+    response: dict[str, Any]
+    similarity: float
+    saved_ms: float
+
+
+class SemanticCache:
+    """In-process LRU cache of responses searched by cosine similarity."""
+
+    def __init__(
+        self,
+        threshold: float | None = None,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        persist_path: str | None = None,
+    ):
+        self.threshold = threshold or settings.SEMANTIC_CACHE_THRESHOLD
+        self.ttl_seconds = ttl_seconds or settings.SEMANTIC_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.SEMANTIC_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.SEMANTIC_CACHE_MAX_MB * 1024 * 1024
+        persist_path = persist_path if persist_path is not None else settings.SEMANTIC_CACHE_PATH
+        self.persist_path = Path(persist_path) if persist_path else None
+
+        self._entries: OrderedDict[int, CacheEntry] = OrderedDict()
+        # Stacked vectors per scope, rebuilt lazily after inserts/evictions
+        self._matrices: dict[str, tuple[list[int], np.ndarray]] = {}
+        self._next_id = 0
+        self._bytes = 0
+
+        self.fingerprint: str | None = None
+        self._fingerprint_checked_at = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.saved_ms = 0.0
+
+    async def refresh_fingerprint(self, db: AsyncSession) -> None:
+        """Drop all entries if the corpus or models changed.
+
+        The corpus version is re-read at most every
+        SEMANTIC_CACHE_CORPUS_CHECK_SECONDS.
+        """
+        now = time.monotonic()
+        if (
+            self.fingerprint is not None
+            and now - self._fingerprint_checked_at < settings.SEMANTIC_CACHE_CORPUS_CHECK_SECONDS
+        ):
+            return
+
+        self._fingerprint_checked_at = now
+        fingerprint = await compute_fingerprint(db)
+        if self.fingerprint is not None and fingerprint != self.fingerprint:
+            logger.info("Corpus or model changed; clearing semantic cache")
+            self.invalidations += 1
+            self.clear()
+        self.fingerprint = fingerprint
+
+    def lookup(self, scope: str, vector: np.ndarray) -> CacheHit | None:
+        """Find the most similar live entry in a scope.
+
+        Args:
+            scope: Mode/options scope key
+            vector: Query embedding
+
+        Returns:
+            CacheHit if the best match clears the threshold, else None
+        """
+        self._expire()
+
+        ids, matrix = self._matrix(scope)
+        if not ids:
+            self.misses += 1
+            return None
+
+        similarities = matrix @ _normalize(vector)
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+
+        if similarity < self.threshold:
+            self.misses += 1
+            return None
+
+        entry_id = ids[best]
+        entry = self._entries[entry_id]
+        self._entries.move_to_end(entry_id)
+
+        self.hits += 1
+        self.saved_ms += entry.latency_ms
+        return CacheHit(response=entry.response, similarity=similarity, saved_ms=entry.latency_ms)
+
+    def store(
+        self,
+        scope: str,
+        vector: np.ndarray,
+        response: dict[str, Any],
+        latency_ms: float,
+    ) -> None:
+        """Insert a response, evicting least recently used entries as needed.
+
+        Args:
+            scope: Mode/options scope key
+            vector: Query embedding
+            response: Serialized QueryResponse
+            latency_ms: Time the uncached pipeline took (reported as saved on hits)
+        """
+        vector = _normalize(vector)
+        size_bytes = vector.nbytes + len(json.dumps(response, ensure_ascii=False).encode())
+        if size_bytes > self.max_bytes:
+            return
+
+        now = time.time()
+        self._add(
+            CacheEntry(
+                scope=scope,
+                vector=vector,
+                response=response,
+                created_at=now,
+                expires_at=now + self.ttl_seconds,
+                latency_ms=latency_ms,
+                size_bytes=size_bytes,
+            )
+        )
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._matrices.clear()
+        self._bytes = 0
+
+    @property
+    def entry_count(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the cached entries."""
+        return self._bytes
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit rate, saved latency and occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.entry_count,
+            "memory_bytes": self.memory_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "saved_latency_ms": round(self.saved_ms, 2),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "threshold": self.threshold,
+        }
+
+    def save(self) -> None:
+        """Persist live entries to disk (vectors as .npy, metadata as .json)."""
+        if self.persist_path is None or self.fingerprint is None:
+            return
+
+        self._expire()
+        entries = list(self._entries.values())
+
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(
+            self.persist_path.with_suffix(".npy"),
+            np.stack([e.vector for e in entries]) if entries else np.zeros((0, 0), np.float32),
+        )
+        with open(self.persist_path.with_suffix(".json"), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "fingerprint": self.fingerprint,
+                    "entries": [
+                        {
+                            "scope": e.scope,
+                            "response": e.response,
+                            "created_at": e.created_at,
+                            "expires_at": e.expires_at,
+                            "latency_ms": e.latency_ms,
+                            "size_bytes": e.size_bytes,
+                        }
+                        for e in entries
+                    ],
+                },
+                f,
+                ensure_ascii=False,
+            )
+        logger.info(f"Saved {len(entries)} semantic cache entries to {self.persist_path}")
+
+    def load(self, fingerprint: str) -> None:
+        """Load persisted entries written under the same fingerprint."""
+        self.fingerprint = fingerprint
+        self._fingerprint_checked_at = time.monotonic()
+
+        if self.persist_path is None:
+            return
+
+        meta_path = self.persist_path.with_suffix(".json")
+        vectors_path = self.persist_path.with_suffix(".npy")
+        if not meta_path.exists() or not vectors_path.exists():
+            return
+
+        with open(meta_path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("fingerprint") != fingerprint:
+            logger.info("Persisted semantic cache is stale; ignoring it")
+            return
+
+        vectors = np.load(vectors_path)
+        now = time.time()
+        for item, vector in zip(data["entries"], vectors):
+            if item["expires_at"] <= now:
+                continue
+            self._add(CacheEntry(vector=vector.astype(np.float32), **item))
+
+        logger.info(f"Loaded {len(self._entries)} semantic cache entries from {self.persist_path}")
+
+    def _add(self, entry: CacheEntry) -> None:
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = entry
+        self._bytes += entry.size_bytes
+        self._matrices.pop(entry.scope, None)
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        self._bytes -= entry.size_bytes
+        self._matrices.pop(entry.scope, None)
+
+    def _expire(self) -> None:
+        now = time.time()
+        expired = [i for i, e in self._entries.items() if e.expires_at <= now]
+        for entry_id in expired:
+            self._remove(entry_id)
+
+    def _matrix(self, scope: str) -> tuple[list[int], np.ndarray]:
+        if scope not in self._matrices:
+            ids = [i for i, e in self._entries.items() if e.scope == scope]
+            matrix = (
+                np.stack([self._entries[i].vector for i in ids])
+                if ids
+                else np.zeros((0, 0), np.float32)
+            )
+            self._matrices[scope] = (ids, matrix)
+        return self._matrices[scope]
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / (np.linalg.norm(vector) or 1.0)
+
+
+def cache_scope(mode: str, options: dict[str, Any]) -> str:
+    """Build the scope key for a mode and option set."""
+    return f"{mode}|" + json.dumps(options, sort_keys=True)
+
+
+async def compute_fingerprint(db: AsyncSession) -> str:
+    """Fingerprint of everything a cached answer depends on.
+
+    Combines the LLM model name, the active embedding slot and the model it
+    was built with (cached query vectors come from that model) and a corpus
+    version derived from the stored text.
+    """
+    slot = await get_active_slot(db)
+    version = await corpus_version(db)
+    return f"{settings.LLM_MODEL_NAME}|{slot.name}|{slot.model_name}|{version}"
+
+
+# Singleton instance
+_semantic_cache: SemanticCache | None = None
+_semantic_cache_lock = asyncio.Lock()
+
+
+async def get_semantic_cache(db: AsyncSession) -> SemanticCache:
+    """Get or create the semantic cache singleton (loading persisted entries)."""
+    global _semantic_cache
+    if _semantic_cache is not None:
+        return _semantic_cache
+
+    async with _semantic_cache_lock:
+        if _semantic_cache is None:
+            cache = SemanticCache()
+            try:
+                cache.load(await compute_fingerprint(db))
+            except Exception as e:
+                logger.warning(f"Failed to load semantic cache: {e}")
+            _semantic_cache = cache
+    return _semantic_cache
+
+
+def get_semantic_cache_stats() -> dict[str, Any] | None:
+    """Get cache stats without creating the cache.
+
+    Returns:
+        Stats dict, or None if the cache has not been created yet
+    """
+    if _semantic_cache is None:
+        return None
+    return _semantic_cache.get_stats()
+
+
+def close_semantic_cache() -> None:
+    """Persist and drop the semantic cache singleton if it was created."""
+    global _semantic_cache
+    if _semantic_cache is not None:
+        try:
+            _semantic_cache.save()
+        except Exception as e:
+            logger.warning(f"Failed to save semantic cache: {e}")
+        _semantic_cache = None
+
+
+def _semantic_cache_value(attribute: str, scale: float = 1.0) -> float:
+    """Read a cache statistic for /metrics (0 before the cache is created)."""
+    return getattr(_semantic_cache, attribute) * scale if _semantic_cache is not None else 0
+
+
+SEMANTIC_CACHE_LOOKUPS.set_function(lambda: _semantic_cache_value("hits"), result="hit")
+SEMANTIC_CACHE_LOOKUPS.set_function(lambda: _semantic_cache_value("misses"), result="miss")
+SEMANTIC_CACHE_SAVED.set_function(lambda: _semantic_cache_value("saved_ms", scale=0.001))
+SEMANTIC_CACHE_EVICTIONS.set_function(lambda: _semantic_cache_value("evictions"))
+SEMANTIC_CACHE_INVALIDATIONS.set_function(lambda: _semantic_cache_value("invalidations"))
+SEMANTIC_CACHE_ENTRIES.set_function(lambda: _semantic_cache_value("entry_count"))
+SEMANTIC_CACHE_BYTES.set_function(lambda: _semantic_cache_value("memory_bytes"))
@@ -0,0 +1,129 @@
+"""Single-flight coalescing of identical in-flight queries."""
+
+import asyncio
+import json
+import logging
+import re
+import unicodedata
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from app.core.metrics import (
+    QUERY_COALESCED,
+    QUERY_COALESCING_EXECUTIONS,
+    QUERY_COALESCING_IN_FLIGHT,
+    QUERY_COALESCING_REQUESTS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for coalescing (width, case, whitespace)."""
+    query = unicodedata.normalize("NFKC", query).strip().lower()
+    return _WHITESPACE_PATTERN.sub(" ", query)
+
+
+def flight_key(query: str, mode: str, options: dict[str, Any]) -> str:
+    """Build the coalescing key for a query, mode and option set."""
+    return f"{mode}|{json.dumps(options, sort_keys=True)}|{normalize_query(query)}"
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one call per key at a time; concurrent callers share it.
+
+    The shared call runs as its own task and each caller awaits it through
+    ``asyncio.shield``, so a caller that is cancelled (e.g. client disconnect)
+    does not cancel the work other callers are waiting on.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+        self.requests = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Run fn for key, or join the call already in flight.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine function producing the result
+
+        Returns:
+            (result, whether this caller joined an existing call)
+        """
+        self.requests += 1
+        task = self._inflight.get(key)
+        shared = task is not None
+
+        if task is None:
+            self.executions += 1
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Coalesced query onto in-flight call ({len(self._inflight)} in flight)")
+
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so an unobserved failure is not logged as such
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get request, execution and coalescing counters."""
+        return {
+            "requests": self.requests,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesce_rate": round(self.coalesced / self.requests, 4) if self.requests else 0.0,
+            "in_flight": self.in_flight,
+        }
+
+
+# Singleton instance for the /query endpoint
+_query_flight: SingleFlight | None = None
+
+
+def get_query_flight() -> SingleFlight:
+    """Get or create the /query single-flight group."""
+    global _query_flight
+    if _query_flight is None:
+        _query_flight = SingleFlight()
+    return _query_flight
+
+
+def get_query_flight_stats() -> dict[str, Any] | None:
+    """Get coalescing stats without creating the group.
+
+    Returns:
+        Stats dict, or None if no query has run yet
+    """
+    if _query_flight is None:
+        return None
+    return _query_flight.get_stats()
+
+
+def _query_flight_value(attribute: str) -> float:
+    """Read a counter of the /query group for /metrics (0 before the first query)."""
+    return getattr(_query_flight, attribute) if _query_flight is not None else 0
+
+
+QUERY_COALESCING_REQUESTS.set_function(lambda: _query_flight_value("requests"))
+QUERY_COALESCING_EXECUTIONS.set_function(lambda: _query_flight_value("executions"))
+QUERY_COALESCED.set_function(lambda: _query_flight_value("coalesced"))
+QUERY_COALESCING_IN_FLIGHT.set_function(lambda: _query_flight_value("in_flight"))
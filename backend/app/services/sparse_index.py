@@ -0,0 +1,231 @@
+"""In-memory BM25 index over verses for Chinese sparse retrieval.
+
+``Verse.tsv`` uses the ``simple`` text search configuration, which keeps each
+unsegmented Chinese clause as one token, so ``plainto_tsquery`` rarely
+matches. This index tokenizes verses into overlapping character bigrams plus
+unigrams (Latin words and numbers stay whole), stores postings in CSR arrays
+with precomputed BM25 impacts, and scores a query with a few NumPy
+scatter-adds. Verse scores are max-aggregated to pericopes in the same pass.
+"""
+
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from collections import Counter
+from typing import Any
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.orm import Verse
+from app.services.corpus_store import get_corpus_version
+
+logger = logging.getLogger(__name__)
+
+# Runs of CJK ideographs, or Latin/digit words
+_TOKEN_PATTERN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+|[a-z0-9]+")
+
+
+def tokenize(text: str, unigrams: bool = False) -> list[str]:
+    """Split text into character bigrams (CJK) and whole words (Latin/digits).
+
+    A CJK run of a single character is kept as a unigram. Documents are
+    indexed with unigrams as well, so one-character queries (e.g. 愛) match
+    inside longer runs while longer queries are scored on bigrams only.
+
+    Args:
+        text: Text to tokenize
+        unigrams: Also emit every CJK character on its own
+    """
+    tokens = []
+    for run in _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if run[0].isascii() or len(run) == 1:
+            tokens.append(run)
+            continue
+        tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+        if unigrams:
+            tokens.extend(run)
+    return tokens
+
+
+class BM25Index:
+    """BM25 over verses with CSR postings, aggregated to pericopes."""
+
+    def __init__(
+        self,
+        texts: list[str],
+        pericope_ids: list[int | None],
+        k1: float | None = None,
+        b: float | None = None,
+    ):
+        """Build the index.
+
+        Args:
+            texts: Verse texts
+            pericope_ids: Pericope id of each verse (None if unlinked)
+            k1: BM25 term-frequency saturation (default: BM25_K1)
+            b: BM25 length normalization (default: BM25_B)
+        """
+        self.k1 = settings.BM25_K1 if k1 is None else k1
+        self.b = settings.BM25_B if b is None else b
+
+        # Verse -> pericope row, for aggregation
+        self.pericope_ids = np.array(
+            sorted({p for p in pericope_ids if p is not None}), dtype=np.int32
+        )
+        pericope_rows = {p: i for i, p in enumerate(self.pericope_ids.tolist())}
+        self._verse_pericope = np.array(
+            [pericope_rows.get(p, -1) if p is not None else -1 for p in pericope_ids],
+            dtype=np.int32,
+        )
+
+        # Term -> [(verse row, tf)]
+        self.vocab: dict[str, int] = {}
+        postings: list[list[tuple[int, int]]] = []
+        doc_len = np.zeros(len(texts), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts = Counter(tokenize(text, unigrams=True))
+            doc_len[row] = sum(counts.values())
+            for term, tf in counts.items():
+                term_id = self.vocab.setdefault(term, len(postings))
+                if term_id == len(postings):
+                    postings.append([])
+                postings[term_id].append((row, tf))
+
+        self.num_docs = len(texts)
+        avg_len = float(doc_len.mean()) if len(texts) else 0.0
+
+        self._offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        self._offsets[1:] = np.cumsum([len(p) for p in postings], dtype=np.int64)
+        flat = [entry for plist in postings for entry in plist]
+        self._docs = np.array([row for row, _ in flat], dtype=np.int32)
+        tf = np.array([count for _, count in flat], dtype=np.float32)
+
+        df = np.diff(self._offsets).astype(np.float32)
+        self._idf = np.log(1.0 + (self.num_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        # Precomputed BM25 impact of each posting
+        norm = self.k1 * (1 - self.b + self.b * doc_len[self._docs] / (avg_len or 1.0))
+        term_of_posting = np.repeat(np.arange(len(postings)), np.diff(self._offsets))
+        self._impacts = (
+            self._idf[term_of_posting] * tf * (self.k1 + 1) / (tf + norm)
+        ).astype(np.float32)
+
+    def search(self, query: str, top_k: int) -> list[tuple[int, float]]:
+        """Score pericopes for a query.
+
+        Each pericope scores as its best-matching verse. Scores are divided
+        by the query's maximum attainable BM25 score, so they fall in 0-1.
+
+        Args:
+            query: Query text
+            top_k: Number of pericopes
+
+        Returns:
+            (pericope id, normalized score) pairs, best first
+        """
+        term_ids = [
+            (self.vocab[term], count)
+            for term, count in Counter(tokenize(query)).items()
+            if term in self.vocab
+        ]
+        if not term_ids or top_k <= 0:
+            return []
+
+        verse_scores = np.zeros(self.num_docs, dtype=np.float32)
+        touched = []
+        max_score = 0.0
+        for term_id, count in term_ids:
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            docs = self._docs[start:end]
+            # A term occurs once per posting list, so plain fancy-index add is safe
+            verse_scores[docs] += count * self._impacts[start:end]
+            touched.append(docs)
+            max_score += count * float(self._idf[term_id]) * (self.k1 + 1)
+
+        docs = np.unique(np.concatenate(touched))
+        owners = self._verse_pericope[docs]
+        linked = owners >= 0
+        docs, owners = docs[linked], owners[linked]
+        if not len(docs):
+            return []
+
+        pericope_scores = np.zeros(len(self.pericope_ids), dtype=np.float32)
+        np.maximum.at(pericope_scores, owners, verse_scores[docs])
+
+        candidates = np.unique(owners)
+        scores = pericope_scores[candidates]
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return [
+            (int(self.pericope_ids[candidates[i]]), float(scores[i]) / max_score)
+            for i in order
+        ]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size."""
+        return {
+            "backend": "bm25",
+            "verses": self.num_docs,
+            "terms": len(self.vocab),
+            "postings": len(self._docs),
+            "memory_mb": round(
+                (self._docs.nbytes + self._impacts.nbytes + self._offsets.nbytes) / 1024 / 1024,
+                2,
+            ),
+        }
+
+
+async def build_bm25_index(db: AsyncSession) -> BM25Index:
+    """Build the BM25 index from all verses in the database."""
+    start = time.perf_counter()
+    result = await db.execute(
+        select(Verse.text, Verse.pericope_id).order_by(Verse.book_id, Verse.chapter, Verse.verse)
+    )
+    rows = result.all()
+    index = await asyncio.to_thread(
+        BM25Index, [row.text for row in rows], [row.pericope_id for row in rows]
+    )
+    logger.info(
+        f"Built BM25 index: {index.num_docs} verses, {len(index.vocab)} terms "
+        f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+    )
+    return index
+
+
+# Singleton instance
+_bm25_index: BM25Index | None = None
+_bm25_index_version: str | None = None
+_bm25_index_lock = asyncio.Lock()
+
+
+async def get_bm25_index(db: AsyncSession) -> BM25Index:
+    """Get or build the BM25 index singleton.
+
+    The index is rebuilt when the corpus version changes.
+    """
+    global _bm25_index, _bm25_index_version
+    version = await get_corpus_version(db)
+    if _bm25_index is not None and _bm25_index_version == version:
+        return _bm25_index
+
+    async with _bm25_index_lock:
+        if _bm25_index is None or _bm25_index_version != version:
+            _bm25_index = await build_bm25_index(db)
+            _bm25_index_version = version
+    return _bm25_index
+
+
+async def init_sparse_index() -> None:
+    """Build the BM25 index at startup when SPARSE_BACKEND is bm25."""
+    if settings.SPARSE_BACKEND != "bm25":
+        return
+    try:
+        async with async_session_maker() as db:
+            await get_bm25_index(db)
+    except Exception as e:
+        logger.warning(f"Failed to build BM25 index at startup: {e}")
@@ -0,0 +1,145 @@
+"""Lightweight per-request span recorder.
+
+A Trace is bound to the current task with a ContextVar, so pipeline stages,
+retrievers, the context builder and the LLM client can record spans without
+threading a tracer argument through every call. Tasks started with
+``asyncio.gather`` inherit the context and record into the same trace.
+When no trace is active, ``span()`` is a cheap no-op.
+"""
+
+import json
+import logging
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_current_trace: ContextVar["Trace | None"] = ContextVar("current_trace", default=None)
+
+
+@dataclass
+class Span:
+    """A timed stage within a trace."""
+
+    name: str
+    start_ms: float = 0.0
+    duration_ms: float = 0.0
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Render the span as a JSON-serializable dict."""
+        return {
+            "name": self.name,
+            "start_ms": round(self.start_ms, 2),
+            "duration_ms": round(self.duration_ms, 2),
+            "attributes": self.attributes,
+        }
+
+
+class Trace:
+    """Spans recorded for a single query."""
+
+    def __init__(self, query: str | None = None, debug: bool = False):
+        self.trace_id = uuid.uuid4().hex
+        self.query = query
+        self.debug = debug
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.spans: list[Span] = []
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Record a span around a block."""
+        start = time.perf_counter()
+        span = Span(name=name, start_ms=(start - self._start) * 1000, attributes=attributes)
+        try:
+            yield span
+        finally:
+            span.duration_ms = (time.perf_counter() - start) * 1000
+            self.spans.append(span)
+
+    def stages(self) -> dict[str, float]:
+        """Total milliseconds per span name, in first-seen order."""
+        totals: dict[str, float] = {}
+        for span in sorted(self.spans, key=lambda s: s.start_ms):
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+        return {name: round(ms, 2) for name, ms in totals.items()}
+
+    def find(self, prefix: str) -> list[Span]:
+        """Spans whose name starts with prefix."""
+        return [s for s in self.spans if s.name.startswith(prefix)]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Render the full trace as a JSON-serializable dict."""
+        return {
+            "trace_id": self.trace_id,
+            "query": self.query,
+            "started_at": self.started_at,
+            "total_ms": round((time.perf_counter() - self._start) * 1000, 2),
+            "spans": [s.to_dict() for s in sorted(self.spans, key=lambda s: s.start_ms)],
+        }
+
+
+@contextmanager
+def trace_request(query: str | None = None, debug: bool = False) -> Iterator[Trace]:
+    """Bind a new trace to the current context for the duration of a block.
+
+    Args:
+        query: Query text recorded with the trace
+        debug: Whether the full trace is returned to the client
+    """
+    trace = Trace(query, debug=debug)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        try:
+            _current_trace.reset(token)
+        except ValueError:
+            # Async generators may be finalized from another context
+            pass
+
+
+def current_trace() -> Trace | None:
+    """Get the trace bound to the current context, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Record a span in the current trace (no-op without one).
+
+    Usage:
+        with span("dense.pgvector", top_k=top_k) as s:
+            rows = ...
+            s.attributes["rows"] = len(rows)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield Span(name=name, attributes=attributes)
+        return
+
+    with trace.span(name, **attributes) as recorded:
+        yield recorded
+
+
+def export_trace(trace: Trace) -> None:
+    """Append a trace to the JSONL file at TRACE_EXPORT_PATH, if configured."""
+    if not settings.TRACE_EXPORT_PATH:
+        return
+
+    try:
+        path = Path(settings.TRACE_EXPORT_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(trace.to_dict(), ensure_ascii=False, default=str) + "\n")
+    except OSError as e:
+        logger.warning(f"Failed to export trace: {e}")
@@ -0,0 +1,97 @@
+"""Keyset cursors and capped counts for paginated endpoints."""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from typing import TypeVar
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+def encode_cursor(*values: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple[int, ...]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+        size: Expected number of key values
+
+    Returns:
+        Sort key tuple
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(isinstance(v, int) and not isinstance(v, bool) for v in values)
+    ):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return tuple(values)
+
+
+def split_page(
+    rows: list[T],
+    page_size: int,
+    key: Callable[[T], tuple[int, ...]],
+) -> tuple[list[T], str | None]:
+    """Trim rows fetched with page_size + 1 and build the next cursor.
+
+    Args:
+        rows: Rows fetched with one extra row beyond the page
+        page_size: Page size
+        key: Sort key of a row, encoded into the cursor
+
+    Returns:
+        (rows on this page, cursor for the next page or None on the last page)
+    """
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_cursor(*key(rows[-1]))
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (escape char: \\)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def total_pages(total: int, page_size: int) -> int:
+    """Number of pages needed for total items."""
+    return -(-total // page_size) if total > 0 else 0
+
+
+async def capped_count(db: AsyncSession, stmt: Select, cap: int) -> tuple[int, bool]:
+    """Count the rows of a query, stopping after cap.
+
+    Args:
+        db: Database session
+        stmt: Query whose rows are counted
+        cap: Maximum number of rows to count
+
+    Returns:
+        (count, whether the count is exact)
+    """
+    result = await db.execute(
+        select(func.count()).select_from(stmt.limit(cap + 1).subquery())
+    )
+    count = result.scalar() or 0
+    if count > cap:
+        return cap, False
+    return count, True
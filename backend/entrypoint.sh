@@ -127,7 +127,7 @@ if [ "$NEO4J_AVAILABLE" = true ]; then
         echo "  Step 1/3: LLM Entity Extraction (6-10 hours)..."
 
         # Run entity extractor with resume support
-        if python -m scripts.entity_extractor --batch-size 10; then
+        if python -m scripts.entity_extractor; then
             echo "  Entity extraction completed!"
 
             echo "  Step 2/3: Building Neo4j graph..."
@@ -146,7 +146,7 @@ if [ "$NEO4J_AVAILABLE" = true ]; then
             fi
         else
             echo "  WARNING: Entity extraction failed or interrupted."
-            echo "  You can resume later with: docker compose exec backend python -m scripts.entity_extractor --batch-size 10"
+            echo "  You can resume later with: docker compose exec backend python -m scripts.entity_extractor"
         fi
     else
         echo "  Knowledge graph already has $ENTITY_COUNT entities. Skipping build."
@@ -175,7 +175,12 @@ except Exception as e:
                 echo "  WARNING: Neo4j sync failed."
             fi
         else
-            echo "  Neo4j already has $NEO4J_NODE_COUNT nodes."
+            echo "  Neo4j already has $NEO4J_NODE_COUNT nodes. Applying changes since last sync..."
+            if ! python -m scripts.build_graph --incremental; then
+                echo "  WARNING: Incremental Neo4j sync failed. The graph was left as is."
+                echo "  If it has no sync watermark yet, run 'python -m scripts.build_graph' once"
+                echo "  and re-import cross-references and topic relations."
+            fi
         fi
     fi
 else
@@ -0,0 +1,218 @@
+"""Benchmark dense index backends on latency and recall.
+
+Runs the same query vectors through pgvector and the in-process numpy index
+(exact, int8 and binary) and reports per-query latency and recall@k against
+exact float32 search.
+
+Queries are the labelled seed queries encoded with bge-m3 by default, or
+stored pericope embeddings with Gaussian noise (--synthetic, no model needed).
+
+Usage:
+    python -m scripts.benchmark_dense_index
+    python -m scripts.benchmark_dense_index --synthetic 500 --top-k 20
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.services.dense_index import (
+    QUANTIZATIONS,
+    NumpyDenseIndex,
+    PgVectorIndex,
+    load_vectors,
+)
+
+
+def encode_seed_queries(seeds_path: Path) -> np.ndarray:
+    """Encode the labelled seed queries with bge-m3."""
+    try:
+        from FlagEmbedding import BGEM3FlagModel
+    except ImportError:
+        print("FlagEmbedding not installed. Run: pip install FlagEmbedding, or use --synthetic")
+        sys.exit(1)
+
+    with open(seeds_path, encoding="utf-8") as f:
+        texts = [text for examples in json.load(f).values() for text in examples]
+
+    print(f"Encoding {len(texts)} seed queries with bge-m3...")
+    model = BGEM3FlagModel(settings.EMBED_MODEL_NAME, use_fp16=settings.EMBED_USE_FP16)
+    output = model.encode(
+        texts,
+        batch_size=settings.EMBED_BATCH_SIZE,
+        return_dense=True,
+        return_sparse=False,
+        return_colbert_vecs=False,
+    )
+    vectors = np.asarray(output["dense_vecs"], dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def synthetic_queries(vectors: np.ndarray, count: int, noise: float, seed: int) -> np.ndarray:
+    """Perturb randomly chosen stored vectors to use as queries."""
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(vectors), size=count)
+    queries = vectors[picks] + rng.normal(0, noise, size=(count, vectors.shape[1]))
+    queries = queries.astype(np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def recall(truth: list[list[int]], found: list[list[int]]) -> float:
+    """Mean fraction of the exact top-k ids that were returned."""
+    scores = [len(set(t) & set(f)) / len(t) for t, f in zip(truth, found) if t]
+    return float(np.mean(scores)) if scores else 0.0
+
+
+def summarize(name: str, latencies: list[float], hits: list[list[int]], truth: list[list[int]]):
+    """Print one result row."""
+    ms = np.array(latencies) * 1000
+    print(
+        f"  {name:<16} mean={ms.mean():>8.3f}ms  p50={np.percentile(ms, 50):>8.3f}ms  "
+        f"p95={np.percentile(ms, 95):>8.3f}ms  recall={recall(truth, hits):.3f}"
+    )
+
+
+async def benchmark(
+    top_k: int,
+    synthetic: int,
+    noise: float,
+    rerank_factor: int,
+    seeds_path: Path,
+    skip_pgvector: bool,
+    seed: int,
+) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(settings.DATABASE_URL)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with async_session() as session:
+            start = time.perf_counter()
+            ids, vectors = await load_vectors(session)
+            print(f"Loaded {len(ids)} pericope vectors in {time.perf_counter() - start:.2f}s")
+            if not len(ids):
+                print("No embeddings found. Run build_index first.")
+                return
+
+            if synthetic:
+                queries = synthetic_queries(vectors, synthetic, noise, seed)
+            else:
+                queries = encode_seed_queries(seeds_path)
+            print(f"Benchmarking {len(queries)} queries, top_k={top_k}\n")
+
+            exact = NumpyDenseIndex(ids, vectors, "none")
+            truth = [[i for i, _ in exact.search_vector(q, top_k)] for q in queries]
+
+            print("=" * 80)
+            print("Dense Index Benchmark")
+            print("=" * 80)
+
+            if not skip_pgvector:
+                pg = PgVectorIndex()
+                # Warm up the connection and the HNSW pages
+                await pg.search(session, queries[0], top_k)
+                latencies, hits = [], []
+                for q in queries:
+                    start = time.perf_counter()
+                    result = await pg.search(session, q, top_k)
+                    latencies.append(time.perf_counter() - start)
+                    hits.append([i for i, _ in result])
+                summarize("pgvector", latencies, hits, truth)
+
+            for quantization in QUANTIZATIONS:
+                index = NumpyDenseIndex(ids, vectors, quantization, rerank_factor)
+                index.search_vector(queries[0], top_k)
+                latencies, hits = [], []
+                for q in queries:
+                    start = time.perf_counter()
+                    result = index.search_vector(q, top_k)
+                    latencies.append(time.perf_counter() - start)
+                    hits.append([i for i, _ in result])
+                summarize(f"numpy/{quantization}", latencies, hits, truth)
+
+            float_mb = vectors.nbytes / 1024 / 1024
+            print(f"\nfloat32 matrix: {float_mb:.2f} MB "
+                  f"(int8 codes: {float_mb / 4:.2f} MB, binary codes: {float_mb / 32:.2f} MB)")
+
+    finally:
+        await engine.dispose()
+
+
+def main():
+    """CLI entry point."""
+    data_dir = Path(__file__).parent.parent / "data"
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark pgvector against the in-process numpy dense index",
+    )
+    parser.add_argument(
+        "-k", "--top-k",
+        type=int,
+        default=settings.MAX_RETRIEVE_RESULTS,
+        help=f"Hits per query (default: {settings.MAX_RETRIEVE_RESULTS})",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        help="Use N perturbed stored vectors as queries instead of encoding seed queries",
+    )
+    parser.add_argument(
+        "--noise",
+        type=float,
+        default=0.02,
+        help="Per-dimension noise for --synthetic queries (default: 0.02)",
+    )
+    parser.add_argument(
+        "--rerank-factor",
+        type=int,
+        default=settings.DENSE_INDEX_RERANK_FACTOR,
+        help=f"Candidates per hit re-ranked in quantized modes "
+             f"(default: {settings.DENSE_INDEX_RERANK_FACTOR})",
+    )
+    parser.add_argument(
+        "--seeds",
+        type=Path,
+        default=data_dir / "query_type_seeds.json",
+        help="Seed queries to encode (default: data/query_type_seeds.json)",
+    )
+    parser.add_argument(
+        "--skip-pgvector",
+        action="store_true",
+        help="Only benchmark the numpy backend",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed for --synthetic (default: 42)",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        benchmark(
+            top_k=args.top_k,
+            synthetic=args.synthetic,
+            noise=args.noise,
+            rerank_factor=args.rerank_factor,
+            seeds_path=args.seeds,
+            skip_pgvector=args.skip_pgvector,
+            seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
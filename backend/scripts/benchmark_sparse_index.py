@@ -0,0 +1,142 @@
+"""Benchmark sparse retrieval: PostgreSQL FTS vs in-memory bigram BM25.
+
+Runs each labelled seed query (and any extra queries given with --queries)
+through both engines and reports per-query latency, hit rate (share of
+queries with at least one pericope) and mean hits per query.
+
+Usage:
+    python -m scripts.benchmark_sparse_index
+    python -m scripts.benchmark_sparse_index --queries my_queries.txt --top-k 20 -v
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.services.retrievers.sparse_retriever import SparseRetriever
+from app.services.sparse_index import build_bm25_index
+
+
+def load_queries(seeds_path: Path, queries_path: Path | None) -> list[str]:
+    """Load seed queries plus optional one-per-line extra queries."""
+    with open(seeds_path, encoding="utf-8") as f:
+        queries = [text for examples in json.load(f).values() for text in examples]
+
+    if queries_path:
+        with open(queries_path, encoding="utf-8") as f:
+            queries.extend(line.strip() for line in f if line.strip())
+
+    return queries
+
+
+def summarize(name: str, latencies: list[float], hits: list[list[int]]):
+    """Print one result row."""
+    ms = np.array(latencies) * 1000
+    hit_rate = sum(1 for h in hits if h) / len(hits)
+    mean_hits = float(np.mean([len(h) for h in hits]))
+    print(
+        f"  {name:<8} mean={ms.mean():>8.3f}ms  p50={np.percentile(ms, 50):>8.3f}ms  "
+        f"p95={np.percentile(ms, 95):>8.3f}ms  hit_rate={hit_rate:.3f}  mean_hits={mean_hits:.1f}"
+    )
+
+
+async def benchmark(
+    queries: list[str],
+    top_k: int,
+    verbose: bool = False,
+) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine(settings.DATABASE_URL)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with async_session() as session:
+            start = time.perf_counter()
+            index = await build_bm25_index(session)
+            stats = index.get_stats()
+            print(f"Built BM25 index in {time.perf_counter() - start:.2f}s: "
+                  f"{stats['verses']} verses, {stats['terms']} terms, "
+                  f"{stats['postings']} postings ({stats['memory_mb']} MB)")
+            print(f"Benchmarking {len(queries)} queries, top_k={top_k}\n")
+
+            retriever = SparseRetriever(session)
+            await retriever.search_fts(queries[0], top_k)
+
+            fts_latencies, fts_hits = [], []
+            for query in queries:
+                start = time.perf_counter()
+                result = await retriever.search_fts(query, top_k)
+                fts_latencies.append(time.perf_counter() - start)
+                fts_hits.append([pericope_id for pericope_id, _ in result])
+
+            bm25_latencies, bm25_hits = [], []
+            for query in queries:
+                start = time.perf_counter()
+                result = index.search(query, top_k)
+                bm25_latencies.append(time.perf_counter() - start)
+                bm25_hits.append([pericope_id for pericope_id, _ in result])
+
+            print("=" * 80)
+            print("Sparse Retrieval Benchmark")
+            print("=" * 80)
+            summarize("fts", fts_latencies, fts_hits)
+            summarize("bm25", bm25_latencies, bm25_hits)
+
+            if verbose:
+                print("\nPer-query hits (fts / bm25):")
+                for query, fts, bm25 in zip(queries, fts_hits, bm25_hits):
+                    print(f"  {len(fts):>3} / {len(bm25):>3}  {query}")
+
+    finally:
+        await engine.dispose()
+
+
+def main():
+    """CLI entry point."""
+    data_dir = Path(__file__).parent.parent / "data"
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark PostgreSQL FTS against the in-memory bigram BM25 index",
+    )
+    parser.add_argument(
+        "-k", "--top-k",
+        type=int,
+        default=settings.MAX_RETRIEVE_RESULTS,
+        help=f"Pericopes per query (default: {settings.MAX_RETRIEVE_RESULTS})",
+    )
+    parser.add_argument(
+        "--seeds",
+        type=Path,
+        default=data_dir / "query_type_seeds.json",
+        help="Seed queries (default: data/query_type_seeds.json)",
+    )
+    parser.add_argument(
+        "--queries",
+        type=Path,
+        help="Extra queries, one per line",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print hit counts per query",
+    )
+
+    args = parser.parse_args()
+
+    queries = load_queries(args.seeds, args.queries)
+    asyncio.run(benchmark(queries, args.top_k, args.verbose))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,28 +6,49 @@ This script creates the Neo4j knowledge graph by:
 3. Creating relationships
 4. Creating indexes for performance
 
+A full build records a (:SyncWatermark) node; --incremental then applies only
+rows whose updated_at is past it, plus the deletions recorded in
+graph_tombstones by the deletion triggers.
+
 Usage:
     cd backend
     python -m scripts.build_graph
     python -m scripts.build_graph --clear  # Clear existing graph first
     python -m scripts.build_graph --indexes-only  # Only create indexes
+    python -m scripts.build_graph --incremental  # Apply changes since the last build/sync
+    python -m scripts.build_graph -j 4  # Full build with 4 parallel Neo4j writers
+    python -m scripts.build_graph --export-csv data/graph_import  # Offline neo4j-admin import
 """
 
 import argparse
 import asyncio
+import csv
 import logging
 import sys
+from collections.abc import AsyncIterator
+from datetime import datetime
 from pathlib import Path
 
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from neo4j.exceptions import TransientError
+from sqlalchemy import delete, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 from app.core.neo4j_client import Neo4jClient
-from app.models.orm import Book, Chapter, Pericope, Verse, Entity, VerseEntity, Topic, VerseTopic
+from app.models.orm import (
+    Book,
+    Chapter,
+    Entity,
+    GraphTombstone,
+    Pericope,
+    Topic,
+    Verse,
+    VerseEntity,
+    VerseTopic,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,12 +60,130 @@ logger = logging.getLogger(__name__)
 NODE_BATCH_SIZE = 500
 RELATIONSHIP_BATCH_SIZE = 1000
 
+# Incremental sync: watermark node name
+WATERMARK_NAME = "postgres"
+
+# Attempts per write batch when parallel writers deadlock
+WRITE_RETRIES = 5
+
+# Rows fetched per round trip when streaming the CSV export
+EXPORT_FETCH_SIZE = 5000
+
+# Entity type -> (node label, stats key, mention relationship type)
+ENTITY_LABELS = {
+    "PERSON": ("Person", "persons", "MENTIONS_PERSON"),
+    "PLACE": ("Place", "places", "MENTIONS_PLACE"),
+    "GROUP": ("Group", "groups", "MENTIONS_GROUP"),
+    "EVENT": ("Event", "events", "MENTIONS_EVENT"),
+}
+
+ENTITY_MENTIONS = "|".join(rel_type for _, _, rel_type in ENTITY_LABELS.values())
+
+# Tombstoned node table -> (model, node labels)
+TOMBSTONE_NODES = {
+    "books": (Book, ("Book",)),
+    "chapters": (Chapter, ("Chapter",)),
+    "pericopes": (Pericope, ("Pericope",)),
+    "verses": (Verse, ("Verse",)),
+    "entities": (Entity, tuple(label for label, _, _ in ENTITY_LABELS.values())),
+    "topics": (Topic, ("Topic",)),
+}
+
+# Tombstoned link table -> (model, target id column, relationship types)
+TOMBSTONE_LINKS = {
+    "verse_entities": (VerseEntity, VerseEntity.entity_id, ENTITY_MENTIONS),
+    "verse_topics": (VerseTopic, VerseTopic.topic_id, "MENTIONS_TOPIC"),
+}
+
+
+async def sync_point(session: AsyncSession) -> datetime:
+    """Timestamp from which the next incremental sync must read.
+
+    ``updated_at`` defaults to ``now()``, the start time of the writing
+    transaction, so a transaction still open at this moment can later commit
+    rows stamped earlier than the current time (e.g. the COPY load of
+    build_index or relink_entities). The sync point is therefore the start of
+    the oldest open transaction in this database, or the current time if
+    there is none. Other roles' transactions are only visible with
+    pg_read_all_stats.
+    """
+    result = await session.execute(
+        text("""
+            SELECT LEAST(clock_timestamp(), (
+                SELECT min(xact_start)
+                FROM pg_stat_activity
+                WHERE datname = current_database()
+                  AND backend_type = 'client backend'
+                  AND pid <> pg_backend_pid()
+            ))
+        """)
+    )
+    return result.scalar_one()
+
+
+def _book_props(b: Book) -> dict:
+    return {
+        "id": b.id,
+        "name_zh": b.name_zh,
+        "abbrev_zh": b.abbrev_zh,
+        "testament": b.testament,
+        "order_index": b.order_index,
+    }
+
+
+def _chapter_props(c: Chapter) -> dict:
+    return {"id": c.id, "book_id": c.book_id, "number": c.number}
+
+
+def _pericope_props(p: Pericope) -> dict:
+    return {
+        "id": p.id,
+        "book_id": p.book_id,
+        "title": p.title,
+        "chapter_start": p.chapter_start,
+        "verse_start": p.verse_start,
+        "chapter_end": p.chapter_end,
+        "verse_end": p.verse_end,
+    }
+
+
+def _verse_props(v: Verse) -> dict:
+    return {
+        "id": v.id,
+        "book_id": v.book_id,
+        "chapter": v.chapter,
+        "verse": v.verse,
+        "text": v.text[:500] if v.text else "",  # Truncate for Neo4j
+        "pericope_id": v.pericope_id,
+    }
+
+
+def _entity_props(e: Entity) -> dict:
+    return {"id": e.id, "name": e.name, "description": e.description or ""}
+
+
+def _topic_props(t: Topic) -> dict:
+    return {
+        "id": t.id,
+        "name": t.name,
+        "type": t.type,
+        "description": t.description or "",
+    }
+
 
 class GraphBuilder:
     """Build Neo4j knowledge graph from PostgreSQL data."""
 
-    def __init__(self, pg_session: AsyncSession):
+    def __init__(self, pg_session: AsyncSession, workers: int = 1):
+        """Create a builder.
+
+        Args:
+            pg_session: PostgreSQL async session
+            workers: Concurrent Neo4j writers for verse nodes and mention
+                relationships
+        """
         self.pg_session = pg_session
+        self.workers = max(1, workers)
 
     async def build_full_graph(self, clear_existing: bool = True) -> dict:
         """Build the complete knowledge graph.
@@ -68,8 +207,12 @@ class GraphBuilder:
             "relationships": 0,
         }
 
+        # Rows changed from here on are picked up by the next incremental sync
+        started_at = await sync_point(self.pg_session)
+
         if clear_existing:
             logger.info("Clearing existing graph...")
+            await self._clear_tombstones()
             await self._clear_graph()
 
         # Create structural nodes
@@ -107,9 +250,336 @@ class GraphBuilder:
         logger.info("Creating indexes...")
         await self._create_indexes()
 
+        await self._set_watermark(started_at)
+
         logger.info(f"Graph building complete: {stats}")
         return stats
 
+    async def sync_incremental(self) -> dict:
+        """Apply PostgreSQL changes since the last build or sync to the graph.
+
+        Rows whose updated_at is at or past the stored (:SyncWatermark) are
+        MERGEd with their structural and mention relationships. Nodes and
+        mention edges of rows recorded in graph_tombstones are removed unless
+        the row exists again, and the processed tombstones are consumed. The
+        new watermark is taken from sync_point. The graph is never cleared
+        here: without a watermark (a graph built before watermarks existed)
+        the sync refuses to run, since a rebuild would drop the edges that
+        only the cross-reference and topic-relation scripts create.
+
+        Returns:
+            Statistics dict
+
+        Raises:
+            RuntimeError: If the graph has no sync watermark yet
+        """
+        since = await self.get_watermark()
+        if since is None:
+            raise RuntimeError(
+                "No sync watermark found. Run an explicit full build "
+                "(python -m scripts.build_graph), then re-run the scripts "
+                "that add cross-reference and topic-relation edges."
+            )
+
+        started_at = await sync_point(self.pg_session)
+        logger.info(f"Syncing rows changed since {since.isoformat()}")
+
+        stats = {
+            "nodes_merged": 0,
+            "nodes_deleted": 0,
+            "relationships_merged": 0,
+            "relationships_deleted": 0,
+        }
+
+        # Deletions, read before the changes so a re-inserted row is MERGEd back
+        tombstones = await self._apply_tombstones(stats)
+
+        # Nodes
+        for model, label, props in (
+            (Book, "Book", _book_props),
+            (Chapter, "Chapter", _chapter_props),
+            (Pericope, "Pericope", _pericope_props),
+            (Verse, "Verse", _verse_props),
+            (Topic, "Topic", _topic_props),
+        ):
+            rows = await self._changed(model, since)
+            stats["nodes_merged"] += await self._merge_nodes(label, [props(r) for r in rows])
+            if model is Chapter:
+                await self._merge_parent_relationships("Book", "HAS_CHAPTER", "Chapter", rows)
+            elif model is Pericope:
+                await self._merge_parent_relationships("Book", "HAS_PERICOPE", "Pericope", rows)
+            elif model is Verse:
+                stats["relationships_deleted"] += await self._delete_stale_verse_parents(rows)
+                await self._merge_parent_relationships(
+                    "Pericope", "HAS_VERSE", "Verse", [v for v in rows if v.pericope_id]
+                )
+
+        entities = await self._changed(Entity, since)
+        for entity_type, (label, _, _) in ENTITY_LABELS.items():
+            stats["nodes_merged"] += await self._merge_nodes(
+                label, [_entity_props(e) for e in entities if e.type == entity_type]
+            )
+
+        # Mention relationships
+        result = await self.pg_session.execute(
+            select(VerseEntity, Entity.type)
+            .join(Entity, VerseEntity.entity_id == Entity.id)
+            .where(VerseEntity.updated_at >= since)
+        )
+        entity_links = result.all()
+        for entity_type, (label, _, rel_type) in ENTITY_LABELS.items():
+            data = [
+                {"verse_id": ve.verse_id, "entity_id": ve.entity_id, "role": ve.role or ""}
+                for ve, link_type in entity_links
+                if link_type == entity_type
+            ]
+            for i in range(0, len(data), RELATIONSHIP_BATCH_SIZE):
+                await Neo4jClient.execute_write(
+                    f"""
+                    UNWIND $data AS d
+                    MATCH (v:Verse {{id: d.verse_id}})
+                    MATCH (e:{label} {{id: d.entity_id}})
+                    MERGE (v)-[r:{rel_type}]->(e)
+                    SET r.role = d.role
+                    """,
+                    {"data": data[i:i + RELATIONSHIP_BATCH_SIZE]}
+                )
+            stats["relationships_merged"] += len(data)
+
+        result = await self.pg_session.execute(
+            select(VerseTopic).where(VerseTopic.updated_at >= since)
+        )
+        topic_links = result.scalars().all()
+        data = [
+            {"verse_id": vt.verse_id, "topic_id": vt.topic_id, "weight": vt.weight}
+            for vt in topic_links
+        ]
+        for i in range(0, len(data), RELATIONSHIP_BATCH_SIZE):
+            await Neo4jClient.execute_write(
+                """
+                UNWIND $data AS d
+                MATCH (v:Verse {id: d.verse_id})
+                MATCH (t:Topic {id: d.topic_id})
+                MERGE (v)-[r:MENTIONS_TOPIC]->(t)
+                SET r.weight = d.weight
+                """,
+                {"data": data[i:i + RELATIONSHIP_BATCH_SIZE]}
+            )
+        stats["relationships_merged"] += len(data)
+
+        await self._set_watermark(started_at)
+        await self._consume_tombstones(tombstones)
+
+        logger.info(f"Incremental sync complete: {stats}")
+        return stats
+
+    async def get_watermark(self) -> datetime | None:
+        """Timestamp up to which PostgreSQL changes are in the graph."""
+        result = await Neo4jClient.execute_read(
+            "MATCH (w:SyncWatermark {name: $name}) RETURN w.updated_at AS updated_at",
+            {"name": WATERMARK_NAME},
+        )
+        if not result or not result[0]["updated_at"]:
+            return None
+        return datetime.fromisoformat(result[0]["updated_at"])
+
+    async def _set_watermark(self, updated_at: datetime) -> None:
+        await Neo4jClient.execute_write(
+            """
+            MERGE (w:SyncWatermark {name: $name})
+            SET w.updated_at = $updated_at
+            """,
+            {"name": WATERMARK_NAME, "updated_at": updated_at.isoformat()},
+        )
+
+    async def _delete_matching(
+        self,
+        match: str,
+        parameters: dict,
+        variable: str,
+        detach: bool = False,
+    ) -> int:
+        """Count, then delete, what a MATCH clause binds to ``variable``."""
+        result = await Neo4jClient.execute_read(
+            f"{match} RETURN count({variable}) AS count", parameters
+        )
+        count = result[0]["count"] if result else 0
+        if count:
+            delete = "DETACH DELETE" if detach else "DELETE"
+            await Neo4jClient.execute_write(f"{match} {delete} {variable}", parameters)
+        return count
+
+    async def _changed(self, model, since: datetime) -> list:
+        """Rows of a model updated at or after ``since``."""
+        result = await self.pg_session.execute(
+            select(model).where(model.updated_at >= since).order_by(model.id)
+        )
+        return result.scalars().all()
+
+    async def _merge_nodes(self, label: str, data: list[dict]) -> int:
+        """MERGE nodes by id and overwrite their properties."""
+        for i in range(0, len(data), NODE_BATCH_SIZE):
+            await Neo4jClient.execute_write(
+                f"""
+                UNWIND $rows AS row
+                MERGE (n:{label} {{id: row.id}})
+                SET n += row
+                """,
+                {"rows": data[i:i + NODE_BATCH_SIZE]}
+            )
+        return len(data)
+
+    async def _merge_parent_relationships(
+        self,
+        parent_label: str,
+        rel_type: str,
+        child_label: str,
+        rows: list,
+    ) -> None:
+        """MERGE parent->child structural relationships of changed children."""
+        parent_key = "pericope_id" if parent_label == "Pericope" else "book_id"
+        data = [{"id": r.id, "parent_id": getattr(r, parent_key)} for r in rows]
+        for i in range(0, len(data), RELATIONSHIP_BATCH_SIZE):
+            await Neo4jClient.execute_write(
+                f"""
+                UNWIND $data AS d
+                MATCH (c:{child_label} {{id: d.id}})
+                MATCH (p:{parent_label} {{id: d.parent_id}})
+                MERGE (p)-[:{rel_type}]->(c)
+                """,
+                {"data": data[i:i + RELATIONSHIP_BATCH_SIZE]}
+            )
+
+    async def _delete_stale_verse_parents(self, verses: list[Verse]) -> int:
+        """Delete HAS_VERSE edges from pericopes a changed verse no longer belongs to."""
+        deleted = 0
+        data = [{"id": v.id, "pericope_id": v.pericope_id} for v in verses]
+        for i in range(0, len(data), RELATIONSHIP_BATCH_SIZE):
+            deleted += await self._delete_matching(
+                """
+                UNWIND $data AS d
+                MATCH (p:Pericope)-[r:HAS_VERSE]->(:Verse {id: d.id})
+                WHERE d.pericope_id IS NULL OR p.id <> d.pericope_id
+                """,
+                {"data": data[i:i + RELATIONSHIP_BATCH_SIZE]},
+                "r",
+            )
+        return deleted
+
+    async def _apply_tombstones(self, stats: dict) -> list[int]:
+        """Delete graph nodes and mention edges of rows recorded as deleted.
+
+        A tombstoned row that exists again (deleted and re-inserted, e.g. by
+        relink_entities) is left in place.
+
+        Args:
+            stats: Sync statistics to update
+
+        Returns:
+            Ids of the processed tombstones
+        """
+        result = await self.pg_session.execute(
+            select(
+                GraphTombstone.id,
+                GraphTombstone.table_name,
+                GraphTombstone.row_id,
+                GraphTombstone.ref_id,
+            )
+        )
+        tombstones = result.all()
+        if not tombstones:
+            return []
+
+        deleted_rows: dict[str, set] = {}
+        for t in tombstones:
+            key = t.row_id if t.ref_id is None else (t.row_id, t.ref_id)
+            deleted_rows.setdefault(t.table_name, set()).add(key)
+
+        for table, (model, labels) in TOMBSTONE_NODES.items():
+            ids = deleted_rows.get(table)
+            if not ids:
+                continue
+            ids = sorted(ids - await self._existing_keys([model.id], ids))
+            for label in labels:
+                stats["nodes_deleted"] += await self._delete_nodes(label, ids)
+
+        for table, (model, ref_column, rel_types) in TOMBSTONE_LINKS.items():
+            pairs = deleted_rows.get(table)
+            if not pairs:
+                continue
+            columns = [model.verse_id, ref_column]
+            pairs = sorted(pairs - await self._existing_keys(columns, pairs))
+            stats["relationships_deleted"] += await self._delete_mentions(rel_types, pairs)
+
+        logger.info(f"Applied {len(tombstones)} tombstones")
+        return [t.id for t in tombstones]
+
+    async def _existing_keys(self, columns: list, keys: set) -> set:
+        """Keys among ``keys`` that still exist in PostgreSQL.
+
+        Args:
+            columns: Key columns; with several, keys are tuples of their values
+            keys: Candidate keys
+
+        Returns:
+            The subset of keys present in the table
+        """
+        key = tuple_(*columns) if len(columns) > 1 else columns[0]
+        keys = list(keys)
+        existing = set()
+        for i in range(0, len(keys), RELATIONSHIP_BATCH_SIZE):
+            result = await self.pg_session.execute(
+                select(*columns).where(key.in_(keys[i:i + RELATIONSHIP_BATCH_SIZE]))
+            )
+            existing.update(tuple(row) if len(columns) > 1 else row[0] for row in result.all())
+        return existing
+
+    async def _delete_nodes(self, label: str, ids: list[int]) -> int:
+        """DETACH DELETE nodes of a label by id."""
+        deleted = 0
+        for i in range(0, len(ids), NODE_BATCH_SIZE):
+            deleted += await self._delete_matching(
+                f"MATCH (n:{label}) WHERE n.id IN $ids",
+                {"ids": ids[i:i + NODE_BATCH_SIZE]},
+                "n",
+                detach=True,
+            )
+        return deleted
+
+    async def _delete_mentions(self, rel_types: str, pairs: list[tuple[int, int]]) -> int:
+        """Delete mention edges by (verse id, target id)."""
+        deleted = 0
+        for i in range(0, len(pairs), RELATIONSHIP_BATCH_SIZE):
+            deleted += await self._delete_matching(
+                f"""
+                UNWIND $data AS d
+                MATCH (:Verse {{id: d.verse_id}})-[r:{rel_types}]->(target)
+                WHERE target.id = d.target_id
+                """,
+                {
+                    "data": [
+                        {"verse_id": verse_id, "target_id": target_id}
+                        for verse_id, target_id in pairs[i:i + RELATIONSHIP_BATCH_SIZE]
+                    ]
+                },
+                "r",
+            )
+        return deleted
+
+    async def _consume_tombstones(self, ids: list[int]) -> None:
+        """Remove processed tombstones (after the graph reflects them)."""
+        for i in range(0, len(ids), RELATIONSHIP_BATCH_SIZE):
+            await self.pg_session.execute(
+                delete(GraphTombstone)
+                .where(GraphTombstone.id.in_(ids[i:i + RELATIONSHIP_BATCH_SIZE]))
+            )
+        await self.pg_session.commit()
+
+    async def _clear_tombstones(self) -> None:
+        """Drop all tombstones before a full rebuild (deleted rows are not read)."""
+        await self.pg_session.execute(delete(GraphTombstone))
+        await self.pg_session.commit()
+
     async def _clear_graph(self) -> None:
         """Clear all nodes and relationships."""
         await Neo4jClient.execute_write("MATCH (n) DETACH DELETE n")
@@ -119,16 +589,7 @@ class GraphBuilder:
         result = await self.pg_session.execute(select(Book))
         books = result.scalars().all()
 
-        data = [
-            {
-                "id": b.id,
-                "name_zh": b.name_zh,
-                "abbrev_zh": b.abbrev_zh,
-                "testament": b.testament,
-                "order_index": b.order_index,
-            }
-            for b in books
-        ]
+        data = [_book_props(b) for b in books]
 
         if data:
             await Neo4jClient.execute_write(
@@ -152,10 +613,7 @@ class GraphBuilder:
         result = await self.pg_session.execute(select(Chapter))
         chapters = result.scalars().all()
 
-        data = [
-            {"id": c.id, "book_id": c.book_id, "number": c.number}
-            for c in chapters
-        ]
+        data = [_chapter_props(c) for c in chapters]
 
         # Batch create
         for i in range(0, len(data), NODE_BATCH_SIZE):
@@ -175,18 +633,7 @@ class GraphBuilder:
         result = await self.pg_session.execute(select(Pericope))
         pericopes = result.scalars().all()
 
-        data = [
-            {
-                "id": p.id,
-                "book_id": p.book_id,
-                "title": p.title,
-                "chapter_start": p.chapter_start,
-                "verse_start": p.verse_start,
-                "chapter_end": p.chapter_end,
-                "verse_end": p.verse_end,
-            }
-            for p in pericopes
-        ]
+        data = [_pericope_props(p) for p in pericopes]
 
         # Batch create
         for i in range(0, len(data), NODE_BATCH_SIZE):
@@ -215,53 +662,39 @@ class GraphBuilder:
         count_result = await self.pg_session.execute(select(func.count(Verse.id)))
         total = count_result.scalar() or 0
 
-        created = 0
-        offset = 0
-
-        while offset < total:
-            result = await self.pg_session.execute(
-                select(Verse)
-                .order_by(Verse.id)
-                .offset(offset)
-                .limit(NODE_BATCH_SIZE)
-            )
-            verses = result.scalars().all()
-
-            if not verses:
-                break
-
-            data = [
-                {
-                    "id": v.id,
-                    "book_id": v.book_id,
-                    "chapter": v.chapter,
-                    "verse": v.verse,
-                    "text": v.text[:500] if v.text else "",  # Truncate for Neo4j
-                    "pericope_id": v.pericope_id,
-                }
-                for v in verses
-            ]
-
-            await Neo4jClient.execute_write(
-                """
-                UNWIND $verses AS v
-                CREATE (:Verse {
-                    id: v.id,
-                    book_id: v.book_id,
-                    chapter: v.chapter,
-                    verse: v.verse,
-                    text: v.text,
-                    pericope_id: v.pericope_id
-                })
-                """,
-                {"verses": data}
-            )
-
-            created += len(data)
-            offset += NODE_BATCH_SIZE
-            logger.info(f"  Created {created}/{total} verse nodes...")
+        async def batches():
+            offset = 0
+            while offset < total:
+                result = await self.pg_session.execute(
+                    select(Verse)
+                    .order_by(Verse.id)
+                    .offset(offset)
+                    .limit(NODE_BATCH_SIZE)
+                )
+                verses = result.scalars().all()
+
+                if not verses:
+                    break
+
+                data = [_verse_props(v) for v in verses]
+                yield (
+                    """
+                    UNWIND $verses AS v
+                    CREATE (:Verse {
+                        id: v.id,
+                        book_id: v.book_id,
+                        chapter: v.chapter,
+                        verse: v.verse,
+                        text: v.text,
+                        pericope_id: v.pericope_id
+                    })
+                    """,
+                    {"verses": data},
+                    len(data),
+                )
+                offset += NODE_BATCH_SIZE
 
-        return created
+        return await self._write_batches(batches(), total, "verse nodes")
 
     async def _create_entity_nodes(self) -> dict[str, int]:
         """Create Entity nodes (Person, Place, Group, Event)."""
@@ -280,11 +713,7 @@ class GraphBuilder:
 
         for e in entities:
             if e.type in by_type:
-                by_type[e.type].append({
-                    "id": e.id,
-                    "name": e.name,
-                    "description": e.description or "",
-                })
+                by_type[e.type].append(_entity_props(e))
 
         # Create nodes by type
         type_map = {
@@ -313,15 +742,7 @@ class GraphBuilder:
         result = await self.pg_session.execute(select(Topic))
         topics = result.scalars().all()
 
-        data = [
-            {
-                "id": t.id,
-                "name": t.name,
-                "type": t.type,
-                "description": t.description or "",
-            }
-            for t in topics
-        ]
+        data = [_topic_props(t) for t in topics]
 
         if data:
             await Neo4jClient.execute_write(
@@ -391,64 +812,50 @@ class GraphBuilder:
             logger.info("  No entity relationships to create")
             return 0
 
-        created = 0
-        offset = 0
-
-        while offset < total:
-            result = await self.pg_session.execute(
-                select(VerseEntity, Entity.type)
-                .join(Entity, VerseEntity.entity_id == Entity.id)
-                .order_by(VerseEntity.verse_id)
-                .offset(offset)
-                .limit(RELATIONSHIP_BATCH_SIZE)
-            )
-            rows = result.all()
-
-            if not rows:
-                break
-
-            # Group by entity type
-            by_type: dict[str, list] = {
-                "PERSON": [],
-                "PLACE": [],
-                "GROUP": [],
-                "EVENT": [],
-            }
-
-            for ve, entity_type in rows:
-                if entity_type in by_type:
-                    by_type[entity_type].append({
-                        "verse_id": ve.verse_id,
-                        "entity_id": ve.entity_id,
-                        "role": ve.role or "",
-                    })
-
-            # Create relationships by type
-            type_map = {
-                "PERSON": ("Person", "MENTIONS_PERSON"),
-                "PLACE": ("Place", "MENTIONS_PLACE"),
-                "GROUP": ("Group", "MENTIONS_GROUP"),
-                "EVENT": ("Event", "MENTIONS_EVENT"),
-            }
-
-            for entity_type, (label, rel_type) in type_map.items():
-                data = by_type[entity_type]
-                if data:
-                    await Neo4jClient.execute_write(
-                        f"""
-                        UNWIND $data AS d
-                        MATCH (v:Verse {{id: d.verse_id}})
-                        MATCH (e:{label} {{id: d.entity_id}})
-                        CREATE (v)-[:{rel_type} {{role: d.role}}]->(e)
-                        """,
-                        {"data": data}
-                    )
-
-            created += len(rows)
-            offset += RELATIONSHIP_BATCH_SIZE
-            logger.info(f"  Created {created}/{total} entity relationships...")
-
-        return created
+        async def batches():
+            offset = 0
+            while offset < total:
+                result = await self.pg_session.execute(
+                    select(VerseEntity, Entity.type)
+                    .join(Entity, VerseEntity.entity_id == Entity.id)
+                    .order_by(VerseEntity.verse_id)
+                    .offset(offset)
+                    .limit(RELATIONSHIP_BATCH_SIZE)
+                )
+                rows = result.all()
+
+                if not rows:
+                    break
+
+                # Group by entity type
+                by_type: dict[str, list] = {entity_type: [] for entity_type in ENTITY_LABELS}
+
+                for ve, entity_type in rows:
+                    if entity_type in by_type:
+                        by_type[entity_type].append({
+                            "verse_id": ve.verse_id,
+                            "entity_id": ve.entity_id,
+                            "role": ve.role or "",
+                        })
+
+                # Create relationships by type
+                for entity_type, (label, _, rel_type) in ENTITY_LABELS.items():
+                    data = by_type[entity_type]
+                    if data:
+                        yield (
+                            f"""
+                            UNWIND $data AS d
+                            MATCH (v:Verse {{id: d.verse_id}})
+                            MATCH (e:{label} {{id: d.entity_id}})
+                            CREATE (v)-[:{rel_type} {{role: d.role}}]->(e)
+                            """,
+                            {"data": data},
+                            len(data),
+                        )
+
+                offset += RELATIONSHIP_BATCH_SIZE
+
+        return await self._write_batches(batches(), total, "entity relationships")
 
     async def _create_topic_relationships(self) -> int:
         """Create topic mention relationships (Verse->Topic)."""
@@ -462,45 +869,102 @@ class GraphBuilder:
             logger.info("  No topic relationships to create")
             return 0
 
-        created = 0
-        offset = 0
-
-        while offset < total:
-            result = await self.pg_session.execute(
-                select(VerseTopic)
-                .order_by(VerseTopic.verse_id)
-                .offset(offset)
-                .limit(RELATIONSHIP_BATCH_SIZE)
-            )
-            verse_topics = result.scalars().all()
+        async def batches():
+            offset = 0
+            while offset < total:
+                result = await self.pg_session.execute(
+                    select(VerseTopic)
+                    .order_by(VerseTopic.verse_id)
+                    .offset(offset)
+                    .limit(RELATIONSHIP_BATCH_SIZE)
+                )
+                verse_topics = result.scalars().all()
+
+                if not verse_topics:
+                    break
+
+                data = [
+                    {
+                        "verse_id": vt.verse_id,
+                        "topic_id": vt.topic_id,
+                        "weight": vt.weight,
+                    }
+                    for vt in verse_topics
+                ]
+                yield (
+                    """
+                    UNWIND $data AS d
+                    MATCH (v:Verse {id: d.verse_id})
+                    MATCH (t:Topic {id: d.topic_id})
+                    CREATE (v)-[:MENTIONS_TOPIC {weight: d.weight}]->(t)
+                    """,
+                    {"data": data},
+                    len(data),
+                )
+                offset += RELATIONSHIP_BATCH_SIZE
 
-            if not verse_topics:
-                break
+        return await self._write_batches(batches(), total, "topic relationships")
 
-            data = [
-                {
-                    "verse_id": vt.verse_id,
-                    "topic_id": vt.topic_id,
-                    "weight": vt.weight,
-                }
-                for vt in verse_topics
-            ]
+    async def _write_batches(
+        self,
+        batches: AsyncIterator[tuple[str, dict, int]],
+        total: int,
+        what: str,
+    ) -> int:
+        """Run write batches on ``self.workers`` Neo4j sessions.
 
-            await Neo4jClient.execute_write(
-                """
-                UNWIND $data AS d
-                MATCH (v:Verse {id: d.verse_id})
-                MATCH (t:Topic {id: d.topic_id})
-                CREATE (v)-[:MENTIONS_TOPIC {weight: d.weight}]->(t)
-                """,
-                {"data": data}
-            )
+        PostgreSQL reads stay on the single session (the producer) while the
+        writers drain a bounded queue, each in its own Neo4j transaction.
 
-            created += len(data)
-            offset += RELATIONSHIP_BATCH_SIZE
-            logger.info(f"  Created {created}/{total} topic relationships...")
+        Args:
+            batches: (cypher, parameters, row count) tuples
+            total: Expected row count, for progress
+            what: Label for progress logs
 
-        return created
+        Returns:
+            Rows written
+        """
+        queue: asyncio.Queue[tuple[str, dict, int] | None] = asyncio.Queue(
+            maxsize=self.workers * 2
+        )
+        written = 0
+
+        async def produce() -> None:
+            async for batch in batches:
+                await queue.put(batch)
+            for _ in range(self.workers):
+                await queue.put(None)
+
+        async def write() -> None:
+            nonlocal written
+            while (batch := await queue.get()) is not None:
+                cypher, parameters, count = batch
+                await self._execute_write_with_retry(cypher, parameters)
+                written += count
+                logger.info(f"  Created {written}/{total} {what}...")
+
+        tasks = [asyncio.create_task(produce())] + [
+            asyncio.create_task(write()) for _ in range(self.workers)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return written
+
+    async def _execute_write_with_retry(self, cypher: str, parameters: dict) -> None:
+        """Execute a write, retrying transient errors (e.g. deadlocks between writers)."""
+        for attempt in range(WRITE_RETRIES):
+            try:
+                await Neo4jClient.execute_write(cypher, parameters)
+                return
+            except TransientError as e:
+                if attempt == WRITE_RETRIES - 1:
+                    raise
+                logger.debug(f"Transient Neo4j error, retrying: {e}")
+                await asyncio.sleep(0.2 * 2 ** attempt)
 
     async def _create_indexes(self) -> None:
         """Create Neo4j indexes for performance."""
@@ -550,16 +1014,346 @@ class GraphBuilder:
                 logger.warning(f"Fulltext index creation warning: {e}")
 
 
+class GraphCSVExporter:
+    """Export the graph as CSV files for ``neo4j-admin database import``.
+
+    Each node label and relationship type gets a one-line header file and a
+    data file, streamed from PostgreSQL. Nodes use per-label ID spaces (ids
+    are only unique per table) and keep ``id`` as an integer property.
+    """
+
+    def __init__(self, pg_session: AsyncSession, output_dir: Path):
+        self.pg_session = pg_session
+        self.output_dir = output_dir
+        # (label or type, header file, data file) for the import command
+        self.node_files: list[tuple[str, str, str]] = []
+        self.relationship_files: list[tuple[str, str, str]] = []
+
+    async def export(
+        self,
+        cross_references: Path | None = None,
+        min_votes: int = 1,
+        topic_relations: bool = True,
+    ) -> dict[str, int]:
+        """Write all node and relationship files plus an import script.
+
+        Args:
+            cross_references: OpenBible TSV for QUOTES/ALLUDES_TO (skipped if None)
+            min_votes: Minimum votes for cross-references
+            topic_relations: Whether to export computed RELATED_TO relationships
+
+        Returns:
+            Rows written per file
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        started_at = await sync_point(self.pg_session)
+        stats: dict[str, int] = {}
+
+        # Nodes
+        stats["Book"] = await self._write_nodes(
+            "Book",
+            ["name_zh", "abbrev_zh", "testament", "order_index:int"],
+            self._stream_props(select(Book).order_by(Book.id), _book_props),
+        )
+        stats["Chapter"] = await self._write_nodes(
+            "Chapter",
+            ["book_id:long", "number:int"],
+            self._stream_props(select(Chapter).order_by(Chapter.id), _chapter_props),
+        )
+        stats["Pericope"] = await self._write_nodes(
+            "Pericope",
+            [
+                "book_id:long", "title", "chapter_start:int", "verse_start:int",
+                "chapter_end:int", "verse_end:int",
+            ],
+            self._stream_props(select(Pericope).order_by(Pericope.id), _pericope_props),
+        )
+        stats["Verse"] = await self._write_nodes(
+            "Verse",
+            ["book_id:long", "chapter:int", "verse:int", "text", "pericope_id:long"],
+            self._stream_props(select(Verse).order_by(Verse.id), _verse_props),
+        )
+        for entity_type, (label, _, _) in ENTITY_LABELS.items():
+            stats[label] = await self._write_nodes(
+                label,
+                ["name", "description"],
+                self._stream_props(
+                    select(Entity).where(Entity.type == entity_type).order_by(Entity.id),
+                    _entity_props,
+                ),
+            )
+        stats["Topic"] = await self._write_nodes(
+            "Topic",
+            ["name", "type", "description"],
+            self._stream_props(select(Topic).order_by(Topic.id), _topic_props),
+        )
+
+        # Structural relationships
+        stats["HAS_CHAPTER"] = await self._write_relationships(
+            "HAS_CHAPTER", "Book", "Chapter", [],
+            self._stream_rows(select(Chapter.book_id, Chapter.id)),
+        )
+        stats["HAS_PERICOPE"] = await self._write_relationships(
+            "HAS_PERICOPE", "Book", "Pericope", [],
+            self._stream_rows(select(Pericope.book_id, Pericope.id)),
+        )
+        stats["HAS_VERSE"] = await self._write_relationships(
+            "HAS_VERSE", "Pericope", "Verse", [],
+            self._stream_rows(
+                select(Verse.pericope_id, Verse.id).where(Verse.pericope_id.isnot(None))
+            ),
+        )
+
+        # Mention relationships
+        for entity_type, (label, _, rel_type) in ENTITY_LABELS.items():
+            stats[rel_type] = await self._write_relationships(
+                rel_type, "Verse", label, ["role"],
+                self._stream_rows(
+                    select(VerseEntity.verse_id, VerseEntity.entity_id, VerseEntity.role)
+                    .join(Entity, VerseEntity.entity_id == Entity.id)
+                    .where(Entity.type == entity_type)
+                ),
+            )
+        stats["MENTIONS_TOPIC"] = await self._write_relationships(
+            "MENTIONS_TOPIC", "Verse", "Topic", ["weight:double"],
+            self._stream_rows(select(VerseTopic.verse_id, VerseTopic.topic_id, VerseTopic.weight)),
+        )
+
+        # Cross-references (same direction as scripts.import_cross_references)
+        if cross_references is not None:
+            from scripts.import_cross_references import CrossReferenceImporter
+
+            importer = CrossReferenceImporter(self.pg_session, min_votes=min_votes)
+            relationships = await importer.load_relationships(cross_references, stats={
+                "total_lines": 0, "parsed": 0, "filtered": 0, "errors": 0, "skipped_votes": 0,
+            })
+            stats["QUOTES"] = await self._write_relationships(
+                "QUOTES", "Verse", "Verse", ["source", "votes:int"],
+                _aiter(
+                    (d["to_verse_id"], d["from_verse_id"], "openbible", d["votes"])
+                    for d in relationships["quotes"]
+                ),
+            )
+            stats["ALLUDES_TO"] = await self._write_relationships(
+                "ALLUDES_TO", "Verse", "Verse", ["source", "votes:int"],
+                _aiter(
+                    (d["from_verse_id"], d["to_verse_id"], "openbible", d["votes"])
+                    for d in relationships["allusions"]
+                ),
+            )
+
+        # Topic co-occurrence (same thresholds as scripts.compute_topic_relations)
+        if topic_relations:
+            from scripts.compute_topic_relations import TopicRelationComputer
+
+            relations = await TopicRelationComputer(self.pg_session).load_relations(stats={
+                "topic_pairs_found": 0, "filtered_by_weight": 0,
+            })
+            stats["RELATED_TO"] = await self._write_relationships(
+                "RELATED_TO", "Topic", "Topic", ["weight:double", "co_occurrence:int", "source"],
+                _aiter(
+                    (r["topic1_id"], r["topic2_id"], r["weight"], r["co_occurrence"], "computed")
+                    for r in relations
+                ),
+            )
+
+        # Watermark so that build_graph --incremental continues from the export
+        stats["SyncWatermark"] = await self._write_nodes(
+            "SyncWatermark",
+            ["updated_at"],
+            _aiter([{"id": WATERMARK_NAME, "updated_at": started_at.isoformat()}]),
+            id_property="name",
+        )
+
+        self._write_import_script()
+        return stats
+
+    async def _stream_props(self, query, props) -> AsyncIterator[dict]:
+        result = await self.pg_session.stream(query.execution_options(yield_per=EXPORT_FETCH_SIZE))
+        async for row in result.scalars():
+            yield props(row)
+
+    async def _stream_rows(self, query) -> AsyncIterator[tuple]:
+        result = await self.pg_session.stream(query.execution_options(yield_per=EXPORT_FETCH_SIZE))
+        async for row in result:
+            yield tuple(row)
+
+    async def _write_nodes(
+        self,
+        label: str,
+        fields: list[str],
+        rows: AsyncIterator[dict],
+        id_property: str = "id",
+    ) -> int:
+        """Write a node header and data file.
+
+        Args:
+            label: Node label (also the ID space)
+            fields: Property columns after the id, as ``name[:type]``
+            rows: Property dicts including ``id``
+            id_property: Property that stores the node id
+
+        Returns:
+            Rows written
+        """
+        id_type = ":long" if id_property == "id" else ""
+        header = [f":ID({label})", f"{id_property}{id_type}"] + fields
+        names = [field.split(":")[0] for field in fields]
+
+        def to_row(props: dict) -> list:
+            return [props["id"], props["id"]] + [props.get(name) for name in names]
+
+        count = await self._write_csv(label, header, (to_row(props) async for props in rows))
+        self.node_files.append((label, f"{label}_header.csv", f"{label}.csv"))
+        return count
+
+    async def _write_relationships(
+        self,
+        rel_type: str,
+        start_label: str,
+        end_label: str,
+        fields: list[str],
+        rows: AsyncIterator[tuple],
+    ) -> int:
+        """Write a relationship header and data file.
+
+        Args:
+            rel_type: Relationship type
+            start_label: ID space of the start node
+            end_label: ID space of the end node
+            fields: Property columns, as ``name[:type]``
+            rows: (start id, end id, *properties) tuples
+
+        Returns:
+            Rows written
+        """
+        header = [f":START_ID({start_label})", f":END_ID({end_label})"] + fields
+        count = await self._write_csv(rel_type, header, (list(row) async for row in rows))
+        self.relationship_files.append((rel_type, f"{rel_type}_header.csv", f"{rel_type}.csv"))
+        return count
+
+    async def _write_csv(self, name: str, header: list[str], rows: AsyncIterator[list]) -> int:
+        with open(self.output_dir / f"{name}_header.csv", "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(header)
+
+        count = 0
+        with open(self.output_dir / f"{name}.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            async for row in rows:
+                writer.writerow(["" if value is None else value for value in row])
+                count += 1
+        logger.info(f"  Wrote {count} rows to {name}.csv")
+        return count
+
+    def _write_import_script(self) -> None:
+        """Write import.sh with the neo4j-admin command for the exported files."""
+        args = [f"--nodes={label}={header},{data}" for label, header, data in self.node_files]
+        args += [
+            f"--relationships={rel_type}={header},{data}"
+            for rel_type, header, data in self.relationship_files
+        ]
+        lines = [
+            "#!/bin/sh",
+            "# Offline import of the exported graph (the database must be stopped).",
+            "# Afterwards create indexes with: python -m scripts.build_graph --indexes-only",
+            'cd "$(dirname "$0")"',
+            "neo4j-admin database import full ${NEO4J_DATABASE:-neo4j} \\",
+            "    --overwrite-destination \\",
+            "    --multiline-fields=true \\",
+        ]
+        lines += [f"    {arg} \\" for arg in args[:-1]] + [f"    {args[-1]}"]
+        path = self.output_dir / "import.sh"
+        path.write_text("\n".join(lines) + "\n")
+        path.chmod(0o755)
+
+
+async def _aiter(items) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+async def export_graph_csv(
+    output_dir: Path,
+    cross_references: Path | None = None,
+    min_votes: int = 1,
+    topic_relations: bool = True,
+) -> None:
+    """Export the graph for neo4j-admin import (no Neo4j connection needed).
+
+    Args:
+        output_dir: Directory for the CSV files and import.sh
+        cross_references: OpenBible TSV (default: data/cross_references.txt if present)
+        min_votes: Minimum votes for cross-references
+        topic_relations: Include RELATED_TO relationships
+    """
+    if cross_references is None:
+        default = Path(__file__).parent.parent / "data" / "cross_references.txt"
+        if default.exists():
+            cross_references = default
+        else:
+            logger.warning(
+                "No cross-reference file (data/cross_references.txt); "
+                "QUOTES/ALLUDES_TO are not exported"
+            )
+    elif not cross_references.exists():
+        logger.error(f"Data file not found: {cross_references}")
+        return
+
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,
+        pool_size=5,
+        max_overflow=10,
+    )
+
+    async_session = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    try:
+        async with async_session() as session:
+            exporter = GraphCSVExporter(session, output_dir)
+            stats = await exporter.export(
+                cross_references=cross_references,
+                min_votes=min_votes,
+                topic_relations=topic_relations,
+            )
+            print("\nGraph CSV Export Statistics:")
+            for key, value in stats.items():
+                print(f"  {key}: {value}")
+            print(f"\nImport with: {output_dir / 'import.sh'}")
+    finally:
+        await engine.dispose()
+
+
 async def main(
     clear: bool = True,
     indexes_only: bool = False,
+    incremental: bool = False,
+    workers: int = 1,
+    export_csv: Path | None = None,
+    cross_references: Path | None = None,
+    min_votes: int = 1,
+    topic_relations: bool = True,
 ) -> None:
     """Main entry point.
 
     Args:
         clear: Whether to clear existing graph
         indexes_only: Only create indexes (skip node/relationship creation)
+        incremental: Apply PostgreSQL changes since the last build or sync
+        workers: Concurrent Neo4j writers for the full build
+        export_csv: Write neo4j-admin import CSVs to this directory instead
+        cross_references: OpenBible TSV to include in the CSV export
+        min_votes: Minimum votes for exported cross-references
+        topic_relations: Include RELATED_TO in the CSV export
     """
+    if export_csv is not None:
+        await export_graph_csv(export_csv, cross_references, min_votes, topic_relations)
+        return
+
     # Initialize Neo4j
     await Neo4jClient.initialize()
 
@@ -584,11 +1378,20 @@ async def main(
 
     try:
         async with async_session() as session:
-            builder = GraphBuilder(session)
+            builder = GraphBuilder(session, workers=workers)
 
             if indexes_only:
                 logger.info("Creating indexes only...")
                 await builder._create_indexes()
+            elif incremental:
+                try:
+                    stats = await builder.sync_incremental()
+                except RuntimeError as e:
+                    logger.error(str(e))
+                    sys.exit(1)
+                print("\nGraph Sync Statistics:")
+                for key, value in stats.items():
+                    print(f"  {key}: {value}")
             else:
                 stats = await builder.build_full_graph(clear_existing=clear)
                 print("\nGraph Building Statistics:")
@@ -614,6 +1417,41 @@ if __name__ == "__main__":
         action="store_true",
         help="Only create indexes, skip node/relationship creation",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Apply rows changed since the last build/sync instead of rebuilding",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Concurrent Neo4j writers for verse nodes and mentions (default: 1)",
+    )
+    parser.add_argument(
+        "--export-csv",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Write CSV files for neo4j-admin database import instead of loading online",
+    )
+    parser.add_argument(
+        "--cross-references",
+        type=Path,
+        default=None,
+        help="OpenBible TSV to include in the export (default: data/cross_references.txt)",
+    )
+    parser.add_argument(
+        "--min-votes",
+        type=int,
+        default=1,
+        help="Minimum votes for exported cross-references (default: 1)",
+    )
+    parser.add_argument(
+        "--no-topic-relations",
+        action="store_true",
+        help="Don't export RELATED_TO relationships",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -628,4 +1466,10 @@ if __name__ == "__main__":
     asyncio.run(main(
         clear=not args.no_clear,
         indexes_only=args.indexes_only,
+        incremental=args.incremental,
+        workers=args.workers,
+        export_csv=args.export_csv,
+        cross_references=args.cross_references,
+        min_votes=args.min_votes,
+        topic_relations=not args.no_topic_relations,
     ))
@@ -3,22 +3,37 @@
 Usage:
     python -m scripts.build_index --pdf backend/pdf/cmn-cu89t_a4.pdf
     python -m scripts.build_index --json bible_parsed.json --skip-parse
+    python -m scripts.build_index --embed-only
+    python -m scripts.build_index --shadow-model BAAI/bge-m3
 """
 
 import argparse
 import asyncio
+import hashlib
 import json
 import sys
+import time
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text
+from sqlalchemy import func, literal, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.core.config import settings
-from app.models.orm import Book, Chapter, Pericope, Verse
+from app.models.orm import Pericope, Verse
+from app.services.dense_index import (
+    EMBEDDING_SLOTS,
+    NumpyDenseIndex,
+    PgVectorIndex,
+    load_active_slot,
+    load_vectors,
+    slot_column,
+)
 from scripts.pdf_parser import BiblePDFParser
 
 
@@ -49,17 +64,113 @@ async def clear_tables(session: AsyncSession) -> None:
     await session.execute(text("DELETE FROM books"))
     await session.execute(text("DELETE FROM entities"))
     await session.execute(text("DELETE FROM topics"))
+    # LLM job state is keyed by pericope/verse ids, which the import re-assigns
+    await session.execute(text("DELETE FROM llm_jobs"))
 
     await session.commit()
     print("Tables cleared")
 
 
+# Tables written by the bulk import, in foreign-key order
+CORPUS_TABLES = ("books", "chapters", "pericopes", "verses")
+
+
+def corpus_records(
+    books_data: list[dict],
+) -> dict[str, tuple[list[str], list[tuple]]]:
+    """Flatten parsed books into COPY records with client-assigned ids.
+
+    Args:
+        books_data: "books" list from the parsed JSON
+
+    Returns:
+        Table name -> (column names, records), in CORPUS_TABLES order
+    """
+    books, chapters, pericopes, verses = [], [], [], []
+
+    for book_id, book_data in enumerate(books_data, start=1):
+        books.append((
+            book_id,
+            book_data["name_zh"],
+            book_data["abbrev_zh"],
+            book_data["testament"],
+            book_data["order_index"],
+        ))
+
+        for chapter_data in book_data["chapters"]:
+            chapters.append((len(chapters) + 1, book_id, chapter_data["number"]))
+
+            for pericope_data in chapter_data["pericopes"]:
+                pericope_id = len(pericopes) + 1
+                pericopes.append((
+                    pericope_id,
+                    book_id,
+                    pericope_data["chapter_start"],
+                    pericope_data["verse_start"],
+                    pericope_data["chapter_end"],
+                    pericope_data["verse_end"],
+                    pericope_data["title"],
+                ))
+
+                for verse_data in pericope_data["verses"]:
+                    verses.append((
+                        len(verses) + 1,
+                        book_id,
+                        verse_data["chapter"],
+                        verse_data["verse"],
+                        verse_data["text"],
+                        pericope_id,
+                    ))
+
+    return {
+        "books": (["id", "name_zh", "abbrev_zh", "testament", "order_index"], books),
+        "chapters": (["id", "book_id", "number"], chapters),
+        "pericopes": (
+            ["id", "book_id", "chapter_start", "verse_start", "chapter_end", "verse_end", "title"],
+            pericopes,
+        ),
+        "verses": (["id", "book_id", "chapter", "verse", "text", "pericope_id"], verses),
+    }
+
+
+async def drop_secondary_indexes(session: AsyncSession) -> list[str]:
+    """Drop indexes on the corpus tables that do not back a constraint.
+
+    Returns:
+        CREATE INDEX statements to rebuild them after the load
+    """
+    result = await session.execute(
+        text("""
+            SELECT i.indexname, i.indexdef
+            FROM pg_indexes i
+            WHERE i.schemaname = current_schema()
+              AND i.tablename = ANY(:tables)
+              AND NOT EXISTS (
+                  SELECT 1 FROM pg_constraint c
+                  WHERE c.conname = i.indexname
+                    AND c.connamespace = to_regnamespace(i.schemaname)
+              )
+        """),
+        {"tables": list(CORPUS_TABLES)},
+    )
+    rows = result.all()
+    for row in rows:
+        await session.execute(text(f'DROP INDEX "{row.indexname}"'))
+    return [row.indexdef for row in rows]
+
+
 async def import_from_json(
     session: AsyncSession,
     json_path: Path,
     verbose: bool = False,
 ) -> None:
-    """Import parsed Bible data from JSON to PostgreSQL."""
+    """Bulk-import parsed Bible data from JSON to PostgreSQL.
+
+    Ids are assigned client-side, each table is written with one COPY over
+    the asyncpg connection, and secondary indexes (full-text, trigram,
+    HNSW) are dropped for the load and rebuilt once at the end. Everything
+    runs in one transaction, so a failed import leaves the tables empty.
+    """
     # Check for existing data to prevent duplicate key errors
     result = await session.execute(text("SELECT COUNT(*) FROM books"))
     existing_books = result.scalar()
@@ -72,6 +183,7 @@ async def import_from_json(
         )
 
     print(f"Loading data from {json_path}...")
+    start = time.perf_counter()
 
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -81,65 +193,182 @@ async def import_from_json(
     print(f"  Found {metadata['total_pericopes']} pericopes")
     print(f"  Found {metadata['total_verses']} verses")
 
-    books_data = data["books"]
-    total_pericopes = 0
-    total_verses = 0
+    tables = corpus_records(data["books"])
+    print(f"  Prepared records in {time.perf_counter() - start:.2f}s")
+
+    index_defs = await drop_secondary_indexes(session)
+    if verbose:
+        print(f"  Dropped {len(index_defs)} secondary indexes")
+
+    # COPY goes through the asyncpg connection inside the session's transaction
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    copy_conn = raw_connection.driver_connection
+
+    load_start = time.perf_counter()
+    total_rows = 0
+    for table in CORPUS_TABLES:
+        columns, records = tables[table]
+        table_start = time.perf_counter()
+        await copy_conn.copy_records_to_table(table, records=records, columns=columns)
+        elapsed = time.perf_counter() - table_start
+        total_rows += len(records)
+        print(f"  {table:<10} {len(records):>7} rows  {len(records) / max(elapsed, 1e-6):>10.0f} rows/s")
+
+        # Keep the serial sequence ahead of the client-assigned ids
+        await session.execute(
+            text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), :last_id)"),
+            {"last_id": max(len(records), 1)},
+        )
+    copy_elapsed = time.perf_counter() - load_start
 
-    for book_data in books_data:
+    index_start = time.perf_counter()
+    for index_def in index_defs:
         if verbose:
-            print(f"  Importing: {book_data['name_zh']}")
-
-        # Create book
-        book = Book(
-            name_zh=book_data["name_zh"],
-            abbrev_zh=book_data["abbrev_zh"],
-            testament=book_data["testament"],
-            order_index=book_data["order_index"],
-        )
-        session.add(book)
-        await session.flush()  # Get book.id
+            print(f"  {index_def}")
+        await session.execute(text(index_def))
+    for table in CORPUS_TABLES:
+        await session.execute(text(f"ANALYZE {table}"))
+    index_elapsed = time.perf_counter() - index_start
 
-        # Create chapters and pericopes
-        for chapter_data in book_data["chapters"]:
-            chapter = Chapter(
-                book_id=book.id,
-                number=chapter_data["number"],
-            )
-            session.add(chapter)
-            await session.flush()
+    await session.commit()
 
-            for pericope_data in chapter_data["pericopes"]:
-                pericope = Pericope(
-                    book_id=book.id,
-                    chapter_start=pericope_data["chapter_start"],
-                    verse_start=pericope_data["verse_start"],
-                    chapter_end=pericope_data["chapter_end"],
-                    verse_end=pericope_data["verse_end"],
-                    title=pericope_data["title"],
-                )
-                session.add(pericope)
-                await session.flush()
-                total_pericopes += 1
-
-                # Create verses
-                for verse_data in pericope_data["verses"]:
-                    verse = Verse(
-                        book_id=book.id,
-                        chapter=verse_data["chapter"],
-                        verse=verse_data["verse"],
-                        text=verse_data["text"],
-                        pericope_id=pericope.id,
-                    )
-                    session.add(verse)
-                    total_verses += 1
+    counts = {table: len(tables[table][1]) for table in CORPUS_TABLES}
+    print(
+        f"Imported {counts['books']} books, {counts['pericopes']} pericopes, "
+        f"{counts['verses']} verses"
+    )
+    print(
+        f"  COPY {total_rows} rows in {copy_elapsed:.2f}s "
+        f"({total_rows / max(copy_elapsed, 1e-6):.0f} rows/s), "
+        f"rebuilt {len(index_defs)} indexes in {index_elapsed:.2f}s, "
+        f"total {time.perf_counter() - start:.2f}s"
+    )
+
+
+def content_hash(text_value: str) -> str:
+    """SHA-256 of an embedding input."""
+    return hashlib.sha256(text_value.encode("utf-8")).hexdigest()
+
+
+async def pending_pericope_texts(
+    session: AsyncSession,
+    slot: str,
+    model_name: str,
+) -> list[tuple[int, str, str]]:
+    """Find pericopes whose vector in a slot is missing or stale.
+
+    Titles and verse texts are joined in one aggregated query instead of one
+    verse query per pericope. Each input is hashed and stored as
+    ``Pericope.content_hash``; a vector is stale when it was computed by
+    another model or from a different hash.
+
+    Returns:
+        (pericope id, title + verse texts, content hash) triples
+    """
+    column = slot_column(slot)
+    result = await session.execute(
+        select(
+            Pericope.id,
+            Pericope.title,
+            Pericope.content_hash,
+            column.is_(None).label("missing"),
+            getattr(Pericope, f"{slot}_model").label("slot_model"),
+            getattr(Pericope, f"{slot}_hash").label("slot_hash"),
+            func.string_agg(
+                Verse.text,
+                aggregate_order_by(literal("\n"), Verse.chapter, Verse.verse),
+            ).label("body"),
+        )
+        .outerjoin(Verse, Verse.pericope_id == Pericope.id)
+        .group_by(Pericope.id)
+    )
 
+    pending, changed = [], []
+    for row in result.all():
+        full_text = f"{row.title}\n{row.body or ''}"
+        digest = content_hash(full_text)
+        if digest != row.content_hash:
+            changed.append((row.id, digest))
+        if row.missing or row.slot_model != model_name or row.slot_hash != digest:
+            pending.append((row.id, full_text, digest))
+
+    if changed:
+        await session.execute(
+            text("""
+                UPDATE pericopes AS p
+                SET content_hash = v.content_hash
+                FROM unnest(CAST(:ids AS integer[]), CAST(:hashes AS text[])) AS v(id, content_hash)
+                WHERE p.id = v.id
+            """),
+            {"ids": [i for i, _ in changed], "hashes": [h for _, h in changed]},
+        )
         await session.commit()
+        print(f"  Updated content hash of {len(changed)} pericopes")
+
+    return pending
 
-    print(f"Imported {len(books_data)} books, {total_pericopes} pericopes, {total_verses} verses")
+
+async def write_embeddings(
+    session: AsyncSession,
+    slot: str,
+    model_name: str,
+    batch: list[tuple[int, str, str]],
+    embeddings: list[list[float]],
+) -> None:
+    """Write one batch of vectors with a single UPDATE and commit it.
+
+    Each committed batch is a checkpoint: a restarted run only selects
+    pericopes whose vector is still missing or stale.
+    """
+    slot_column(slot)
+    await session.execute(
+        text(f"""
+            UPDATE pericopes AS p
+            SET {slot} = v.embedding::vector,
+                {slot}_model = :model_name,
+                {slot}_hash = v.content_hash
+            FROM unnest(
+                CAST(:ids AS integer[]),
+                CAST(:embeddings AS text[]),
+                CAST(:hashes AS text[])
+            ) AS v(id, embedding, content_hash)
+            WHERE p.id = v.id
+        """),
+        {
+            "model_name": model_name,
+            "ids": [pericope_id for pericope_id, _, _ in batch],
+            "embeddings": [
+                "[" + ",".join(f"{x:.7g}" for x in embedding) + "]" for embedding in embeddings
+            ],
+            "hashes": [digest for _, _, digest in batch],
+        },
+    )
+    await session.commit()
 
 
-async def generate_embeddings(session: AsyncSession, verbose: bool = False) -> None:
-    """Generate embeddings for all pericopes using bge-m3."""
+async def generate_embeddings(
+    session: AsyncSession,
+    verbose: bool = False,
+    slot: str | None = None,
+    model_name: str | None = None,
+) -> int:
+    """Embed new and changed pericopes into an embedding slot.
+
+    Inputs are sorted by length so each batch pads to similar sizes, and
+    encoding the next batch (in a worker thread) overlaps with writing the
+    previous one. Batches are committed as they finish, so an interrupted
+    run resumes with the pericopes that are still missing a current vector.
+
+    Args:
+        session: Database session
+        verbose: Print every batch
+        slot: Target column (default: the active slot)
+        model_name: Model to embed with (default: the active slot's model)
+
+    Returns:
+        Number of pericopes embedded
+    """
     print("Generating embeddings...")
 
     try:
@@ -147,71 +376,204 @@ async def generate_embeddings(session: AsyncSession, verbose: bool = False) -> N
     except ImportError:
         print("FlagEmbedding not installed. Run: pip install FlagEmbedding")
         print("Skipping embedding generation.")
-        return
+        return 0
+
+    if slot is None or model_name is None:
+        active = await load_active_slot(session)
+        slot = slot or active.name
+        model_name = model_name or active.model_name
+
+    pending = await pending_pericope_texts(session, slot, model_name)
+    print(f"Found {len(pending)} pericopes to embed into {slot} with {model_name}")
+
+    if not pending:
+        print("No pericopes need embedding")
+        return 0
 
     # Load model
-    print("Loading bge-m3 model (this may take a while)...")
+    print(f"Loading {model_name} (this may take a while)...")
     model = BGEM3FlagModel(
-        settings.EMBED_MODEL_NAME,
+        model_name,
         use_fp16=settings.EMBED_USE_FP16,
     )
     print("Model loaded")
 
-    # Get all pericopes without embeddings
-    from sqlalchemy import select
-    result = await session.execute(
-        select(Pericope).where(Pericope.embedding.is_(None))
+    # Longest first: similar lengths share a batch, and memory peaks early
+    pending.sort(key=lambda item: len(item[1]), reverse=True)
+
+    batch_size = settings.EMBED_BATCH_SIZE
+    batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+
+    def encode(texts: list[str]) -> list[list[float]]:
+        output = model.encode(
+            texts,
+            batch_size=len(texts),
+            return_dense=True,
+            return_sparse=False,
+            return_colbert_vecs=False,
+        )
+        return output["dense_vecs"].tolist()
+
+    start = time.perf_counter()
+    done = 0
+    pending_write: asyncio.Task | None = None
+
+    for batch_num, batch in enumerate(batches):
+        encoding = asyncio.create_task(asyncio.to_thread(encode, [t for _, t, _ in batch]))
+        if pending_write is not None:
+            await pending_write
+        embeddings = await encoding
+        pending_write = asyncio.create_task(
+            write_embeddings(session, slot, model_name, batch, embeddings)
+        )
+
+        done += len(batch)
+        if verbose or batch_num % 10 == 0 or batch_num == len(batches) - 1:
+            elapsed = time.perf_counter() - start
+            rate = done / elapsed if elapsed > 0 else 0.0
+            eta = (len(pending) - done) / rate if rate > 0 else 0.0
+            print(
+                f"  Batch {batch_num + 1}/{len(batches)}: {done}/{len(pending)} pericopes, "
+                f"{rate:.1f} pericopes/s, ETA {eta:.0f}s"
+            )
+
+    await pending_write
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Generated embeddings for {len(pending)} pericopes in {elapsed:.1f}s "
+        f"({len(pending) / elapsed:.1f} pericopes/s)"
     )
-    pericopes = result.scalars().all()
-    print(f"Found {len(pericopes)} pericopes to embed")
+    return len(pending)
 
-    if not pericopes:
-        print("No pericopes need embedding")
+
+async def check_slot_recall(
+    session: AsyncSession,
+    slot: str,
+    top_k: int,
+    samples: int = 200,
+    seed: int = 42,
+) -> float:
+    """Measure recall@k of a slot's HNSW index against exact search.
+
+    Stored vectors of the slot are used as queries. Sequential scans are
+    disabled for the check so the HNSW index is what gets measured.
+
+    Returns:
+        Mean recall@k, or 0.0 if any pericope has no vector in the slot
+    """
+    column = slot_column(slot)
+    missing = await session.scalar(select(func.count(Pericope.id)).where(column.is_(None)))
+    if missing:
+        print(f"  {missing} pericopes have no vector in {slot}")
+        return 0.0
+
+    ids, vectors = await load_vectors(session, slot)
+    if not len(ids):
+        return 0.0
+
+    exact = NumpyDenseIndex(ids, vectors, "none")
+    index = PgVectorIndex(slot)
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(len(ids), size=min(samples, len(ids)), replace=False)
+
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    scores = []
+    for query in vectors[picks]:
+        truth = {i for i, _ in exact.search_vector(query, top_k)}
+        found = {i for i, _ in await index.search(session, query, top_k)}
+        scores.append(len(truth & found) / len(truth))
+    await session.rollback()
+
+    return float(np.mean(scores))
+
+
+async def activate_slot(session: AsyncSession, slot: str) -> None:
+    """Make a slot the one dense retrieval reads, in one statement."""
+    slot_column(slot)
+    exists = await session.scalar(
+        text("SELECT count(*) FROM embedding_slots WHERE name = :slot"), {"slot": slot}
+    )
+    if not exists:
+        print(f"Embedding slot {slot} has not been built")
         return
 
-    # Process in batches
-    batch_size = settings.EMBED_BATCH_SIZE
-    total_batches = (len(pericopes) + batch_size - 1) // batch_size
-
-    for batch_num in range(total_batches):
-        start_idx = batch_num * batch_size
-        end_idx = min(start_idx + batch_size, len(pericopes))
-        batch = pericopes[start_idx:end_idx]
-
-        if verbose or batch_num % 10 == 0:
-            print(f"  Processing batch {batch_num + 1}/{total_batches}")
-
-        # Prepare texts (combine title and verse texts)
-        texts = []
-        for pericope in batch:
-            # Get verse texts
-            verse_result = await session.execute(
-                select(Verse.text).where(Verse.pericope_id == pericope.id)
-            )
-            verse_texts = verse_result.scalars().all()
-            full_text = f"{pericope.title}\n" + "\n".join(verse_texts)
-            texts.append(full_text)
+    await session.execute(
+        text("UPDATE embedding_slots SET is_active = (name = :slot), updated_at = now()"),
+        {"slot": slot},
+    )
+    await session.commit()
+    print(f"Activated embedding slot {slot}; API workers switch within "
+          f"{settings.DENSE_SLOT_REFRESH_SECONDS:.0f}s")
 
-        # Generate embeddings
-        output = model.encode(texts, return_dense=True, return_sparse=False, return_colbert_vecs=False)
-        embeddings = output["dense_vecs"]
 
-        # Update pericopes
-        for pericope, embedding in zip(batch, embeddings):
-            pericope.embedding = embedding.tolist()
+async def build_shadow_slot(
+    session: AsyncSession,
+    model_name: str,
+    activate: bool = True,
+    verbose: bool = False,
+) -> None:
+    """Build a model's vectors in the inactive slot and switch to it if recall passes.
+
+    The active slot keeps serving throughout; the flip is a single UPDATE of
+    ``embedding_slots``. Re-running resumes the shadow build.
+    """
+    active = await load_active_slot(session)
+    slot = next(name for name in EMBEDDING_SLOTS if name != active.name)
+    print(f"Active slot: {active.name} ({active.model_name}); building {slot} with {model_name}")
+
+    await session.execute(
+        text("""
+            INSERT INTO embedding_slots (name, model_name, is_active)
+            VALUES (:slot, :model_name, false)
+            ON CONFLICT (name) DO UPDATE
+            SET model_name = EXCLUDED.model_name, recall = NULL, built_at = NULL,
+                updated_at = now()
+        """),
+        {"slot": slot, "model_name": model_name},
+    )
+    # Ensure the serving slot has a row, so the flip below deactivates it
+    await session.execute(
+        text("""
+            INSERT INTO embedding_slots (name, model_name, is_active)
+            VALUES (:slot, :model_name, true)
+            ON CONFLICT (name) DO NOTHING
+        """),
+        {"slot": active.name, "model_name": active.model_name},
+    )
+    await session.commit()
 
-        await session.commit()
+    await generate_embeddings(session, verbose, slot, model_name)
 
-    print(f"Generated embeddings for {len(pericopes)} pericopes")
+    print(f"\nChecking {slot} recall@{settings.MAX_RETRIEVE_RESULTS}...")
+    recall = await check_slot_recall(session, slot, settings.MAX_RETRIEVE_RESULTS)
+    await session.execute(
+        text("UPDATE embedding_slots SET recall = :recall, built_at = now() WHERE name = :slot"),
+        {"slot": slot, "recall": recall},
+    )
+    await session.commit()
+    print(f"  recall={recall:.3f} (minimum {settings.DENSE_SLOT_MIN_RECALL})")
+
+    if recall < settings.DENSE_SLOT_MIN_RECALL:
+        print(f"Recall check failed; {active.name} stays active")
+    elif activate:
+        await activate_slot(session, slot)
+    else:
+        print(f"Recall check passed; activate with --activate-slot {slot}")
 
 
 async def build_index(
     pdf_path: Path | None = None,
     json_path: Path | None = None,
+    parse_workers: int | None = None,
     output_json: Path | None = None,
     drop_existing: bool = False,
     skip_parse: bool = False,
     skip_embed: bool = False,
+    embed_only: bool = False,
+    shadow_model: str | None = None,
+    activate: bool = True,
+    activate_slot_name: str | None = None,
     verbose: bool = False,
 ) -> None:
     """Main build index function."""
@@ -224,6 +586,19 @@ async def build_index(
         await init_database(engine)
 
         async with async_session() as session:
+            # Embedding slot maintenance runs against the imported corpus
+            if activate_slot_name:
+                await activate_slot(session, activate_slot_name)
+                return
+            if shadow_model:
+                print(f"\n=== Building Shadow Embeddings: {shadow_model} ===")
+                await build_shadow_slot(session, shadow_model, activate, verbose)
+                return
+            if embed_only:
+                print("\n=== Generating Embeddings (new and changed pericopes) ===")
+                await generate_embeddings(session, verbose)
+                return
+
             # Clear existing data if requested
             if drop_existing:
                 await clear_tables(session)
@@ -231,7 +606,7 @@ async def build_index(
             # Parse PDF if needed
             if not skip_parse and pdf_path:
                 print(f"\n=== Parsing PDF: {pdf_path} ===")
-                parser = BiblePDFParser(pdf_path)
+                parser = BiblePDFParser(pdf_path, workers=parse_workers)
                 parser.parse()
 
                 # Save to JSON
@@ -275,6 +650,15 @@ Examples:
 
   # Skip embedding generation
   python -m scripts.build_index --json bible_parsed.json --skip-parse --skip-embed
+
+  # Re-embed only pericopes whose text changed since the last run
+  python -m scripts.build_index --embed-only
+
+  # Build a new model's vectors in the shadow slot, switch once recall passes
+  python -m scripts.build_index --shadow-model BAAI/bge-m3
+
+  # Switch back to the previous slot
+  python -m scripts.build_index --activate-slot embedding
         """,
     )
 
@@ -294,6 +678,11 @@ Examples:
         default=Path("bible_parsed.json"),
         help="Output JSON file path (default: bible_parsed.json)",
     )
+    parser.add_argument(
+        "-j", "--parse-workers",
+        type=int,
+        help="PDF text extraction processes (default: CPU count)",
+    )
     parser.add_argument(
         "--drop-existing",
         action="store_true",
@@ -309,6 +698,25 @@ Examples:
         action="store_true",
         help="Skip embedding generation step",
     )
+    parser.add_argument(
+        "--embed-only",
+        action="store_true",
+        help="Only embed new and changed pericopes into the active slot",
+    )
+    parser.add_argument(
+        "--shadow-model",
+        help="Build this model's vectors in the inactive slot, then switch to it",
+    )
+    parser.add_argument(
+        "--no-activate",
+        action="store_true",
+        help="With --shadow-model, build and check recall but keep the current slot",
+    )
+    parser.add_argument(
+        "--activate-slot",
+        choices=EMBEDDING_SLOTS,
+        help="Switch dense retrieval to an already built slot",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -318,7 +726,8 @@ Examples:
     args = parser.parse_args()
 
     # Validate arguments
-    if not args.skip_parse and not args.pdf:
+    slot_mode = args.embed_only or args.shadow_model or args.activate_slot
+    if not slot_mode and not args.skip_parse and not args.pdf:
         parser.error("--pdf is required unless --skip-parse is specified")
 
     if args.skip_parse and not args.json:
@@ -329,10 +738,15 @@ Examples:
         build_index(
             pdf_path=args.pdf,
             json_path=args.json,
+            parse_workers=args.parse_workers,
             output_json=args.output_json,
             drop_existing=args.drop_existing,
             skip_parse=args.skip_parse,
             skip_embed=args.skip_embed,
+            embed_only=args.embed_only,
+            shadow_model=args.shadow_model,
+            activate=not args.no_activate,
+            activate_slot_name=args.activate_slot,
             verbose=args.verbose,
         )
     )
@@ -0,0 +1,143 @@
+"""Build query-type centroids for the embedding classifier.
+
+Encodes a labelled seed set of example queries with bge-m3 and stores one
+L2-normalized centroid per query type, so the API can classify `auto`
+queries from the same embedding the dense retriever uses.
+
+Usage:
+    python -m scripts.build_query_classifier
+    python -m scripts.build_query_classifier --seeds data/query_type_seeds.json -o data/query_classifier.npz
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+
+
+def load_seeds(seeds_path: Path) -> dict[str, list[str]]:
+    """Load labelled seed queries grouped by query type."""
+    with open(seeds_path, encoding="utf-8") as f:
+        seeds = json.load(f)
+
+    for label, examples in seeds.items():
+        if not examples:
+            raise ValueError(f"No seed examples for {label}")
+
+    return seeds
+
+
+def build_centroids(
+    seeds: dict[str, list[str]],
+    verbose: bool = False,
+) -> tuple[list[str], np.ndarray, dict[str, float]]:
+    """Encode seeds and compute normalized centroids.
+
+    Returns:
+        Labels, centroid matrix, and leave-one-out accuracy per label
+    """
+    try:
+        from FlagEmbedding import BGEM3FlagModel
+    except ImportError:
+        print("FlagEmbedding not installed. Run: pip install FlagEmbedding")
+        sys.exit(1)
+
+    print("Loading bge-m3 model (this may take a while)...")
+    model = BGEM3FlagModel(settings.EMBED_MODEL_NAME, use_fp16=settings.EMBED_USE_FP16)
+    print("Model loaded")
+
+    labels = list(seeds.keys())
+    texts = [text for label in labels for text in seeds[label]]
+    owners = np.array([i for i, label in enumerate(labels) for _ in seeds[label]])
+
+    output = model.encode(
+        texts,
+        batch_size=settings.EMBED_BATCH_SIZE,
+        return_dense=True,
+        return_sparse=False,
+        return_colbert_vecs=False,
+    )
+    vectors = np.asarray(output["dense_vecs"], dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    sums = np.zeros((len(labels), vectors.shape[1]), dtype=np.float32)
+    np.add.at(sums, owners, vectors)
+    counts = np.bincount(owners, minlength=len(labels)).astype(np.float32)
+
+    centroids = sums / np.linalg.norm(sums, axis=1, keepdims=True)
+
+    # Leave-one-out accuracy: score each seed against centroids built without it
+    correct = np.zeros(len(labels))
+    for i, (vector, owner) in enumerate(zip(vectors, owners)):
+        loo = sums.copy()
+        loo[owner] -= vector
+        if counts[owner] > 1:
+            loo /= np.linalg.norm(loo, axis=1, keepdims=True)
+        predicted = int(np.argmax(loo @ vector))
+        if predicted == owner:
+            correct[owner] += 1
+        elif verbose:
+            print(f"  Misclassified: {texts[i]} ({labels[owner]} -> {labels[predicted]})")
+
+    accuracy = {label: float(correct[i] / counts[i]) for i, label in enumerate(labels)}
+    return labels, centroids, accuracy
+
+
+def main():
+    """CLI entry point."""
+    data_dir = Path(__file__).parent.parent / "data"
+
+    parser = argparse.ArgumentParser(
+        description="Build query-type centroids for the embedding classifier",
+    )
+    parser.add_argument(
+        "--seeds",
+        type=Path,
+        default=data_dir / "query_type_seeds.json",
+        help="Path to labelled seed queries (default: data/query_type_seeds.json)",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=Path(settings.QUERY_CLASSIFIER_PATH),
+        help=f"Output .npz path (default: {settings.QUERY_CLASSIFIER_PATH})",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print misclassified seeds",
+    )
+
+    args = parser.parse_args()
+
+    seeds = load_seeds(args.seeds)
+    print(f"Loaded {sum(len(v) for v in seeds.values())} seed queries "
+          f"across {len(seeds)} query types")
+
+    labels, centroids, accuracy = build_centroids(seeds, args.verbose)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        args.output,
+        labels=np.array(labels),
+        centroids=centroids,
+        model_name=np.array(settings.EMBED_MODEL_NAME),
+    )
+
+    print("\n" + "=" * 50)
+    print("Query Classifier Statistics")
+    print("=" * 50)
+    for label in labels:
+        print(f"  {label:<24} seeds={len(seeds[label]):>3}  loo_accuracy={accuracy[label]:.2f}")
+    print(f"\nSaved centroids to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
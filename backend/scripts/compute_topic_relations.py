@@ -60,6 +60,32 @@ class TopicRelationComputer:
             "filtered_by_weight": 0,
         }
 
+        relations = await self.load_relations(stats)
+
+        if not relations:
+            logger.warning("No topic relations to create")
+            return stats
+
+        # Create Neo4j relationships in batches
+        logger.info("Creating Neo4j RELATED_TO relationships...")
+
+        for i in range(0, len(relations), BATCH_SIZE):
+            batch = relations[i:i + BATCH_SIZE]
+            await self._create_relationships_batch(batch)
+            stats["relationships_created"] += len(batch)
+            logger.info(f"  Created {stats['relationships_created']}/{len(relations)} relationships...")
+
+        return stats
+
+    async def load_relations(self, stats: dict[str, int]) -> list[dict]:
+        """Compute weighted topic pairs from PostgreSQL.
+
+        Args:
+            stats: Statistics dict to update
+
+        Returns:
+            List of relation dicts passing both thresholds
+        """
         logger.info("Computing topic co-occurrences from PostgreSQL...")
 
         # Query for topic co-occurrences
@@ -126,20 +152,7 @@ class TopicRelationComputer:
 
         logger.info(f"After weight filtering (>= {self.min_weight}): {len(relations)} pairs")
 
-        if not relations:
-            logger.warning("No topic relations to create")
-            return stats
-
-        # Create Neo4j relationships in batches
-        logger.info("Creating Neo4j RELATED_TO relationships...")
-
-        for i in range(0, len(relations), BATCH_SIZE):
-            batch = relations[i:i + BATCH_SIZE]
-            await self._create_relationships_batch(batch)
-            stats["relationships_created"] += len(batch)
-            logger.info(f"  Created {stats['relationships_created']}/{len(relations)} relationships...")
-
-        return stats
+        return relations
 
     async def _create_relationships_batch(self, relations: list[dict]) -> None:
         """Create a batch of RELATED_TO relationships.
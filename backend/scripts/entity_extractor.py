@@ -6,7 +6,7 @@ from Bible pericopes using Ollama LLM.
 Usage:
     cd backend
     python -m scripts.entity_extractor
-    python -m scripts.entity_extractor --batch-size 5 --no-resume
+    python -m scripts.entity_extractor --concurrency 8 --no-resume
     python -m scripts.entity_extractor --limit 100  # Process only first 100 pericopes
 """
 
@@ -16,6 +16,7 @@ import json
 import logging
 import re
 import sys
+import time
 from pathlib import Path
 
 from sqlalchemy import select
@@ -27,6 +28,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 from app.models.orm import Book, Pericope, Verse, Entity, VerseEntity, Topic, VerseTopic
+from scripts.entity_linker import TOPIC, EntityLinker, load_aliases
+from scripts.llm_batch_runner import JobItem, LLMBatchRunner
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,9 +37,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Checkpoint file
+# Legacy checkpoint file (imported into llm_jobs on first run)
 CHECKPOINT_FILE = Path("entity_extraction_checkpoint.json")
 
+# Pericopes whose results are written per transaction
+WRITE_BATCH_SIZE = 20
+
+# Response key -> entity type
+ENTITY_KEYS = {
+    "persons": "PERSON",
+    "places": "PLACE",
+    "groups": "GROUP",
+    "events": "EVENT",
+}
+TOPIC_TYPES = ("DOCTRINE", "MORAL", "HISTORICAL", "PROPHETIC", "OTHER")
+
 # Extraction system prompt
 EXTRACTION_SYSTEM_PROMPT = """你是聖經文本分析專家。請分析給定的聖經段落，提取以下實體：
 
@@ -72,15 +87,23 @@ EXTRACTION_SYSTEM_PROMPT = """你是聖經文本分析專家。請分析給定
 class EntityExtractor:
     """Extract entities from Bible pericopes using LLM."""
 
+    JOB = "entity_extraction"
+
     def __init__(
         self,
         session: AsyncSession,
-        batch_size: int = 10,
+        concurrency: int | None = None,
+        write_batch_size: int = WRITE_BATCH_SIZE,
     ):
         self.session = session
-        self.batch_size = batch_size
+        self.runner = LLMBatchRunner(session, self.JOB, concurrency=concurrency)
+        self.write_batch_size = write_batch_size
         self.entity_cache: dict[tuple[str, str], int] = {}  # (name, type) -> id
         self.topic_cache: dict[str, int] = {}  # name -> id
+        self.cache_stale = True
+        self.linker = EntityLinker(load_aliases())
+        self.counts = {"entities": 0, "topics": 0, "rows": 0}
+        self.write_seconds = 0.0
         self.llm_client = None
 
     async def _init_llm(self):
@@ -97,23 +120,15 @@ class EntityExtractor:
         """Extract entities from all pericopes.
 
         Args:
-            resume: Whether to resume from checkpoint
+            resume: Whether to skip pericopes completed in earlier runs
             limit: Optional limit on number of pericopes to process
 
         Returns:
             Statistics dict with counts
         """
         await self._init_llm()
-
-        # Load checkpoint
-        processed_ids: set[int] = set()
-        if resume and CHECKPOINT_FILE.exists():
-            try:
-                checkpoint = json.loads(CHECKPOINT_FILE.read_text())
-                processed_ids = set(checkpoint.get("processed_ids", []))
-                logger.info(f"Resuming from checkpoint: {len(processed_ids)} already processed")
-            except json.JSONDecodeError:
-                logger.warning("Invalid checkpoint file, starting fresh")
+        if resume:
+            await self._migrate_checkpoint()
 
         # Get pericopes to process
         query = select(Pericope).order_by(Pericope.id)
@@ -122,114 +137,184 @@ class EntityExtractor:
 
         result = await self.session.execute(query)
         all_pericopes = result.scalars().all()
-        total = len(all_pericopes)
-
-        logger.info(f"Total pericopes: {total}, already processed: {len(processed_ids)}")
+        logger.info(f"Total pericopes: {len(all_pericopes)}")
+
+        items = await self._build_items(all_pericopes)
+        if resume:
+            await self._requeue_missing(items)
+        run_stats = await self.runner.run(
+            items,
+            call=self._extract,
+            apply_batch=self._store_batch,
+            write_batch_size=self.write_batch_size,
+            resume=resume,
+        )
 
         stats = {
-            "total": total,
-            "processed": 0,
-            "skipped": 0,
-            "errors": 0,
-            "entities_created": 0,
-            "topics_created": 0,
+            "total": len(all_pericopes),
+            "processed": run_stats.processed,
+            "skipped": run_stats.skipped + len(all_pericopes) - len(items),
+            "errors": run_stats.errors,
+            "entities_created": self.counts["entities"],
+            "topics_created": self.counts["topics"],
+            "rows_written": self.counts["rows"],
         }
+        if self.write_seconds > 0:
+            logger.info(
+                f"Stored {self.counts['rows']} rows in {self.write_seconds:.1f}s "
+                f"({self.counts['rows'] / self.write_seconds:.0f} rows/s)"
+            )
+        logger.info(f"Extraction complete: {stats}")
+        return stats
 
-        for i, pericope in enumerate(all_pericopes):
-            if pericope.id in processed_ids:
-                stats["skipped"] += 1
-                continue
-
-            try:
-                counts = await self._process_pericope(pericope)
-                processed_ids.add(pericope.id)
-                stats["processed"] += 1
-                stats["entities_created"] += counts.get("entities", 0)
-                stats["topics_created"] += counts.get("topics", 0)
+    async def _migrate_checkpoint(self) -> None:
+        """Import a legacy JSON checkpoint into llm_jobs."""
+        if not CHECKPOINT_FILE.exists():
+            return
+        try:
+            checkpoint = json.loads(CHECKPOINT_FILE.read_text())
+        except json.JSONDecodeError:
+            logger.warning("Invalid checkpoint file, ignoring")
+            return
+        count = await self.runner.mark_done(
+            str(pid) for pid in checkpoint.get("processed_ids", [])
+        )
+        CHECKPOINT_FILE.rename(CHECKPOINT_FILE.with_suffix(".json.migrated"))
+        logger.info(f"Migrated {count} pericopes from {CHECKPOINT_FILE}")
 
-            except Exception as e:
-                logger.error(f"Error processing pericope {pericope.id}: {e}")
-                stats["errors"] += 1
-                continue
+    async def _requeue_missing(self, items: list[JobItem]) -> None:
+        """Forget completed items whose entities are no longer stored.
 
-            # Commit and save checkpoint every batch
-            if (i + 1) % self.batch_size == 0:
-                await self.session.commit()
-                self._save_checkpoint(processed_ids)
-                logger.info(
-                    f"Progress: {i + 1}/{total} "
-                    f"(processed: {stats['processed']}, errors: {stats['errors']})"
+        A pericope whose stored response names entities or topics but none
+        of whose verses has a link was re-created (e.g. by a rebuild that
+        re-assigned its id) and must be extracted again.
+        """
+        responses = await self.runner.results()
+        done = {
+            item.key: [verse_id for verse_id, _ in item.payload[0]]
+            for item in items
+            if responses.get(item.key) and self._has_output(responses[item.key])
+        }
+        if not done:
+            return
+
+        verse_ids = [verse_id for ids in done.values() for verse_id in ids]
+        linked: set[int] = set()
+        for i in range(0, len(verse_ids), 1000):
+            chunk = verse_ids[i:i + 1000]
+            for model in (VerseEntity, VerseTopic):
+                result = await self.session.execute(
+                    select(model.verse_id).where(model.verse_id.in_(chunk)).distinct()
                 )
+                linked.update(result.scalars().all())
 
-        # Final commit and checkpoint
-        await self.session.commit()
-        self._save_checkpoint(processed_ids)
-
-        logger.info(f"Extraction complete: {stats}")
-        return stats
+        count = await self.runner.forget(
+            key for key, ids in done.items() if linked.isdisjoint(ids)
+        )
+        if count:
+            logger.info(f"Re-queued {count} completed pericopes without stored entities")
 
-    def _save_checkpoint(self, processed_ids: set[int]) -> None:
-        """Save checkpoint to file."""
-        CHECKPOINT_FILE.write_text(json.dumps({
-            "processed_ids": list(processed_ids),
-        }))
+    def _has_output(self, response: str) -> bool:
+        """Whether a stored response names any entity or topic."""
+        data = self._parse_llm_response(response)
+        if not isinstance(data, dict):
+            return False
+        return any(data.get(key) for key in (*ENTITY_KEYS, "topics"))
 
-    async def _process_pericope(self, pericope: Pericope) -> dict[str, int]:
-        """Process a single pericope.
+    async def _build_items(self, pericopes: list[Pericope]) -> list[JobItem]:
+        """Load the verses of all pericopes up front (the session is not shared by workers).
 
         Args:
-            pericope: Pericope to process
+            pericopes: Pericopes to process
 
         Returns:
-            Counts of created entities and topics
+            One job item per pericope that has verses; the payload is
+            ((verse id, text) pairs, prompt)
         """
-        # Get verses for this pericope
-        result = await self.session.execute(
-            select(Verse)
-            .where(Verse.pericope_id == pericope.id)
-            .order_by(Verse.chapter, Verse.verse)
-        )
-        verses = result.scalars().all()
+        books_result = await self.session.execute(select(Book.id, Book.name_zh))
+        book_names = {row.id: row.name_zh for row in books_result.all()}
+
+        verses_by_pericope: dict[int, list[Verse]] = {}
+        ids = [p.id for p in pericopes]
+        for i in range(0, len(ids), 1000):
+            result = await self.session.execute(
+                select(Verse)
+                .where(Verse.pericope_id.in_(ids[i:i + 1000]))
+                .order_by(Verse.chapter, Verse.verse)
+            )
+            for v in result.scalars().all():
+                verses_by_pericope.setdefault(v.pericope_id, []).append(v)
 
-        if not verses:
-            return {"entities": 0, "topics": 0}
+        items = []
+        for pericope in pericopes:
+            verses = verses_by_pericope.get(pericope.id)
+            if not verses:
+                continue
 
-        # Get book name
-        book_result = await self.session.execute(
-            select(Book).where(Book.id == pericope.book_id)
-        )
-        book = book_result.scalar_one_or_none()
-        book_name = book.name_zh if book else ""
+            # Build context for LLM
+            text_context = f"書卷：{book_names.get(pericope.book_id, '')}\n"
+            text_context += f"段落標題：{pericope.title}\n\n"
+            text_context += "經文內容：\n"
+            for v in verses:
+                text_context += f"{v.chapter}:{v.verse} {v.text}\n"
 
-        # Build context for LLM
-        text_context = f"書卷：{book_name}\n"
-        text_context += f"段落標題：{pericope.title}\n\n"
-        text_context += "經文內容：\n"
-        for v in verses:
-            text_context += f"{v.chapter}:{v.verse} {v.text}\n"
+            prompt = f"請分析以下聖經段落，提取實體和主題：\n\n{text_context}"
+            items.append(JobItem(
+                key=str(pericope.id),
+                payload=([(v.id, v.text) for v in verses], prompt),
+            ))
 
-        # Call LLM for extraction
-        prompt = f"請分析以下聖經段落，提取實體和主題：\n\n{text_context}"
+        return items
 
-        try:
-            response = await self.llm_client.generate(
-                prompt=prompt,
-                system_prompt=EXTRACTION_SYSTEM_PROMPT,
-                temperature=0.1,
-                max_tokens=1024,
-            )
-        except Exception as e:
-            logger.warning(f"LLM call failed for pericope {pericope.id}: {e}")
-            return {"entities": 0, "topics": 0}
+    async def _extract(self, item: JobItem) -> str:
+        """Call the LLM for one pericope.
 
-        # Parse JSON response
-        data = self._parse_llm_response(response)
-        if not data:
-            return {"entities": 0, "topics": 0}
+        Args:
+            item: Job item
+
+        Returns:
+            Raw LLM response (validated to contain parseable JSON)
+        """
+        _, prompt = item.payload
+        response = await self.llm_client.generate(
+            prompt=prompt,
+            system_prompt=EXTRACTION_SYSTEM_PROMPT,
+            temperature=0.1,
+            max_tokens=1024,
+        )
+        if not isinstance(self._parse_llm_response(response), dict):
+            raise ValueError("unparseable LLM response")
+        return response
 
-        # Store entities and create relationships
-        counts = await self._store_entities(verses, data)
-        return counts
+    async def _store_batch(
+        self,
+        session: AsyncSession,
+        results: list[tuple[JobItem, str]],
+    ) -> None:
+        """Store the entities of several pericopes in a few statements."""
+        start = time.perf_counter()
+        try:
+            rows = await self._store_entities(
+                session,
+                [(item.payload[0], self._parse_llm_response(response)) for item, response in results],
+            )
+        except Exception:
+            # Ids created in the rolled-back transaction are no longer valid
+            self.cache_stale = True
+            raise
+        self.counts["rows"] += rows
+        self.write_seconds += time.perf_counter() - start
+
+    async def _load_name_maps(self, session: AsyncSession) -> None:
+        """Warm the name -> id maps with all existing entities and topics."""
+        result = await session.execute(select(Entity.id, Entity.name, Entity.type))
+        self.entity_cache = {(row.name, row.type): row.id for row in result.all()}
+        result = await session.execute(select(Topic.id, Topic.name))
+        self.topic_cache = {row.name: row.id for row in result.all()}
+        self.cache_stale = False
+        logger.info(
+            f"Loaded {len(self.entity_cache)} entities and {len(self.topic_cache)} topics"
+        )
 
     def _parse_llm_response(self, response: str) -> dict | None:
         """Parse LLM JSON response.
@@ -259,212 +344,178 @@ class EntityExtractor:
 
     async def _store_entities(
         self,
-        verses: list[Verse],
-        data: dict,
-    ) -> dict[str, int]:
+        session: AsyncSession,
+        extractions: list[tuple[list[tuple[int, str]], dict]],
+    ) -> int:
         """Store extracted entities in PostgreSQL.
 
+        Each entity and topic is linked only to the verses that mention it
+        (see scripts.entity_linker). New entities and topics are inserted
+        with one multi-row statement each; verse links are written with
+        executemany.
+
         Args:
-            verses: List of verses
-            data: Extracted entity data
+            session: Database session
+            extractions: ((verse id, text) pairs, extracted entity data) per pericope
 
         Returns:
-            Counts of created items
+            Number of rows written
         """
-        entity_count = 0
-        topic_count = 0
-        verse_ids = [v.id for v in verses]
-
-        # Process persons
-        for person in data.get("persons", []):
-            if not person.get("name"):
-                continue
-            entity_id = await self._get_or_create_entity(
-                person["name"], "PERSON"
-            )
-            if entity_id:
-                entity_count += 1
-                for verse_id in verse_ids:
-                    await self._create_verse_entity(
-                        verse_id, entity_id, person.get("role")
-                    )
-
-        # Process places
-        for place in data.get("places", []):
-            if not place.get("name"):
-                continue
-            entity_id = await self._get_or_create_entity(
-                place["name"], "PLACE"
-            )
-            if entity_id:
-                entity_count += 1
-                for verse_id in verse_ids:
-                    await self._create_verse_entity(verse_id, entity_id, None)
-
-        # Process groups
-        for group in data.get("groups", []):
-            if not group.get("name"):
-                continue
-            entity_id = await self._get_or_create_entity(
-                group["name"], "GROUP"
-            )
-            if entity_id:
-                entity_count += 1
+        if self.cache_stale:
+            await self._load_name_maps(session)
+
+        entity_links: dict[tuple[int, tuple[str, str]], str | None] = {}
+        topic_links: set[tuple[int, str]] = set()
+        topic_types: dict[str, str] = {}
+
+        pericopes = []
+        for verses, data in extractions:
+            roles: dict[tuple[str, str], str | None] = {}
+            for key, entity_type in ENTITY_KEYS.items():
+                for entity in data.get(key, []):
+                    if not isinstance(entity, dict) or not entity.get("name"):
+                        continue
+                    role = entity.get("role") if entity_type == "PERSON" else None
+                    roles.setdefault((entity["name"], entity_type), role)
+
+            for topic in data.get("topics", []):
+                if not isinstance(topic, dict) or not topic.get("name"):
+                    continue
+                topic_type = topic.get("type", "OTHER")
+                if topic_type not in TOPIC_TYPES:
+                    topic_type = "OTHER"
+                topic_types.setdefault(topic["name"], topic_type)
+                roles.setdefault((topic["name"], TOPIC), None)
+
+            pericopes.append((verses, roles))
+
+        # One matcher for all names in the batch
+        matcher = self.linker.matcher({key for _, roles in pericopes for key in roles})
+        for verses, roles in pericopes:
+            links = self.linker.link(verses, set(roles), matcher=matcher)
+            for key, verse_ids in links.items():
+                name, entity_type = key
                 for verse_id in verse_ids:
-                    await self._create_verse_entity(verse_id, entity_id, None)
-
-        # Process events
-        for event in data.get("events", []):
-            if not event.get("name"):
-                continue
-            entity_id = await self._get_or_create_entity(
-                event["name"], "EVENT"
+                    if entity_type == TOPIC:
+                        topic_links.add((verse_id, name))
+                    else:
+                        entity_links.setdefault((verse_id, key), roles[key])
+
+        new_entities = {key for _, key in entity_links} - self.entity_cache.keys()
+        new_topics = topic_types.keys() - self.topic_cache.keys()
+        rows = await self._insert_entities(session, new_entities)
+        rows += await self._insert_topics(session, {name: topic_types[name] for name in new_topics})
+
+        if entity_links:
+            await session.execute(
+                insert(VerseEntity).on_conflict_do_nothing(),
+                [
+                    {"verse_id": verse_id, "entity_id": self.entity_cache[key], "role": role}
+                    for (verse_id, key), role in entity_links.items()
+                ],
             )
-            if entity_id:
-                entity_count += 1
-                for verse_id in verse_ids:
-                    await self._create_verse_entity(verse_id, entity_id, None)
-
-        # Process topics
-        for topic in data.get("topics", []):
-            if not topic.get("name"):
-                continue
-            topic_type = topic.get("type", "OTHER")
-            if topic_type not in ("DOCTRINE", "MORAL", "HISTORICAL", "PROPHETIC", "OTHER"):
-                topic_type = "OTHER"
-
-            topic_id = await self._get_or_create_topic(
-                topic["name"], topic_type
+        if topic_links:
+            await session.execute(
+                insert(VerseTopic).on_conflict_do_nothing(),
+                [
+                    {"verse_id": verse_id, "topic_id": self.topic_cache[name], "weight": 1.0}
+                    for verse_id, name in topic_links
+                ],
             )
-            if topic_id:
-                topic_count += 1
-                for verse_id in verse_ids:
-                    await self._create_verse_topic(verse_id, topic_id, 1.0)
 
-        return {"entities": entity_count, "topics": topic_count}
+        return rows + len(entity_links) + len(topic_links)
 
-    async def _get_or_create_entity(
+    async def _insert_entities(
         self,
-        name: str,
-        entity_type: str,
-    ) -> int | None:
-        """Get or create an entity.
+        session: AsyncSession,
+        keys: set[tuple[str, str]],
+    ) -> int:
+        """Insert entities missing from the cache and record their ids.
 
         Args:
-            name: Entity name
-            entity_type: PERSON, PLACE, GROUP, or EVENT
+            session: Database session
+            keys: (name, type) pairs
 
         Returns:
-            Entity ID or None
+            Number of entities created
         """
-        # Check cache
-        cache_key = (name, entity_type)
-        if cache_key in self.entity_cache:
-            return self.entity_cache[cache_key]
-
-        # Check database
-        result = await self.session.execute(
-            select(Entity).where(
-                Entity.name == name,
-                Entity.type == entity_type,
-            )
+        if not keys:
+            return 0
+        result = await session.execute(
+            insert(Entity)
+            .values([{"name": name, "type": entity_type} for name, entity_type in keys])
+            .on_conflict_do_nothing(index_elements=["name", "type"])
+            .returning(Entity.id, Entity.name, Entity.type)
         )
-        entity = result.scalar_one_or_none()
-
-        if entity is None:
-            # Create new entity
-            entity = Entity(name=name, type=entity_type)
-            self.session.add(entity)
-            await self.session.flush()
+        created = result.all()
+        for row in created:
+            self.entity_cache[(row.name, row.type)] = row.id
+
+        # Rows that already existed are not returned by ON CONFLICT DO NOTHING
+        missing = keys - self.entity_cache.keys()
+        if missing:
+            result = await session.execute(
+                select(Entity.id, Entity.name, Entity.type).where(
+                    Entity.name.in_({name for name, _ in missing})
+                )
+            )
+            for row in result.all():
+                self.entity_cache[(row.name, row.type)] = row.id
 
-        self.entity_cache[cache_key] = entity.id
-        return entity.id
+        self.counts["entities"] += len(created)
+        return len(created)
 
-    async def _get_or_create_topic(
+    async def _insert_topics(
         self,
-        name: str,
-        topic_type: str,
-    ) -> int | None:
-        """Get or create a topic.
+        session: AsyncSession,
+        topics: dict[str, str],
+    ) -> int:
+        """Insert topics missing from the cache and record their ids.
 
         Args:
-            name: Topic name
-            topic_type: DOCTRINE, MORAL, HISTORICAL, PROPHETIC, or OTHER
+            session: Database session
+            topics: Topic name -> type
 
         Returns:
-            Topic ID or None
+            Number of topics created
         """
-        # Check cache
-        if name in self.topic_cache:
-            return self.topic_cache[name]
-
-        # Check database
-        result = await self.session.execute(
-            select(Topic).where(Topic.name == name)
+        if not topics:
+            return 0
+        result = await session.execute(
+            insert(Topic)
+            .values([{"name": name, "type": topic_type} for name, topic_type in topics.items()])
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(Topic.id, Topic.name)
         )
-        topic = result.scalar_one_or_none()
-
-        if topic is None:
-            # Create new topic
-            topic = Topic(name=name, type=topic_type)
-            self.session.add(topic)
-            await self.session.flush()
-
-        self.topic_cache[name] = topic.id
-        return topic.id
-
-    async def _create_verse_entity(
-        self,
-        verse_id: int,
-        entity_id: int,
-        role: str | None,
-    ) -> None:
-        """Create verse-entity association (upsert).
-
-        Args:
-            verse_id: Verse ID
-            entity_id: Entity ID
-            role: Optional role description
-        """
-        stmt = insert(VerseEntity).values(
-            verse_id=verse_id,
-            entity_id=entity_id,
-            role=role,
-        ).on_conflict_do_nothing()
-        await self.session.execute(stmt)
-
-    async def _create_verse_topic(
-        self,
-        verse_id: int,
-        topic_id: int,
-        weight: float,
-    ) -> None:
-        """Create verse-topic association (upsert).
+        created = result.all()
+        for row in created:
+            self.topic_cache[row.name] = row.id
+
+        missing = topics.keys() - self.topic_cache.keys()
+        if missing:
+            result = await session.execute(
+                select(Topic.id, Topic.name).where(Topic.name.in_(missing))
+            )
+            for row in result.all():
+                self.topic_cache[row.name] = row.id
 
-        Args:
-            verse_id: Verse ID
-            topic_id: Topic ID
-            weight: Relevance weight
-        """
-        stmt = insert(VerseTopic).values(
-            verse_id=verse_id,
-            topic_id=topic_id,
-            weight=weight,
-        ).on_conflict_do_nothing()
-        await self.session.execute(stmt)
+        self.counts["topics"] += len(created)
+        return len(created)
 
 
 async def main(
     resume: bool = True,
-    batch_size: int = 10,
+    concurrency: int | None = None,
     limit: int | None = None,
+    write_batch_size: int = WRITE_BATCH_SIZE,
 ) -> None:
     """Main entry point.
 
     Args:
-        resume: Whether to resume from checkpoint
-        batch_size: Number of pericopes per batch
+        resume: Whether to skip pericopes completed in earlier runs
+        concurrency: Concurrent LLM calls (default: LLM_BATCH_CONCURRENCY)
         limit: Optional limit on pericopes to process
+        write_batch_size: Pericopes whose results are written per transaction
     """
     # Create async engine
     engine = create_async_engine(
@@ -481,7 +532,11 @@ async def main(
     )
 
     async with async_session() as session:
-        extractor = EntityExtractor(session, batch_size=batch_size)
+        extractor = EntityExtractor(
+            session,
+            concurrency=concurrency,
+            write_batch_size=write_batch_size,
+        )
         stats = await extractor.extract_all(resume=resume, limit=limit)
         print(f"\nExtraction Statistics:")
         print(f"  Total pericopes: {stats['total']}")
@@ -490,6 +545,7 @@ async def main(
         print(f"  Errors: {stats['errors']}")
         print(f"  Entities created: {stats['entities_created']}")
         print(f"  Topics created: {stats['topics_created']}")
+        print(f"  Rows written: {stats['rows_written']}")
 
     await engine.dispose()
 
@@ -501,13 +557,19 @@ if __name__ == "__main__":
     parser.add_argument(
         "--no-resume",
         action="store_true",
-        help="Start fresh, ignore checkpoint",
+        help="Start fresh, forget completed pericopes",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Concurrent LLM calls (default: {settings.LLM_BATCH_CONCURRENCY})",
     )
     parser.add_argument(
-        "--batch-size",
+        "--write-batch-size",
         type=int,
-        default=10,
-        help="Number of pericopes per batch (default: 10)",
+        default=WRITE_BATCH_SIZE,
+        help=f"Pericopes written per transaction (default: {WRITE_BATCH_SIZE})",
     )
     parser.add_argument(
         "--limit",
@@ -528,6 +590,7 @@ if __name__ == "__main__":
 
     asyncio.run(main(
         resume=not args.no_resume,
-        batch_size=args.batch_size,
+        concurrency=args.concurrency,
         limit=args.limit,
+        write_batch_size=args.write_batch_size,
     ))
@@ -0,0 +1,163 @@
+"""Verse-level entity linking.
+
+The LLM extracts entities per pericope. Instead of linking each entity to
+every verse of its pericope, the linker attaches it only to the verses whose
+text mentions the entity's name or one of its aliases
+(data/entity_aliases.json). All names are matched in a single pass over each
+verse with an Aho-Corasick automaton.
+
+An entity (or topic) that no verse mentions literally — e.g. a topic the LLM
+inferred, or a name it normalised — is anchored to the pericope's first
+verse so it stays reachable from the pericope.
+
+Usage (from a script):
+    linker = EntityLinker(load_aliases())
+    links = linker.link(verses, {("摩西", "PERSON"), ("信心", "TOPIC")})
+"""
+
+import json
+from collections import deque
+from collections.abc import Hashable, Iterable
+from pathlib import Path
+
+DEFAULT_ALIASES_PATH = Path(__file__).parent.parent / "data" / "entity_aliases.json"
+
+# Alias-file section for topics (entities use their type)
+TOPIC = "TOPIC"
+
+# Shorter aliases (e.g. 主, 信) occur inside too many unrelated words
+MIN_ALIAS_LENGTH = 2
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher.
+
+    Each pattern carries a set of labels; ``find`` returns the labels of all
+    patterns occurring in a text, in time linear in the text length.
+    """
+
+    def __init__(self, patterns: dict[str, set[Hashable]]):
+        """Build the automaton.
+
+        Args:
+            patterns: Pattern string -> labels it stands for
+        """
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[set[Hashable]] = [set()]
+
+        for pattern, labels in patterns.items():
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                nxt = self.goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                node = nxt
+            self.output[node] |= set(labels)
+
+        # Breadth-first pass to set failure links and merge outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self.goto[node].items():
+                queue.append(nxt)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.output[nxt] |= self.output[self.fail[nxt]]
+
+    def find(self, text: str) -> set[Hashable]:
+        """Labels of all patterns occurring in text."""
+        found: set[Hashable] = set()
+        node = 0
+        for char in text:
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            if self.output[node]:
+                found |= self.output[node]
+        return found
+
+
+def load_aliases(path: Path = DEFAULT_ALIASES_PATH) -> dict[tuple[str, str], list[str]]:
+    """Load the alias file.
+
+    Args:
+        path: JSON file of {type: {name: [aliases]}}
+
+    Returns:
+        (name, type) -> aliases; topics use the type "TOPIC". Aliases
+        shorter than MIN_ALIAS_LENGTH are dropped.
+    """
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    aliases = {}
+    for entity_type, names in data.items():
+        if not isinstance(names, dict):
+            continue
+        for name, alternatives in names.items():
+            aliases[(name, entity_type)] = [
+                alias for alias in alternatives if len(alias) >= MIN_ALIAS_LENGTH
+            ]
+    return aliases
+
+
+class EntityLinker:
+    """Attach entities to the verses that mention them."""
+
+    def __init__(self, aliases: dict[tuple[str, str], list[str]] | None = None):
+        """Create a linker.
+
+        Args:
+            aliases: (name, type) -> alternative names (see load_aliases)
+        """
+        self.aliases = aliases or {}
+
+    def matcher(self, keys: Iterable[tuple[str, str]]) -> AhoCorasick:
+        """Build a matcher for the given (name, type) keys and their aliases."""
+        patterns: dict[str, set[Hashable]] = {}
+        for key in keys:
+            name, _ = key
+            for pattern in (name, *self.aliases.get(key, ())):
+                patterns.setdefault(pattern, set()).add(key)
+        return AhoCorasick(patterns)
+
+    def link(
+        self,
+        verses: list[tuple[int, str]],
+        keys: set[tuple[str, str]],
+        matcher: AhoCorasick | None = None,
+    ) -> dict[tuple[str, str], list[int]]:
+        """Find the verses of a pericope that mention each key.
+
+        Args:
+            verses: (verse id, text) of one pericope, in order
+            keys: (name, type) keys extracted for the pericope
+            matcher: Prebuilt matcher covering at least ``keys``
+
+        Returns:
+            (name, type) -> verse ids; keys never mentioned get the first verse
+        """
+        if not verses or not keys:
+            return {}
+        matcher = matcher or self.matcher(keys)
+
+        links: dict[tuple[str, str], list[int]] = {key: [] for key in keys}
+        for verse_id, text in verses:
+            for key in matcher.find(text or ""):
+                if key in links:
+                    links[key].append(verse_id)
+
+        anchor = verses[0][0]
+        for key, verse_ids in links.items():
+            if not verse_ids:
+                verse_ids.append(anchor)
+        return links
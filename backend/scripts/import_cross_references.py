@@ -180,32 +180,45 @@ class CrossReferenceImporter:
             "skipped_votes": 0,
         }
 
-        # Load book and verse mappings
-        logger.info("Loading book and verse mappings from PostgreSQL...")
-        await self._load_book_cache()
-        await self._load_verse_cache()
-        logger.info(f"  Loaded {len(self.book_cache)} books and {len(self.verse_cache)} verses")
-
         # Clear existing relationships if requested
         if clear_existing:
             logger.info("Clearing existing cross-reference relationships...")
             await self._clear_relationships()
 
-        # Parse cross-references from file
-        logger.info(f"Parsing cross-references from {data_file}...")
-        cross_refs = self._parse_tsv_file(data_file, stats)
-        logger.info(f"  Parsed {len(cross_refs)} cross-references")
+        relationships = await self.load_relationships(data_file, stats)
 
-        # Map to verse IDs and create relationships
+        # Create relationships
         logger.info("Creating Neo4j relationships...")
-        relationships = self._prepare_relationships(cross_refs, stats)
-
         if relationships["quotes"] or relationships["allusions"]:
             await self._create_relationships(relationships, stats)
 
         logger.info(f"Import complete: {stats}")
         return stats
 
+    async def load_relationships(self, data_file: Path, stats: dict) -> dict[str, list]:
+        """Parse cross-references and map them to verse IDs.
+
+        Args:
+            data_file: Path to cross-references TSV file
+            stats: Statistics dict to update
+
+        Returns:
+            Dict with 'quotes' and 'allusions' lists
+        """
+        # Load book and verse mappings
+        logger.info("Loading book and verse mappings from PostgreSQL...")
+        await self._load_book_cache()
+        await self._load_verse_cache()
+        logger.info(f"  Loaded {len(self.book_cache)} books and {len(self.verse_cache)} verses")
+
+        # Parse cross-references from file
+        logger.info(f"Parsing cross-references from {data_file}...")
+        cross_refs = self._parse_tsv_file(data_file, stats)
+        logger.info(f"  Parsed {len(cross_refs)} cross-references")
+
+        # Map to verse IDs
+        return self._prepare_relationships(cross_refs, stats)
+
     async def _load_book_cache(self) -> None:
         """Load all books into cache for quick lookup."""
         result = await self.pg_session.execute(select(Book))
@@ -2,24 +2,30 @@
 
 This script identifies OT prophecies fulfilled in the NT by:
 1. Filtering OT→NT cross-references (from import_cross_references.py)
-2. Using LLM to verify if a cross-reference is a prophecy fulfillment
+2. Accepting or rejecting clear cases from verse embedding similarity and
+   cross-reference votes, and using LLM to verify the ambiguous rest
 3. Creating PROPHECY_FULFILLED_IN relationships in Neo4j
 
 Usage:
     cd backend
     python -m scripts.import_prophecy_links
     python -m scripts.import_prophecy_links --min-votes 5
+    python -m scripts.import_prophecy_links --concurrency 8
+    python -m scripts.import_prophecy_links --accept 0.85 --reject 0.4  # Widen the LLM band
+    python -m scripts.import_prophecy_links --no-prefilter  # Send every pair to the LLM
     python -m scripts.import_prophecy_links --skip-llm  # Use all OT->NT refs without verification
 """
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import sys
 from pathlib import Path
 
-from sqlalchemy import select, text
+import numpy as np
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 # Add parent directory to path for imports
@@ -28,6 +34,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.core.config import settings
 from app.core.neo4j_client import Neo4jClient
 from app.models.orm import Book, Verse
+from scripts.llm_batch_runner import JobItem, LLMBatchRunner
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,12 +42,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Checkpoint file for LLM verification progress
+# Legacy checkpoint file (imported into llm_jobs on first run)
 CHECKPOINT_FILE = Path("prophecy_links_checkpoint.json")
 
 # Batch sizes
 NEO4J_BATCH_SIZE = 500
-LLM_BATCH_SIZE = 10
+EMBED_CHUNK_SIZE = 256
+
+# Verse embeddings used by the prefilter, reused across runs
+EMBEDDING_CACHE = Path(__file__).parent.parent / "data" / "prophecy_verse_embeddings.npz"
 
 # OT book order index threshold (Genesis to Malachi = 1-39)
 OT_MAX_ORDER = 39
@@ -56,21 +66,86 @@ PROPHECY_SYSTEM_PROMPT = """你是聖經預言專家。請判斷給定的舊約
 只回答 "YES" 或 "NO"，不要有任何其他文字。"""
 
 
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+async def load_verse_embeddings(
+    texts: dict[int, str],
+    cache_path: Path = EMBEDDING_CACHE,
+) -> dict[int, np.ndarray]:
+    """Get bge-m3 embeddings of verses, encoding only those not cached.
+
+    Args:
+        texts: Verse ID -> text
+        cache_path: .npz cache of earlier encodings
+
+    Returns:
+        Verse ID -> dense embedding
+    """
+    from app.services.embedding_service import get_embedding_service
+
+    embeddings: dict[int, np.ndarray] = {}
+    cached_hashes: dict[int, str] = {}
+    if cache_path.exists():
+        data = np.load(cache_path)
+        if str(data["model"]) == settings.EMBED_MODEL_NAME:
+            for vid, text_hash, vector in zip(data["ids"], data["hashes"], data["vectors"]):
+                embeddings[int(vid)] = vector
+                cached_hashes[int(vid)] = str(text_hash)
+
+    missing = [
+        vid for vid, text in texts.items()
+        if cached_hashes.get(vid) != _text_hash(text)
+    ]
+    logger.info(f"Verse embeddings: {len(texts) - len(missing)} cached, {len(missing)} to encode")
+
+    if missing:
+        service = await get_embedding_service()
+        for i in range(0, len(missing), EMBED_CHUNK_SIZE):
+            chunk = missing[i:i + EMBED_CHUNK_SIZE]
+            vectors = np.atleast_2d(await service.encode_documents([texts[vid] for vid in chunk]))
+            for vid, vector in zip(chunk, vectors):
+                embeddings[vid] = np.asarray(vector, dtype=np.float32)
+                cached_hashes[vid] = _text_hash(texts[vid])
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        ids = list(embeddings)
+        np.savez(
+            cache_path,
+            model=np.array(settings.EMBED_MODEL_NAME),
+            ids=np.array(ids, dtype=np.int64),
+            hashes=np.array([cached_hashes[vid] for vid in ids]),
+            vectors=np.stack([embeddings[vid] for vid in ids]).astype(np.float32),
+        )
+
+    return {vid: embeddings[vid] for vid in texts}
+
+
 class ProphecyLinkImporter:
     """Import prophecy fulfillment links from cross-references."""
 
+    JOB = "prophecy_verification"
+
     def __init__(
         self,
         session: AsyncSession,
         min_votes: int = 3,
         skip_llm: bool = False,
+        concurrency: int | None = None,
+        prefilter: bool = True,
+        accept: float | None = None,
+        reject: float | None = None,
     ):
         self.session = session
         self.min_votes = min_votes
         self.skip_llm = skip_llm
+        self.prefilter = prefilter
+        self.accept = settings.PROPHECY_PREFILTER_ACCEPT if accept is None else accept
+        self.reject = settings.PROPHECY_PREFILTER_REJECT if reject is None else reject
+        self.runner = LLMBatchRunner(session, self.JOB, concurrency=concurrency)
         self.llm_client = None
         self.book_cache: dict[int, dict] = {}  # book_id -> {name, order_index}
-        self.verse_text_cache: dict[int, str] = {}  # verse_id -> text
 
     async def _init_llm(self):
         """Initialize LLM client."""
@@ -93,17 +168,6 @@ class ProphecyLinkImporter:
 
         logger.info(f"Loaded {len(self.book_cache)} books")
 
-    async def _get_verse_text(self, verse_id: int) -> str:
-        """Get verse text with caching."""
-        if verse_id not in self.verse_text_cache:
-            result = await self.session.execute(
-                select(Verse.text).where(Verse.id == verse_id)
-            )
-            row = result.scalar_one_or_none()
-            self.verse_text_cache[verse_id] = row or ""
-
-        return self.verse_text_cache[verse_id]
-
     async def import_prophecy_links(self) -> dict[str, int]:
         """Import prophecy fulfillment links.
 
@@ -114,6 +178,9 @@ class ProphecyLinkImporter:
             "ot_nt_refs_found": 0,
             "verified_by_llm": 0,
             "skipped_by_llm": 0,
+            "auto_accepted": 0,
+            "auto_rejected": 0,
+            "llm_calls_saved": 0,
             "relationships_created": 0,
             "errors": 0,
         }
@@ -121,13 +188,8 @@ class ProphecyLinkImporter:
         await self._init_llm()
         await self._load_caches()
 
-        # Load checkpoint if exists
-        verified_pairs = set()
-        if CHECKPOINT_FILE.exists() and not self.skip_llm:
-            with open(CHECKPOINT_FILE, "r") as f:
-                checkpoint = json.load(f)
-                verified_pairs = set(tuple(p) for p in checkpoint.get("verified_pairs", []))
-                logger.info(f"Loaded checkpoint with {len(verified_pairs)} verified pairs")
+        if not self.skip_llm:
+            await self._migrate_checkpoint()
 
         # Query existing QUOTES relationships (OT->NT cross-references)
         logger.info("Querying OT→NT cross-references from Neo4j...")
@@ -156,61 +218,78 @@ class ProphecyLinkImporter:
         stats["ot_nt_refs_found"] = len(results)
         logger.info(f"Found {len(results)} OT→NT cross-references")
 
-        # Process references
-        prophecy_links = []
-
+        refs = []
         for ref in results:
             ot_id = ref["ot_id"] if isinstance(ref, dict) else ref[0]
             nt_id = ref["nt_id"] if isinstance(ref, dict) else ref[1]
             votes = ref.get("votes", 1) if isinstance(ref, dict) else (ref[2] if len(ref) > 2 else 1)
+            refs.append((ot_id, nt_id, votes))
 
-            pair_key = (ot_id, nt_id)
-
-            if self.skip_llm:
-                # Skip LLM verification, use all OT->NT refs
-                prophecy_links.append({
+        if self.skip_llm:
+            # Skip LLM verification, use all OT->NT refs
+            prophecy_links = [
+                {
                     "ot_id": ot_id,
                     "nt_id": nt_id,
                     "votes": votes,
                     "confidence": 0.7,  # Lower confidence without LLM
-                })
-                stats["verified_by_llm"] += 1
-            elif pair_key in verified_pairs:
-                # Already verified in previous run
-                prophecy_links.append({
-                    "ot_id": ot_id,
-                    "nt_id": nt_id,
-                    "votes": votes,
-                    "confidence": 0.9,
-                })
-                stats["verified_by_llm"] += 1
-            else:
-                # Verify with LLM
-                try:
-                    is_prophecy = await self._verify_prophecy_with_llm(ot_id, nt_id)
-                    if is_prophecy:
+                }
+                for ot_id, nt_id, votes in refs
+            ]
+            stats["verified_by_llm"] = len(prophecy_links)
+        else:
+            verses = await self._load_verses(refs)
+
+            # Decide the clear cases from embedding similarity and votes; pairs
+            # the LLM already judged in earlier runs keep their stored verdict
+            decisions: dict[tuple[int, int], bool] = {}
+            if self.prefilter:
+                done = await self.runner.done_keys()
+                undecided = [
+                    ref for ref in refs if self._pair_key(ref[0], ref[1]) not in done
+                ]
+                decisions = await self._prefilter(undecided, verses)
+            ambiguous = [ref for ref in refs if (ref[0], ref[1]) not in decisions]
+            stats["auto_accepted"] = sum(decisions.values())
+            stats["auto_rejected"] = len(decisions) - stats["auto_accepted"]
+            stats["llm_calls_saved"] = len(decisions)
+
+            # Verify the rest with LLM; verdicts (YES and NO) are kept in llm_jobs
+            items = self._build_items(ambiguous, verses)
+            run_stats = await self.runner.run(items, call=self._verify_prophecy_with_llm)
+            stats["errors"] = run_stats.errors
+
+            verdicts = await self.runner.results()
+            prophecy_links = []
+            for ot_id, nt_id, votes in refs:
+                decision = decisions.get((ot_id, nt_id))
+                if decision is not None:
+                    if decision:
                         prophecy_links.append({
                             "ot_id": ot_id,
                             "nt_id": nt_id,
                             "votes": votes,
-                            "confidence": 0.9,
+                            "confidence": 0.8,  # Accepted by the prefilter
                         })
-                        verified_pairs.add(pair_key)
-                        stats["verified_by_llm"] += 1
-                    else:
-                        stats["skipped_by_llm"] += 1
-
-                    # Save checkpoint periodically
-                    if len(verified_pairs) % LLM_BATCH_SIZE == 0:
-                        self._save_checkpoint(verified_pairs)
-
-                except Exception as e:
-                    logger.warning(f"LLM verification failed for {ot_id}->{nt_id}: {e}")
-                    stats["errors"] += 1
-
-        # Save final checkpoint
-        if not self.skip_llm:
-            self._save_checkpoint(verified_pairs)
+                    continue
+
+                verdict = verdicts.get(self._pair_key(ot_id, nt_id))
+                if verdict == "YES":
+                    prophecy_links.append({
+                        "ot_id": ot_id,
+                        "nt_id": nt_id,
+                        "votes": votes,
+                        "confidence": 0.9,
+                    })
+                    stats["verified_by_llm"] += 1
+                elif verdict == "NO":
+                    stats["skipped_by_llm"] += 1
+
+            logger.info(
+                f"Prefilter decided {len(decisions)}/{len(refs)} pairs "
+                f"(accepted: {stats['auto_accepted']}, rejected: {stats['auto_rejected']}), "
+                f"{len(ambiguous)} sent to LLM"
+            )
 
         # Create Neo4j relationships
         if prophecy_links:
@@ -231,76 +310,161 @@ class ProphecyLinkImporter:
         logger.warning("No QUOTES relationships in Neo4j. Run import_cross_references.py first.")
         return []
 
-    async def _verify_prophecy_with_llm(self, ot_id: int, nt_id: int) -> bool:
-        """Verify if a cross-reference is a prophecy fulfillment.
+    @staticmethod
+    def _pair_key(ot_id: int, nt_id: int) -> str:
+        """Job item key of an OT->NT pair."""
+        return f"{ot_id}->{nt_id}"
+
+    async def _migrate_checkpoint(self) -> None:
+        """Import a legacy JSON checkpoint (verified pairs) into llm_jobs."""
+        if not CHECKPOINT_FILE.exists():
+            return
+        try:
+            checkpoint = json.loads(CHECKPOINT_FILE.read_text())
+        except json.JSONDecodeError:
+            logger.warning("Invalid checkpoint file, ignoring")
+            return
+        count = await self.runner.mark_done(
+            (self._pair_key(ot_id, nt_id) for ot_id, nt_id in checkpoint.get("verified_pairs", [])),
+            result="YES",
+        )
+        CHECKPOINT_FILE.rename(CHECKPOINT_FILE.with_suffix(".json.migrated"))
+        logger.info(f"Migrated {count} verified pairs from {CHECKPOINT_FILE}")
+
+    async def _load_verses(self, refs: list[tuple[int, int, int]]) -> dict[int, Verse]:
+        """Load the verses of all pairs up front (the session is not shared by workers).
 
         Args:
-            ot_id: OT verse ID
-            nt_id: NT verse ID
+            refs: (ot_id, nt_id, votes) tuples
 
         Returns:
-            True if verified as prophecy fulfillment
+            Verse ID -> verse
         """
-        if not self.llm_client:
-            return True  # Default to True if no LLM
+        verse_ids = list({vid for ot_id, nt_id, _ in refs for vid in (ot_id, nt_id)})
+        verses: dict[int, Verse] = {}
+        for i in range(0, len(verse_ids), 1000):
+            result = await self.session.execute(
+                select(Verse).where(Verse.id.in_(verse_ids[i:i + 1000]))
+            )
+            verses.update((v.id, v) for v in result.scalars().all())
+        return verses
 
-        # Get verse texts
-        ot_text = await self._get_verse_text(ot_id)
-        nt_text = await self._get_verse_text(nt_id)
+    async def _prefilter(
+        self,
+        refs: list[tuple[int, int, int]],
+        verses: dict[int, Verse],
+    ) -> dict[tuple[int, int], bool]:
+        """Accept or reject clear cases without the LLM.
 
-        if not ot_text or not nt_text:
-            return False
+        A pair's score blends the cosine similarity of its verse embeddings
+        with its normalised cross-reference votes:
+        ``(1 - w) * similarity + w * log1p(votes) / log1p(saturation)``.
+        Pairs scoring at least ``accept`` are accepted, pairs below
+        ``reject`` are rejected; the band in between goes to the LLM.
 
-        # Get book names for reference
-        ot_verse = await self.session.execute(
-            select(Verse).where(Verse.id == ot_id)
-        )
-        ot_verse = ot_verse.scalar_one_or_none()
+        Args:
+            refs: (ot_id, nt_id, votes) tuples
+            verses: Verse ID -> verse
 
-        nt_verse = await self.session.execute(
-            select(Verse).where(Verse.id == nt_id)
+        Returns:
+            (ot_id, nt_id) -> accepted, for the decided pairs only
+        """
+        pairs = [
+            (ot_id, nt_id, votes)
+            for ot_id, nt_id, votes in refs
+            if verses.get(ot_id) and verses.get(nt_id)
+            and verses[ot_id].text and verses[nt_id].text
+        ]
+        if not pairs:
+            return {}
+
+        embeddings = await load_verse_embeddings(
+            {vid: verses[vid].text for ot_id, nt_id, _ in pairs for vid in (ot_id, nt_id)}
+        )
+        ids = np.fromiter(embeddings.keys(), dtype=np.int64, count=len(embeddings))
+        matrix = np.stack(list(embeddings.values()))
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        row_of = {int(vid): i for i, vid in enumerate(ids)}
+
+        ot_rows = np.array([row_of[ot_id] for ot_id, _, _ in pairs])
+        nt_rows = np.array([row_of[nt_id] for _, nt_id, _ in pairs])
+        votes = np.array([max(votes or 0, 0) for _, _, votes in pairs], dtype=np.float32)
+
+        similarity = np.einsum("ij,ij->i", matrix[ot_rows], matrix[nt_rows])
+        vote_score = np.minimum(
+            np.log1p(votes) / np.log1p(settings.PROPHECY_VOTE_SATURATION), 1.0
         )
-        nt_verse = nt_verse.scalar_one_or_none()
+        weight = settings.PROPHECY_VOTE_WEIGHT
+        scores = (1 - weight) * similarity + weight * vote_score
+
+        decisions = {}
+        for (ot_id, nt_id, _), score in zip(pairs, scores):
+            if score >= self.accept:
+                decisions[(ot_id, nt_id)] = True
+            elif score < self.reject:
+                decisions[(ot_id, nt_id)] = False
+        return decisions
+
+    def _build_items(
+        self,
+        refs: list[tuple[int, int, int]],
+        verses: dict[int, Verse],
+    ) -> list[JobItem]:
+        """Build one LLM job item per pair.
 
-        if not ot_verse or not nt_verse:
-            return False
+        Args:
+            refs: (ot_id, nt_id, votes) tuples
+            verses: Verse ID -> verse
 
-        ot_book_name = self.book_cache.get(ot_verse.book_id, {}).get("name", "")
-        nt_book_name = self.book_cache.get(nt_verse.book_id, {}).get("name", "")
+        Returns:
+            Job items; the payload is the prompt, or None when a verse is missing
+        """
+        items = []
+        for ot_id, nt_id, _ in refs:
+            ot_verse = verses.get(ot_id)
+            nt_verse = verses.get(nt_id)
+            prompt = None
 
-        ot_ref = f"{ot_book_name} {ot_verse.chapter}:{ot_verse.verse}"
-        nt_ref = f"{nt_book_name} {nt_verse.chapter}:{nt_verse.verse}"
+            if ot_verse and nt_verse and ot_verse.text and nt_verse.text:
+                ot_book_name = self.book_cache.get(ot_verse.book_id, {}).get("name", "")
+                nt_book_name = self.book_cache.get(nt_verse.book_id, {}).get("name", "")
 
-        prompt = f"""舊約經文（{ot_ref}）：
-{ot_text}
+                ot_ref = f"{ot_book_name} {ot_verse.chapter}:{ot_verse.verse}"
+                nt_ref = f"{nt_book_name} {nt_verse.chapter}:{nt_verse.verse}"
+
+                prompt = f"""舊約經文（{ot_ref}）：
+{ot_verse.text}
 
 新約經文（{nt_ref}）：
-{nt_text}
+{nt_verse.text}
 
 這是預言與應驗的關係嗎？"""
 
-        try:
-            response = await self.llm_client.generate(
-                prompt=prompt,
-                system_prompt=PROPHECY_SYSTEM_PROMPT,
-                temperature=0.1,
-                max_tokens=10,
-            )
+            items.append(JobItem(key=self._pair_key(ot_id, nt_id), payload=prompt))
 
-            answer = response.strip().upper()
-            return answer.startswith("YES")
+        return items
 
-        except Exception as e:
-            logger.warning(f"LLM call failed: {e}")
-            return False
+    async def _verify_prophecy_with_llm(self, item: JobItem) -> str:
+        """Verify if a cross-reference is a prophecy fulfillment.
 
-    def _save_checkpoint(self, verified_pairs: set):
-        """Save checkpoint to file."""
-        checkpoint = {
-            "verified_pairs": list(verified_pairs),
-        }
-        with open(CHECKPOINT_FILE, "w") as f:
-            json.dump(checkpoint, f)
+        Args:
+            item: Job item whose payload is the prompt
+
+        Returns:
+            "YES" if verified as prophecy fulfillment, otherwise "NO"
+        """
+        if item.payload is None:
+            return "NO"
+
+        response = await self.llm_client.generate(
+            prompt=item.payload,
+            system_prompt=PROPHECY_SYSTEM_PROMPT,
+            temperature=0.1,
+            max_tokens=10,
+        )
+
+        answer = response.strip().upper()
+        return "YES" if answer.startswith("YES") else "NO"
 
     async def _create_relationships(self, links: list[dict]) -> None:
         """Create PROPHECY_FULFILLED_IN relationships in Neo4j.
@@ -347,6 +511,10 @@ async def main(
     min_votes: int = 3,
     skip_llm: bool = False,
     clear_existing: bool = True,
+    concurrency: int | None = None,
+    prefilter: bool = True,
+    accept: float | None = None,
+    reject: float | None = None,
 ) -> None:
     """Main entry point.
 
@@ -354,6 +522,10 @@ async def main(
         min_votes: Minimum votes threshold for cross-references
         skip_llm: Skip LLM verification (use all OT->NT refs)
         clear_existing: Clear existing relationships first
+        concurrency: Concurrent LLM calls (default: LLM_BATCH_CONCURRENCY)
+        prefilter: Decide clear cases from embeddings and votes
+        accept: Prefilter score at or above which a pair is accepted
+        reject: Prefilter score below which a pair is rejected
     """
     # Initialize Neo4j
     await Neo4jClient.initialize()
@@ -383,6 +555,10 @@ async def main(
                 session=session,
                 min_votes=min_votes,
                 skip_llm=skip_llm,
+                concurrency=concurrency,
+                prefilter=prefilter,
+                accept=accept,
+                reject=reject,
             )
 
             if clear_existing:
@@ -416,6 +592,31 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip LLM verification (use all OT->NT refs)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Concurrent LLM calls (default: {settings.LLM_BATCH_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Send every pair to the LLM",
+    )
+    parser.add_argument(
+        "--accept",
+        type=float,
+        default=None,
+        help=f"Prefilter accept score (default: {settings.PROPHECY_PREFILTER_ACCEPT}); "
+             "raise for precision",
+    )
+    parser.add_argument(
+        "--reject",
+        type=float,
+        default=None,
+        help=f"Prefilter reject score (default: {settings.PROPHECY_PREFILTER_REJECT}); "
+             "lower for recall",
+    )
     parser.add_argument(
         "--no-clear",
         action="store_true",
@@ -436,4 +637,8 @@ if __name__ == "__main__":
         min_votes=args.min_votes,
         skip_llm=args.skip_llm,
         clear_existing=not args.no_clear,
+        concurrency=args.concurrency,
+        prefilter=not args.no_prefilter,
+        accept=args.accept,
+        reject=args.reject,
     ))
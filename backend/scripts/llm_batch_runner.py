@@ -0,0 +1,328 @@
+"""Concurrent, resumable runner for offline LLM batch jobs.
+
+Shared by the enrichment scripts (entity_extractor, summary_generator,
+import_prophecy_links). Items are sent to Ollama with bounded concurrency so
+its parallel slots stay busy; failed calls are retried with exponential
+backoff. Each item's results and its ``llm_jobs`` row are committed in one
+transaction, so a restarted run skips exactly the items already stored.
+
+Usage (from a script):
+    runner = LLMBatchRunner(session, "summary")
+    stats = await runner.run(items, call=generate_summary, apply=store_summary)
+"""
+
+import asyncio
+import logging
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.orm import LLMJob
+
+logger = logging.getLogger(__name__)
+
+# Seconds between progress reports
+PROGRESS_INTERVAL = 30.0
+
+
+@dataclass
+class JobItem:
+    """One unit of work: a stable key plus whatever the call needs."""
+
+    key: str
+    payload: Any = None
+
+
+@dataclass
+class RunStats:
+    """Outcome of a runner pass."""
+
+    total: int = 0
+    skipped: int = 0
+    processed: int = 0
+    errors: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Items finished per second."""
+        done = self.processed + self.errors
+        return done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class LLMBatchRunner:
+    """Run an LLM call over many items with bounded concurrency and durable state."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        job: str,
+        concurrency: int | None = None,
+        max_retries: int | None = None,
+        backoff: float = 2.0,
+    ):
+        """Create a runner.
+
+        Args:
+            session: Session used for job state and for ``apply`` callbacks
+            job: Job name (the ``llm_jobs.job`` key)
+            concurrency: Concurrent LLM calls (default: LLM_BATCH_CONCURRENCY)
+            max_retries: Retries per item after the first attempt
+                (default: LLM_BATCH_MAX_RETRIES)
+            backoff: Base delay in seconds, doubled on each retry
+        """
+        self.session = session
+        self.job = job
+        self.concurrency = concurrency or settings.LLM_BATCH_CONCURRENCY
+        self.max_retries = settings.LLM_BATCH_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff = backoff
+        # The session is not safe for concurrent use; writes are serialized
+        self._write_lock = asyncio.Lock()
+
+    async def done_keys(self) -> set[str]:
+        """Keys of items already completed in earlier runs."""
+        result = await self.session.execute(
+            select(LLMJob.item_key).where(LLMJob.job == self.job, LLMJob.status == "done")
+        )
+        return set(result.scalars().all())
+
+    async def results(self) -> dict[str, str | None]:
+        """Stored LLM output of every completed item, by key."""
+        result = await self.session.execute(
+            select(LLMJob.item_key, LLMJob.result).where(
+                LLMJob.job == self.job, LLMJob.status == "done"
+            )
+        )
+        return {row.item_key: row.result for row in result.all()}
+
+    async def reset(self) -> None:
+        """Forget all state of this job (start fresh)."""
+        await self.session.execute(delete(LLMJob).where(LLMJob.job == self.job))
+        await self.session.commit()
+
+    async def forget(self, keys: Iterable[str]) -> int:
+        """Drop the state of some items so the next run processes them again."""
+        keys = list(keys)
+        if keys:
+            await self.session.execute(
+                delete(LLMJob).where(LLMJob.job == self.job, LLMJob.item_key.in_(keys))
+            )
+            await self.session.commit()
+        return len(keys)
+
+    async def mark_done(self, keys: Iterable[str], result: str | None = None) -> int:
+        """Record items as completed without running them (e.g. legacy checkpoints)."""
+        rows = [
+            {"job": self.job, "item_key": key, "status": "done", "attempts": 0, "result": result}
+            for key in keys
+        ]
+        if rows:
+            await self.session.execute(insert(LLMJob).values(rows).on_conflict_do_nothing())
+            await self.session.commit()
+        return len(rows)
+
+    async def run(
+        self,
+        items: list[JobItem],
+        call: Callable[[JobItem], Awaitable[str]],
+        apply: Callable[[AsyncSession, JobItem, str], Awaitable[None]] | None = None,
+        resume: bool = True,
+        apply_batch: Callable[[AsyncSession, list[tuple[JobItem, str]]], Awaitable[None]] | None = None,
+        write_batch_size: int = 1,
+    ) -> RunStats:
+        """Process items, skipping those completed in earlier runs.
+
+        Args:
+            items: Work items
+            call: Produces the LLM output for an item; raise to retry
+                (including on unusable output)
+            apply: Stores an item's results through the session; its writes
+                commit together with the item's job state
+            resume: Skip completed items (False clears this job's state first)
+            apply_batch: Alternative to ``apply`` that stores the results of
+                several items at once
+            write_batch_size: Finished items committed per transaction; a
+                failing batch is retried item by item
+
+        Returns:
+            RunStats
+        """
+        if not resume:
+            await self.reset()
+        done = await self.done_keys()
+        pending = [item for item in items if item.key not in done]
+
+        stats = RunStats(total=len(items), skipped=len(items) - len(pending))
+        logger.info(
+            f"[{self.job}] {len(items)} items, {stats.skipped} already done, "
+            f"{len(pending)} to run with concurrency {self.concurrency}"
+        )
+        if not pending:
+            return stats
+
+        queue: asyncio.Queue[JobItem] = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+
+        start = time.perf_counter()
+        last_report = start
+        finished: list[tuple[JobItem, str, int]] = []
+
+        async def store(entries: list[tuple[JobItem, str, int]]) -> None:
+            await self._store(entries, apply, apply_batch, stats)
+
+        async def worker() -> None:
+            nonlocal last_report, finished
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                entry = await self._call_item(item, call, stats)
+                if entry is not None:
+                    finished.append(entry)
+                    if len(finished) >= write_batch_size:
+                        entries, finished = finished, []
+                        await store(entries)
+
+                now = time.perf_counter()
+                stats.elapsed = now - start
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    self._log_progress(stats, len(pending))
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(pending)))))
+        if finished:
+            await store(finished)
+
+        stats.elapsed = time.perf_counter() - start
+        self._log_progress(stats, len(pending))
+        return stats
+
+    async def _call_item(
+        self,
+        item: JobItem,
+        call: Callable[[JobItem], Awaitable[str]],
+        stats: RunStats,
+    ) -> tuple[JobItem, str, int] | None:
+        """Call the LLM with retries.
+
+        Returns:
+            (item, output, attempts), or None once retries are exhausted
+            (the item is then recorded as failed)
+        """
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                stats.retries += 1
+                delay = self.backoff * 2 ** (attempt - 1)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+            try:
+                return item, await call(item), attempt + 1
+            except Exception as e:
+                error = e
+                logger.warning(f"[{self.job}] {item.key} attempt {attempt + 1} failed: {e}")
+
+        async with self._write_lock:
+            await self._upsert([
+                self._row(item, "failed", self.max_retries + 1, error=str(error))
+            ])
+            await self.session.commit()
+        stats.errors += 1
+        return None
+
+    async def _store(
+        self,
+        entries: list[tuple[JobItem, str, int]],
+        apply: Callable[[AsyncSession, JobItem, str], Awaitable[None]] | None,
+        apply_batch: Callable[[AsyncSession, list[tuple[JobItem, str]]], Awaitable[None]] | None,
+        stats: RunStats,
+    ) -> None:
+        """Store results and job state of finished items in one transaction."""
+        async with self._write_lock:
+            try:
+                if apply_batch is not None:
+                    await apply_batch(self.session, [(item, output) for item, output, _ in entries])
+                elif apply is not None:
+                    for item, output, _ in entries:
+                        await apply(self.session, item, output)
+                await self._upsert([
+                    self._row(item, "done", attempts, result=output)
+                    for item, output, attempts in entries
+                ])
+                await self.session.commit()
+                stats.processed += len(entries)
+                return
+            except Exception as e:
+                await self.session.rollback()
+                error = e
+                if len(entries) == 1:
+                    item, _, attempts = entries[0]
+                    logger.error(f"[{self.job}] {item.key} failed to store results: {e}")
+                    await self._upsert([self._row(item, "failed", attempts, error=str(e))])
+                    await self.session.commit()
+                    stats.errors += 1
+                    return
+
+        # Isolate the item that broke the batch
+        logger.warning(
+            f"[{self.job}] batch of {len(entries)} failed to store ({error}), retrying one by one"
+        )
+        for entry in entries:
+            await self._store([entry], apply, apply_batch, stats)
+
+    def _row(
+        self,
+        item: JobItem,
+        status: str,
+        attempts: int,
+        result: str | None = None,
+        error: str | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "job": self.job,
+            "item_key": item.key,
+            "status": status,
+            "attempts": attempts,
+            "result": result,
+            "error": error,
+        }
+
+    async def _upsert(self, rows: list[dict[str, Any]]) -> None:
+        stmt = insert(LLMJob).values(rows)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[LLMJob.job, LLMJob.item_key],
+                set_={
+                    "status": stmt.excluded.status,
+                    "attempts": LLMJob.attempts + stmt.excluded.attempts,
+                    "result": stmt.excluded.result,
+                    "error": stmt.excluded.error,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+        )
+
+    def _log_progress(self, stats: RunStats, pending: int) -> None:
+        finished = stats.processed + stats.errors
+        rate = stats.rate
+        eta = (pending - finished) / rate if rate > 0 else 0.0
+        logger.info(
+            f"[{self.job}] {finished}/{pending} "
+            f"(ok: {stats.processed}, errors: {stats.errors}, retries: {stats.retries}) "
+            f"{rate:.2f} items/s, ETA {eta / 60:.1f} min"
+        )
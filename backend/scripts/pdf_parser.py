@@ -5,10 +5,19 @@ This module parses the Chinese Union Version Bible PDF and extracts:
 - Chapters (章)
 - Pericopes (段落單元)
 - Verses (經文節)
+
+Text extraction is the slow step, so pages can be extracted in parallel by a
+process pool (page ranges per task) and the result is cached per PDF
+SHA-256. Line handling stays sequential: page texts are fed to the stateful
+handlers in page order.
 """
 
+import hashlib
 import json
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -132,6 +141,65 @@ BIBLE_BOOKS = [
 BOOK_NAMES = {b["name_zh"] for b in BIBLE_BOOKS}
 BOOK_NAME_TO_INFO = {b["name_zh"]: b for b in BIBLE_BOOKS}
 
+# Extracted page texts, keyed by PDF SHA-256
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "pdf_text_cache"
+# Page-range tasks per worker, so slow ranges do not leave workers idle
+SHARDS_PER_WORKER = 4
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_page_range(pdf_path: str, start: int, end: int) -> list[str]:
+    """Extract text of pages [start, end) in a worker process."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [pdf.pages[i].extract_text() or "" for i in range(start, end)]
+
+
+def extract_page_texts(pdf_path: Path, workers: int = 1) -> list[str]:
+    """Extract the text of every page, in page order.
+
+    Args:
+        pdf_path: PDF file
+        workers: Worker processes (1 extracts in this process)
+
+    Returns:
+        One text per page ("" for pages without text)
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+        print(f"Total pages: {total_pages}")
+
+        if workers <= 1:
+            texts = []
+            for page_num, page in enumerate(pdf.pages, 1):
+                if page_num % 100 == 0:
+                    print(f"Extracting page {page_num}/{total_pages}...")
+                texts.append(page.extract_text() or "")
+            return texts
+
+    shard_size = max(1, -(-total_pages // (workers * SHARDS_PER_WORKER)))
+    ranges = [(i, min(i + shard_size, total_pages)) for i in range(0, total_pages, shard_size)]
+    print(f"Extracting with {workers} processes ({len(ranges)} page ranges)...")
+
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+
+    texts: list[str] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields results in submission order, i.e. page order
+        results = executor.map(extract_page_range, [str(pdf_path)] * len(ranges), starts, ends)
+        for start, end, page_texts in zip(starts, ends, results):
+            texts.extend(page_texts)
+            print(f"  Extracted pages {start + 1}-{end}")
+    return texts
+
 
 class BiblePDFParser:
     """Parser for Chinese Union Version Bible PDF."""
@@ -146,8 +214,22 @@ class BiblePDFParser:
     # Page header pattern to skip (e.g., "創世記1:1 1 創世記2:2")
     PAGE_HEADER_PATTERN = re.compile(r"^[\u4e00-\u9fff]+\d+:\d+")
 
-    def __init__(self, pdf_path: str | Path):
+    def __init__(
+        self,
+        pdf_path: str | Path,
+        workers: int | None = None,
+        cache_dir: str | Path | None = DEFAULT_CACHE_DIR,
+    ):
+        """Create a parser.
+
+        Args:
+            pdf_path: Bible PDF
+            workers: Extraction processes (default: CPU count; 1 disables the pool)
+            cache_dir: Extracted-text cache directory (None disables the cache)
+        """
         self.pdf_path = Path(pdf_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.books: list[ParsedBook] = []
         self.current_book: ParsedBook | None = None
         self.current_chapter: int = 0
@@ -158,15 +240,8 @@ class BiblePDFParser:
         """Parse the entire Bible PDF."""
         print(f"Opening PDF: {self.pdf_path}")
 
-        with pdfplumber.open(self.pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            print(f"Total pages: {total_pages}")
-
-            for page_num, page in enumerate(pdf.pages, 1):
-                if page_num % 100 == 0:
-                    print(f"Processing page {page_num}/{total_pages}...")
-
-                self._parse_page(page)
+        for text in self.extract_text():
+            self._parse_text(text)
 
         # Finalize last book
         self._finalize_current_book()
@@ -174,9 +249,33 @@ class BiblePDFParser:
         print(f"Parsed {len(self.books)} books")
         return self.books
 
-    def _parse_page(self, page: pdfplumber.page.Page) -> None:
-        """Parse a single page."""
-        text = page.extract_text()
+    def extract_text(self) -> list[str]:
+        """Page texts from the cache, or extracted (and cached) on a miss."""
+        cache_path = None
+        if self.cache_dir:
+            digest = file_sha256(self.pdf_path)
+            cache_path = self.cache_dir / f"{digest}.json"
+            if cache_path.exists():
+                with open(cache_path, encoding="utf-8") as f:
+                    texts = json.load(f)["pages"]
+                print(f"Loaded {len(texts)} extracted pages from {cache_path}")
+                return texts
+
+        start = time.perf_counter()
+        texts = extract_page_texts(self.pdf_path, self.workers)
+        print(f"Extracted {len(texts)} pages in {time.perf_counter() - start:.1f}s")
+
+        if cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"pdf": self.pdf_path.name, "pages": texts}, f, ensure_ascii=False)
+            tmp_path.replace(cache_path)
+
+        return texts
+
+    def _parse_text(self, text: str | None) -> None:
+        """Parse the extracted text of one page."""
         if not text:
             return
 
@@ -432,10 +531,24 @@ def main():
         default="bible_parsed.json",
         help="Output JSON file path",
     )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        help="Text extraction processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always extract text, ignoring the extracted-text cache",
+    )
     args = parser.parse_args()
 
     # Parse PDF
-    pdf_parser = BiblePDFParser(args.pdf_path)
+    pdf_parser = BiblePDFParser(
+        args.pdf_path,
+        workers=args.workers,
+        cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
+    )
     pdf_parser.parse()
 
     # Save to JSON
@@ -0,0 +1,220 @@
+"""Re-link existing entities and topics to the verses that mention them.
+
+Earlier runs of entity_extractor linked every extracted entity and topic to
+every verse of its pericope. This script rebuilds verse_entities and
+verse_topics with verse-level linking (see scripts.entity_linker): for each
+pericope, the entities currently linked to any of its verses are re-attached
+only to the verses whose text mentions them.
+
+Rebuild the Neo4j graph afterwards so the MENTIONS_* edges follow.
+
+Usage:
+    cd backend
+    python -m scripts.relink_entities --dry-run  # Report the edge reduction only
+    python -m scripts.relink_entities
+    python -m scripts.build_graph
+    python -m scripts.compute_topic_relations
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.models.orm import Entity, Topic, Verse, VerseEntity, VerseTopic
+from scripts.entity_linker import DEFAULT_ALIASES_PATH, TOPIC, EntityLinker, load_aliases
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Rows per executemany chunk
+INSERT_BATCH_SIZE = 5000
+
+
+async def relink(
+    session: AsyncSession,
+    linker: EntityLinker,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """Rebuild verse_entities and verse_topics with verse-level links.
+
+    Args:
+        session: Database session
+        linker: Entity linker
+        dry_run: Only compute the new links and report counts
+
+    Returns:
+        Statistics dict with link counts before and after
+    """
+    result = await session.execute(
+        select(Verse.id, Verse.pericope_id, Verse.text)
+        .where(Verse.pericope_id.isnot(None))
+        .order_by(Verse.pericope_id, Verse.chapter, Verse.verse)
+    )
+    verses_by_pericope: dict[int, list[tuple[int, str]]] = {}
+    pericope_of: dict[int, int] = {}
+    for row in result.all():
+        verses_by_pericope.setdefault(row.pericope_id, []).append((row.id, row.text))
+        pericope_of[row.id] = row.pericope_id
+    logger.info(f"Loaded {len(pericope_of)} verses in {len(verses_by_pericope)} pericopes")
+
+    # (name, type) -> (entity id, role) per pericope, from the current links
+    keys_by_pericope: dict[int, dict[tuple[str, str], tuple[int, str | float | None]]] = {}
+
+    result = await session.execute(
+        select(VerseEntity.verse_id, VerseEntity.role, Entity.id, Entity.name, Entity.type)
+        .join(Entity, VerseEntity.entity_id == Entity.id)
+    )
+    entity_rows = result.all()
+    for row in entity_rows:
+        pericope_id = pericope_of.get(row.verse_id)
+        if pericope_id is None:
+            continue
+        keys = keys_by_pericope.setdefault(pericope_id, {})
+        key = (row.name, row.type)
+        if key not in keys or (keys[key][1] is None and row.role):
+            keys[key] = (row.id, row.role)
+
+    result = await session.execute(
+        select(VerseTopic.verse_id, VerseTopic.weight, Topic.id, Topic.name)
+        .join(Topic, VerseTopic.topic_id == Topic.id)
+    )
+    topic_rows = result.all()
+    for row in topic_rows:
+        pericope_id = pericope_of.get(row.verse_id)
+        if pericope_id is None:
+            continue
+        keys = keys_by_pericope.setdefault(pericope_id, {})
+        key = (row.name, TOPIC)
+        if key not in keys or row.weight > keys[key][1]:
+            keys[key] = (row.id, row.weight)
+
+    start = time.perf_counter()
+    matcher = linker.matcher({key for keys in keys_by_pericope.values() for key in keys})
+    entity_links: list[dict] = []
+    topic_links: list[dict] = []
+    for pericope_id, keys in keys_by_pericope.items():
+        links = linker.link(verses_by_pericope[pericope_id], set(keys), matcher=matcher)
+        for key, verse_ids in links.items():
+            target_id, value = keys[key]
+            for verse_id in verse_ids:
+                if key[1] == TOPIC:
+                    topic_links.append({"verse_id": verse_id, "topic_id": target_id, "weight": value})
+                else:
+                    entity_links.append({"verse_id": verse_id, "entity_id": target_id, "role": value})
+    logger.info(f"Matched {len(keys_by_pericope)} pericopes in {time.perf_counter() - start:.1f}s")
+
+    stats = {
+        "verse_entities_before": sum(1 for row in entity_rows if row.verse_id in pericope_of),
+        "verse_entities_after": len(entity_links),
+        "verse_topics_before": sum(1 for row in topic_rows if row.verse_id in pericope_of),
+        "verse_topics_after": len(topic_links),
+    }
+    if dry_run:
+        return stats
+
+    in_pericope = select(Verse.id).where(Verse.pericope_id.isnot(None))
+    await session.execute(delete(VerseEntity).where(VerseEntity.verse_id.in_(in_pericope)))
+    await session.execute(delete(VerseTopic).where(VerseTopic.verse_id.in_(in_pericope)))
+    for i in range(0, len(entity_links), INSERT_BATCH_SIZE):
+        await session.execute(
+            insert(VerseEntity).on_conflict_do_nothing(),
+            entity_links[i:i + INSERT_BATCH_SIZE],
+        )
+    for i in range(0, len(topic_links), INSERT_BATCH_SIZE):
+        await session.execute(
+            insert(VerseTopic).on_conflict_do_nothing(),
+            topic_links[i:i + INSERT_BATCH_SIZE],
+        )
+    await session.commit()
+    return stats
+
+
+def print_report(stats: dict[str, int]) -> None:
+    """Print link counts before and after with the reduction."""
+    print("\nEntity Re-linking Statistics:")
+    for table in ("verse_entities", "verse_topics"):
+        before = stats[f"{table}_before"]
+        after = stats[f"{table}_after"]
+        reduction = (1 - after / before) * 100 if before else 0.0
+        print(f"  {table}: {before} -> {after} ({reduction:.1f}% fewer)")
+    print("  Neo4j MENTIONS_* edges follow verse_entities/verse_topics after build_graph")
+
+
+async def main(
+    aliases_path: Path = DEFAULT_ALIASES_PATH,
+    dry_run: bool = False,
+) -> None:
+    """Main entry point.
+
+    Args:
+        aliases_path: Alias file
+        dry_run: Only report the edge reduction
+    """
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,
+        pool_size=5,
+        max_overflow=10,
+    )
+
+    async_session = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    linker = EntityLinker(load_aliases(aliases_path))
+
+    async with async_session() as session:
+        stats = await relink(session, linker, dry_run=dry_run)
+        print_report(stats)
+        if dry_run:
+            print("  (dry run, nothing written)")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Re-link entities and topics to the verses that mention them"
+    )
+    parser.add_argument(
+        "--aliases",
+        type=Path,
+        default=DEFAULT_ALIASES_PATH,
+        help="Alias file (default: data/entity_aliases.json)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the edge reduction without writing",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    asyncio.run(main(
+        aliases_path=args.aliases,
+        dry_run=args.dry_run,
+    ))
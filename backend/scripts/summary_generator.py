@@ -6,7 +6,7 @@ It processes pericopes where summary IS NULL and updates the summary field.
 Usage:
     cd backend
     python -m scripts.summary_generator
-    python -m scripts.summary_generator --batch-size 5 --no-resume
+    python -m scripts.summary_generator --concurrency 8 --no-resume
     python -m scripts.summary_generator --limit 100  # Process only first 100 pericopes
 """
 
@@ -25,6 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 from app.models.orm import Book, Pericope, Verse
+from scripts.llm_batch_runner import JobItem, LLMBatchRunner
 
 logging.basicConfig(
     level=logging.INFO,
@@ -32,7 +33,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Checkpoint file
+# Legacy checkpoint file (imported into llm_jobs on first run)
 CHECKPOINT_FILE = Path("summary_generation_checkpoint.json")
 
 # Summary generation system prompt (Traditional Chinese)
@@ -49,13 +50,15 @@ SUMMARY_SYSTEM_PROMPT = """你是聖經摘要專家。請為給定的聖經段
 class SummaryGenerator:
     """Generate summaries for Bible pericopes using LLM."""
 
+    JOB = "summary"
+
     def __init__(
         self,
         session: AsyncSession,
-        batch_size: int = 10,
+        concurrency: int | None = None,
     ):
         self.session = session
-        self.batch_size = batch_size
+        self.runner = LLMBatchRunner(session, self.JOB, concurrency=concurrency)
         self.llm_client = None
 
     async def _init_llm(self):
@@ -72,23 +75,15 @@ class SummaryGenerator:
         """Generate summaries for all pericopes where summary IS NULL.
 
         Args:
-            resume: Whether to resume from checkpoint
+            resume: Whether to skip pericopes completed in earlier runs
             limit: Optional limit on number of pericopes to process
 
         Returns:
             Statistics dict with counts
         """
         await self._init_llm()
-
-        # Load checkpoint
-        processed_ids: set[int] = set()
-        if resume and CHECKPOINT_FILE.exists():
-            try:
-                checkpoint = json.loads(CHECKPOINT_FILE.read_text())
-                processed_ids = set(checkpoint.get("processed_ids", []))
-                logger.info(f"Resuming from checkpoint: {len(processed_ids)} already processed")
-            except json.JSONDecodeError:
-                logger.warning("Invalid checkpoint file, starting fresh")
+        if resume:
+            await self._migrate_checkpoint()
 
         # Get pericopes to process (where summary IS NULL)
         query = (
@@ -101,138 +96,143 @@ class SummaryGenerator:
 
         result = await self.session.execute(query)
         all_pericopes = result.scalars().all()
-        total = len(all_pericopes)
-
-        logger.info(f"Total pericopes without summary: {total}, already processed: {len(processed_ids)}")
+        logger.info(f"Total pericopes without summary: {len(all_pericopes)}")
+
+        items = await self._build_items(all_pericopes)
+        if resume:
+            await self._requeue_missing(items)
+        run_stats = await self.runner.run(
+            items,
+            call=self._generate_summary,
+            apply=self._store_summary,
+            resume=resume,
+        )
 
         stats = {
-            "total": total,
-            "processed": 0,
-            "skipped": 0,
-            "errors": 0,
+            "total": len(all_pericopes),
+            "processed": run_stats.processed,
+            "skipped": run_stats.skipped + len(all_pericopes) - len(items),
+            "errors": run_stats.errors,
         }
-
-        for i, pericope in enumerate(all_pericopes):
-            if pericope.id in processed_ids:
-                stats["skipped"] += 1
-                continue
-
-            try:
-                success = await self._process_pericope(pericope)
-                if success:
-                    processed_ids.add(pericope.id)
-                    stats["processed"] += 1
-                else:
-                    stats["errors"] += 1
-
-            except Exception as e:
-                logger.error(f"Error processing pericope {pericope.id}: {e}", exc_info=True)
-                stats["errors"] += 1
-                continue
-
-            # Commit and save checkpoint every batch
-            if (i + 1) % self.batch_size == 0:
-                await self.session.commit()
-                self._save_checkpoint(processed_ids)
-                logger.info(
-                    f"Progress: {i + 1}/{total} "
-                    f"(processed: {stats['processed']}, errors: {stats['errors']})"
-                )
-
-        # Final commit and checkpoint
-        await self.session.commit()
-        self._save_checkpoint(processed_ids)
-
         logger.info(f"Summary generation complete: {stats}")
         return stats
 
-    def _save_checkpoint(self, processed_ids: set[int]) -> None:
-        """Save checkpoint to file."""
-        CHECKPOINT_FILE.write_text(json.dumps({
-            "processed_ids": list(processed_ids),
-        }))
+    async def _requeue_missing(self, items: list[JobItem]) -> None:
+        """Forget completed items whose summary is no longer stored.
+
+        Summaries are committed with their job state, so a pericope without
+        one whose key is still done was re-created (e.g. by a rebuild that
+        re-assigned its id) and must be summarized again.
+        """
+        done = await self.runner.done_keys()
+        count = await self.runner.forget(item.key for item in items if item.key in done)
+        if count:
+            logger.info(f"Re-queued {count} completed pericopes without a summary")
+
+    async def _migrate_checkpoint(self) -> None:
+        """Import a legacy JSON checkpoint into llm_jobs."""
+        if not CHECKPOINT_FILE.exists():
+            return
+        try:
+            checkpoint = json.loads(CHECKPOINT_FILE.read_text())
+        except json.JSONDecodeError:
+            logger.warning("Invalid checkpoint file, ignoring")
+            return
+        count = await self.runner.mark_done(
+            str(pid) for pid in checkpoint.get("processed_ids", [])
+        )
+        CHECKPOINT_FILE.rename(CHECKPOINT_FILE.with_suffix(".json.migrated"))
+        logger.info(f"Migrated {count} pericopes from {CHECKPOINT_FILE}")
 
-    async def _process_pericope(self, pericope: Pericope) -> bool:
-        """Process a single pericope and generate summary.
+    async def _build_items(self, pericopes: list[Pericope]) -> list[JobItem]:
+        """Load the verses of all pericopes up front (the session is not shared by workers).
 
         Args:
-            pericope: Pericope to process
+            pericopes: Pericopes to summarize
 
         Returns:
-            True if successful, False otherwise
+            One job item per pericope that has verses
         """
-        # Get verses for this pericope
-        result = await self.session.execute(
-            select(Verse)
-            .where(Verse.pericope_id == pericope.id)
-            .order_by(Verse.chapter, Verse.verse)
-        )
-        verses = result.scalars().all()
-
-        if not verses:
-            logger.warning(f"No verses found for pericope {pericope.id}")
-            return False
-
-        # Get book name
-        book_result = await self.session.execute(
-            select(Book).where(Book.id == pericope.book_id)
-        )
-        book = book_result.scalar_one_or_none()
-        book_name = book.name_zh if book else "未知書卷"
+        books_result = await self.session.execute(select(Book.id, Book.name_zh))
+        book_names = {row.id: row.name_zh for row in books_result.all()}
+
+        verses_by_pericope: dict[int, list[Verse]] = {}
+        ids = [p.id for p in pericopes]
+        for i in range(0, len(ids), 1000):
+            result = await self.session.execute(
+                select(Verse)
+                .where(Verse.pericope_id.in_(ids[i:i + 1000]))
+                .order_by(Verse.chapter, Verse.verse)
+            )
+            for v in result.scalars().all():
+                verses_by_pericope.setdefault(v.pericope_id, []).append(v)
+
+        items = []
+        for pericope in pericopes:
+            verses = verses_by_pericope.get(pericope.id)
+            if not verses:
+                logger.warning(f"No verses found for pericope {pericope.id}")
+                continue
 
-        # Build context for LLM
-        verse_texts = "\n".join(
-            f"{v.chapter}:{v.verse} {v.text}"
-            for v in verses
-        )
+            # Build context for LLM
+            verse_texts = "\n".join(
+                f"{v.chapter}:{v.verse} {v.text}"
+                for v in verses
+            )
 
-        # Create user prompt
-        user_prompt = f"""請為以下聖經段落生成摘要：
-書卷：{book_name}
+            # Create user prompt
+            user_prompt = f"""請為以下聖經段落生成摘要：
+書卷：{book_names.get(pericope.book_id, "未知書卷")}
 標題：{pericope.title}
 經文：
 {verse_texts}"""
+            items.append(JobItem(key=str(pericope.id), payload=user_prompt))
 
-        # Call LLM for summary generation
-        try:
-            summary = await self.llm_client.generate(
-                prompt=user_prompt,
-                system_prompt=SUMMARY_SYSTEM_PROMPT,
-                temperature=0.3,
-                max_tokens=256,
-            )
-        except Exception as e:
-            logger.error(f"LLM call failed for pericope {pericope.id}: {e}")
-            return False
+        return items
+
+    async def _generate_summary(self, item: JobItem) -> str:
+        """Call the LLM for one pericope.
+
+        Args:
+            item: Job item whose payload is the user prompt
+
+        Returns:
+            Cleaned summary text
+        """
+        summary = await self.llm_client.generate(
+            prompt=item.payload,
+            system_prompt=SUMMARY_SYSTEM_PROMPT,
+            temperature=0.3,
+            max_tokens=256,
+        )
 
         # Clean up summary (remove extra whitespace, newlines)
         summary = summary.strip()
         if not summary:
-            logger.warning(f"Empty summary generated for pericope {pericope.id}")
-            return False
+            raise ValueError("empty summary")
+        return summary
 
-        # Update pericope summary
-        await self.session.execute(
+    async def _store_summary(self, session: AsyncSession, item: JobItem, summary: str) -> None:
+        """Update pericope summary."""
+        await session.execute(
             update(Pericope)
-            .where(Pericope.id == pericope.id)
+            .where(Pericope.id == int(item.key))
             .values(summary=summary)
         )
-
-        logger.debug(f"Generated summary for pericope {pericope.id}: {summary[:100]}...")
-        return True
+        logger.debug(f"Generated summary for pericope {item.key}: {summary[:100]}...")
 
 
 async def main(
     resume: bool = True,
-    batch_size: int = 10,
+    concurrency: int | None = None,
     limit: int | None = None,
     verbose: bool = False,
 ) -> None:
     """Main entry point.
 
     Args:
-        resume: Whether to resume from checkpoint
-        batch_size: Number of pericopes per batch
+        resume: Whether to skip pericopes completed in earlier runs
+        concurrency: Concurrent LLM calls (default: LLM_BATCH_CONCURRENCY)
         limit: Optional limit on pericopes to process
         verbose: Enable verbose logging
     """
@@ -254,7 +254,7 @@ async def main(
     )
 
     async with async_session() as session:
-        generator = SummaryGenerator(session, batch_size=batch_size)
+        generator = SummaryGenerator(session, concurrency=concurrency)
         stats = await generator.generate_all(resume=resume, limit=limit)
         print(f"\nSummary Generation Statistics:")
         print(f"  Total pericopes without summary: {stats['total']}")
@@ -272,13 +272,13 @@ if __name__ == "__main__":
     parser.add_argument(
         "--no-resume",
         action="store_true",
-        help="Start fresh, ignore checkpoint",
+        help="Start fresh, forget completed pericopes",
     )
     parser.add_argument(
-        "--batch-size",
+        "--concurrency",
         type=int,
-        default=10,
-        help="Number of pericopes per batch (default: 10)",
+        default=None,
+        help=f"Concurrent LLM calls (default: {settings.LLM_BATCH_CONCURRENCY})",
     )
     parser.add_argument(
         "--limit",
@@ -296,7 +296,7 @@ if __name__ == "__main__":
 
     asyncio.run(main(
         resume=not args.no_resume,
-        batch_size=args.batch_size,
+        concurrency=args.concurrency,
         limit=args.limit,
         verbose=args.verbose,
     ))
@@ -0,0 +1,99 @@
+"""Tests for verse-level entity linking."""
+
+import json
+
+import pytest
+
+from scripts.entity_linker import MIN_ALIAS_LENGTH, AhoCorasick, EntityLinker, load_aliases
+
+MOSES = ("摩西", "PERSON")
+AARON = ("亞倫", "PERSON")
+ABRAHAM = ("亞伯拉罕", "PERSON")
+FAITH = ("信心", "TOPIC")
+
+
+def test_find_single_pattern():
+    matcher = AhoCorasick({"摩西": {"m"}})
+    assert matcher.find("耶和華對摩西說") == {"m"}
+    assert matcher.find("耶和華說") == set()
+
+
+def test_find_overlapping_patterns():
+    matcher = AhoCorasick({"he": {"he"}, "she": {"she"}, "his": {"his"}, "hers": {"hers"}})
+    assert matcher.find("ushers") == {"he", "she", "hers"}
+
+
+def test_find_pattern_inside_another():
+    matcher = AhoCorasick({"以色列": {"nation"}, "以色列人": {"people"}})
+    assert matcher.find("以色列人出了埃及") == {"nation", "people"}
+    assert matcher.find("以色列家") == {"nation"}
+
+
+def test_find_after_failed_partial_match():
+    matcher = AhoCorasick({"亞伯拉罕": {"a"}, "伯拉": {"b"}})
+    assert matcher.find("亞伯伯拉罕") == {"b"}
+
+
+def test_find_merges_labels_of_shared_pattern():
+    matcher = AhoCorasick({"基督": {"x", "y"}})
+    assert matcher.find("基督") == {"x", "y"}
+
+
+def test_find_ignores_empty_pattern():
+    matcher = AhoCorasick({"": {"empty"}, "愛": {"love"}})
+    assert matcher.find("神愛世人") == {"love"}
+
+
+@pytest.fixture
+def verses() -> list[tuple[int, str]]:
+    return [
+        (1, "耶和華曉諭摩西說"),
+        (2, "你要吩咐亞倫和他的兒子"),
+        (3, "摩西和亞倫就照樣行了"),
+    ]
+
+
+def test_link_to_mentioning_verses(verses):
+    links = EntityLinker().link(verses, {MOSES, AARON})
+    assert links == {MOSES: [1, 3], AARON: [2, 3]}
+
+
+def test_link_alias():
+    linker = EntityLinker({ABRAHAM: ["亞伯蘭"]})
+    links = linker.link([(1, "亞伯蘭住在迦南地"), (2, "亞伯拉罕又遷到南地")], {ABRAHAM})
+    assert links == {ABRAHAM: [1, 2]}
+
+
+def test_link_unmentioned_key_falls_back_to_first_verse(verses):
+    links = EntityLinker().link(verses, {MOSES, FAITH})
+    assert links == {MOSES: [1, 3], FAITH: [1]}
+
+
+def test_link_ignores_keys_outside_the_pericope(verses):
+    linker = EntityLinker()
+    matcher = linker.matcher({MOSES, AARON})
+    assert linker.link(verses, {AARON}, matcher) == {AARON: [2, 3]}
+
+
+def test_link_empty_input(verses):
+    linker = EntityLinker()
+    assert linker.link([], {MOSES}) == {}
+    assert linker.link(verses, set()) == {}
+
+
+def test_load_aliases_drops_single_character_aliases(tmp_path):
+    path = tmp_path / "aliases.json"
+    path.write_text(
+        json.dumps({"version": "1.0", "TOPIC": {"信心": ["信", "信靠"]}}),
+        encoding="utf-8",
+    )
+    assert load_aliases(path) == {FAITH: ["信靠"]}
+
+
+def test_load_aliases_missing_file(tmp_path):
+    assert load_aliases(tmp_path / "missing.json") == {}
+
+
+def test_shipped_aliases_are_specific():
+    for (name, _), aliases in load_aliases().items():
+        assert all(len(alias) >= MIN_ALIAS_LENGTH for alias in aliases), name
@@ -0,0 +1,94 @@
+"""Tests for the explicit verse reference parser."""
+
+import pytest
+
+from app.services.reference_parser import MAX_VERSE, ReferenceParser
+
+BOOKS = [
+    (1, "創世記", "創"),
+    (6, "約書亞記", "書"),
+    (19, "詩篇", "詩"),
+    (40, "馬太福音", "太"),
+    (43, "約翰福音", "約"),
+    (45, "羅馬書", "羅"),
+    (58, "希伯來書", "來"),
+    (62, "約翰一書", "約一"),
+    (63, "約翰二書", "約二"),
+    (64, "約翰三書", "約三"),
+]
+
+
+@pytest.fixture(scope="module")
+def parser() -> ReferenceParser:
+    return ReferenceParser(BOOKS)
+
+
+def _spans(parser: ReferenceParser, query: str) -> list[tuple]:
+    return [
+        (r.book_id, r.chapter_start, r.verse_start, r.chapter_end, r.verse_end)
+        for r in parser.parse(query)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("約翰福音 3:16", (43, 3, 16, 3, 16)),
+        ("約3:16-18", (43, 3, 16, 3, 18)),
+        ("創1:26-2:3", (1, 1, 26, 2, 3)),
+        ("詩篇23篇", (19, 23, 1, 23, MAX_VERSE)),
+        ("馬太福音第5章3節", (40, 5, 3, 5, 3)),
+        ("馬太福音5章3-12節", (40, 5, 3, 5, 12)),
+        ("約翰福音3", (43, 3, 1, 3, MAX_VERSE)),
+        ("約３：１６", (43, 3, 16, 3, 16)),
+        ("羅馬8:28", (45, 8, 28, 8, 28)),
+        ("書1:9", (6, 1, 9, 1, 9)),
+    ],
+)
+def test_parse_forms(parser, query, expected):
+    assert _spans(parser, query) == [expected]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("約翰一書1:9", (62, 1, 9, 1, 9)),
+        ("約翰壹書1:9", (62, 1, 9, 1, 9)),
+        ("約壹1:9", (62, 1, 9, 1, 9)),
+        ("約翰貳書1:1", (63, 1, 1, 1, 1)),
+        ("約參1:2", (64, 1, 2, 1, 2)),
+    ],
+)
+def test_numeral_variants(parser, query, expected):
+    assert _spans(parser, query) == [expected]
+
+
+def test_book_name_without_locator_matches_nothing(parser):
+    assert parser.parse("約翰貳書") == []
+
+
+def test_bare_chapter_requires_full_name(parser):
+    assert parser.parse("來3次") == []
+
+
+def test_multiple_references(parser):
+    assert _spans(parser, "約3:16和羅8:28") == [
+        (43, 3, 16, 3, 16),
+        (45, 8, 28, 8, 28),
+    ]
+
+
+def test_invalid_range(parser):
+    assert parser.parse("約3:18-16") == []
+
+
+def test_residual(parser):
+    query = "請給我約3:16的經文"
+    assert parser.residual(query, parser.parse(query)) == ""
+    query = "約3:16是什麼意思"
+    assert parser.residual(query, parser.parse(query)) == "意思"
+
+
+def test_label(parser):
+    labels = [r.label for r in parser.parse("約3:16 約3:16-18 創1:26-2:3 詩篇23篇")]
+    assert labels == ["約翰福音 3:16", "約翰福音 3:16-18", "創世記 1:26-2:3", "詩篇 23"]
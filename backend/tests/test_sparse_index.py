@@ -0,0 +1,69 @@
+"""Tests for the in-memory bigram BM25 index."""
+
+import pytest
+
+from app.services.sparse_index import BM25Index, tokenize
+
+
+def test_tokenize_cjk_bigrams():
+    assert tokenize("神愛世人") == ["神愛", "愛世", "世人"]
+
+
+def test_tokenize_unigrams():
+    assert tokenize("神愛世人", unigrams=True) == [
+        "神愛", "愛世", "世人", "神", "愛", "世", "人",
+    ]
+
+
+def test_tokenize_single_character_run():
+    assert tokenize("愛") == ["愛"]
+    assert tokenize("愛，是恆久忍耐") == ["愛", "是恆", "恆久", "久忍", "忍耐"]
+
+
+def test_tokenize_latin_and_digits():
+    assert tokenize("John 3:16 說") == ["john", "3", "16", "說"]
+
+
+def test_tokenize_normalizes_full_width():
+    assert tokenize("ＡＢＣ１２３") == ["abc123"]
+
+
+@pytest.fixture(scope="module")
+def index() -> BM25Index:
+    texts = [
+        "起初，神創造天地。",
+        "地是空虛混沌，淵面黑暗；神的靈運行在水面上。",
+        "神愛世人，甚至將他的獨生子賜給他們。",
+        "愛是恆久忍耐，又有恩慈。",
+        "未歸入段落的經文提到愛。",
+    ]
+    return BM25Index(texts, [10, 10, 20, 30, None])
+
+
+def test_search_ranks_matching_pericope_first(index):
+    hits = index.search("神愛世人", top_k=3)
+    assert hits[0][0] == 20
+    assert all(0.0 < score <= 1.0 for _, score in hits)
+
+
+def test_search_single_character_query(index):
+    pericopes = {pericope_id for pericope_id, _ in index.search("愛", top_k=10)}
+    assert pericopes == {20, 30}
+
+
+def test_search_aggregates_verses_to_pericopes(index):
+    hits = index.search("神", top_k=10)
+    assert [pericope_id for pericope_id, _ in hits].count(10) == 1
+
+
+def test_search_skips_unlinked_verses(index):
+    assert index.search("段落", top_k=5) == []
+
+
+def test_search_no_match(index):
+    assert index.search("耶路撒冷", top_k=5) == []
+    assert index.search("神", top_k=0) == []
+
+
+def test_search_respects_top_k(index):
+    assert len(index.search("神愛", top_k=1)) == 1